@@ -1,10 +1,14 @@
-﻿from dotenv import load_dotenv
+﻿import time
+
+from dotenv import load_dotenv
 import streamlit as st
 
 from components.layout_shell import render_footer, render_header
 from components.styles_shell import load_base_css
 from core.navigation_shell import PageDefinition, render_navigation
+from core.profiling import get_profiling_mode, profile_span, profiling_run, render_profiling_panel
 from core.session import NAVIGATION_KEY, reset_app_state
+from services.metrics import PAGE_RENDER_DURATION, start_metrics_server
 from views.buscador_clientes import render as render_buscador_clientes
 from views.decisiones_estrategicas import render as render_decisiones_estrategicas
 from views.informacion_general import render as render_informacion_general
@@ -50,6 +54,7 @@ def build_pages() -> list[PageDefinition]:
 
 
 def main() -> None:
+    start_metrics_server()
     load_base_css()
     pages = build_pages()
 
@@ -63,8 +68,14 @@ def main() -> None:
 
     st.markdown('<div class="app-shell-content-divider"></div>', unsafe_allow_html=True)
 
-    with st.container():
-        active_page.render()
+    with profiling_run(get_profiling_mode()) as profiling:
+        with st.container():
+            render_started = time.perf_counter()
+            with profile_span(active_page.page_id, "page"):
+                active_page.render()
+            PAGE_RENDER_DURATION.observe(time.perf_counter() - render_started, active_page.page_id)
+
+    render_profiling_panel(profiling)
 
     render_footer()
 
@@ -0,0 +1,330 @@
+import argparse
+import json
+import re
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import ModuleType
+
+from repositories import client_search_queries, dashboard_queries, strategic_decisions_queries
+from repositories.sql_query import SqlQuery
+
+
+BUILDER_MODULES: tuple[ModuleType, ...] = (
+    dashboard_queries,
+    client_search_queries,
+    strategic_decisions_queries,
+)
+CLAUSE_BUILDERS = ("build_in_clause", "build_filters_where")
+
+MAX_SQL_BYTES = 16_384
+MAX_GROWTH = 8.0
+MAX_BUILD_MS = 5.0
+MAX_JOINS = 12
+
+LOCALIDADES = ("Pereira", "Dosquebradas", "Armenia", "Calarcá", "Manizales", "Chinchiná", "Cartago", "La Tebaida")
+VARIABLE_COLUMNS = (
+    "ganancia_total",
+    "edad_cliente",
+    "valor_promedio_factura",
+    "numero_contratos",
+    "fechas_proximas_rtr",
+    "consumo_promedio_m3",
+    "meses_mora",
+    "saldo_cartera",
+)
+
+_JOIN_PATTERN = re.compile(r"\bJOIN\b", re.IGNORECASE)
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+
+
+@dataclass(frozen=True)
+class BuilderCase:
+    builder: str
+    variant: str
+    kwargs: dict[str, object] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BuilderMeasurement:
+    builder: str
+    variant: str
+    sql_bytes: int
+    build_ms: float
+    joins: int
+    literals: int
+    params: int = 0
+
+
+def discover_builders() -> dict[str, Callable[..., SqlQuery]]:
+    builders: dict[str, Callable[..., SqlQuery]] = {}
+    for module in BUILDER_MODULES:
+        module_name = module.__name__.rsplit(".", 1)[-1]
+        for name, value in vars(module).items():
+            if not callable(value) or getattr(value, "__module__", None) != module.__name__:
+                continue
+            if name.endswith("_query") and not name.startswith("_") or name in CLAUSE_BUILDERS:
+                builders[f"{module_name}.{name}"] = value
+    return builders
+
+
+def sample_barrios(count: int) -> list[str]:
+    return [f"Barrio {index // len(LOCALIDADES) + 1:03d} - {LOCALIDADES[index % len(LOCALIDADES)]}" for index in range(count)]
+
+
+def compact_barrios(values: list[str]) -> dashboard_queries.KeyedSelection:
+    key_lookup = {value: (index + 1,) for index, value in enumerate(values)}
+    return dashboard_queries.compact_filter_values("barrio", values, key_lookup, threshold=0)
+
+
+def _filter_variants(barrios: int) -> dict[str, dict[str, object]]:
+    large_filters = {
+        "categoria": "Residencial",
+        "mercados": ["RISARALDA", "QUINDIO", "CALDAS", "OCCIDENTE"],
+        "departamentos": ["RISARALDA", "QUINDIO", "CALDAS", "VALLE DEL CAUCA"],
+        "localidades": list(LOCALIDADES),
+        "barrios": sample_barrios(barrios),
+    }
+    return {
+        "base": {"categoria": "Residencial"},
+        f"barrios_{barrios}": large_filters,
+        f"barrios_{barrios}_compacto": {**large_filters, "barrios": compact_barrios(large_filters["barrios"])},
+    }
+
+
+def _all_services(categoria: str) -> list[str]:
+    return strategic_decisions_queries.get_service_options(categoria)
+
+
+def build_cases(barrios: int = 2000, contracts: int = 500) -> list[BuilderCase]:
+    cases: list[BuilderCase] = []
+    filter_variants = _filter_variants(barrios)
+    large_variant = f"barrios_{barrios}"
+    large_filters = filter_variants[large_variant]
+
+    cases.append(BuilderCase("dashboard_queries.build_in_clause", "base", {"column": "barrio", "values": ["Centro"]}))
+    cases.append(
+        BuilderCase("dashboard_queries.build_in_clause", large_variant, {"column": "barrio", "values": large_filters["barrios"]})
+    )
+    cases.append(
+        BuilderCase(
+            "dashboard_queries.build_in_clause",
+            f"{large_variant}_compacto",
+            {"column": "barrio", "values": filter_variants[f"{large_variant}_compacto"]["barrios"]},
+        )
+    )
+    for variant, kwargs in filter_variants.items():
+        where_kwargs = {key: value for key, value in kwargs.items() if key != "categoria"}
+        cases.append(BuilderCase("dashboard_queries.build_filters_where", variant, where_kwargs))
+
+    cases.append(BuilderCase("dashboard_queries.get_filter_options_query", "base"))
+    cases.append(BuilderCase("dashboard_queries.get_ubicacion_keys_query", "base"))
+    for name in (
+        "get_kpis_query",
+        "get_penetracion_servicios_query",
+        "get_numero_servicios_query",
+        "get_combinaciones_servicios_query",
+        "get_clientes_mayor_aporte_query",
+        "get_clasificacion_integral_query",
+        "get_clasificacion_integral_distribution_query",
+        "get_clasificacion_integral_temporal_query",
+        "get_consolidado_general_query",
+    ):
+        for variant, kwargs in filter_variants.items():
+            cases.append(BuilderCase(f"dashboard_queries.{name}", variant, kwargs))
+    for variant, kwargs in filter_variants.items():
+        cases.append(
+            BuilderCase(
+                "dashboard_queries.get_detalle_servicio_query",
+                variant,
+                {"servicio": "rtr", "tipo_detalle": "variables", **kwargs, "limit": 100},
+            )
+        )
+        for name in ("get_service_classification_query", "get_service_classification_profile_query"):
+            cases.append(BuilderCase(f"dashboard_queries.{name}", variant, {"servicio": "brilla", **kwargs}))
+
+    cliente = {"tipo_identificacion": "CC", "identificacion": "1000330"}
+    cases.extend(
+        [
+            BuilderCase("client_search_queries.get_tipo_identificacion_options_query", "base"),
+            BuilderCase("client_search_queries.get_cliente_raw_query", "base", cliente),
+            BuilderCase("client_search_queries.get_cliente_contratos_raw_query", "base", {**cliente, "universo": "Residencial"}),
+            BuilderCase(
+                "client_search_queries.get_cliente_contratos_summary_query",
+                "base",
+                {**cliente, "universo": "Residencial"},
+            ),
+            BuilderCase("client_search_queries.get_cliente_dimensiones_query", "base", {**cliente, "universo": "Residencial"}),
+            BuilderCase(
+                "client_search_queries.get_cliente_detalle_servicio_query",
+                "base",
+                {**cliente, "universo": "Residencial", "servicio": "rtr", "tipo_detalle": "variables"},
+            ),
+            BuilderCase(
+                "client_search_queries.get_contratos_detalle_query",
+                "base",
+                {"contracts": ["20001320"], "universo": "Residencial"},
+            ),
+            BuilderCase(
+                "client_search_queries.get_contratos_detalle_query",
+                f"contratos_{contracts}",
+                {"contracts": [str(20000000 + index) for index in range(contracts)], "universo": "Residencial"},
+            ),
+            BuilderCase(
+                "strategic_decisions_queries.get_table_columns_query",
+                "base",
+                {"full_name": "analiticaefg.clienteintegral.rtr_residencial_consolidado_variables"},
+            ),
+        ]
+    )
+
+    services = _all_services("Residencial")
+    all_columns = {service: VARIABLE_COLUMNS for service in services}
+    cases.extend(
+        [
+            BuilderCase(
+                "strategic_decisions_queries.get_consolidar_query",
+                "base",
+                {"categoria": "Residencial", "servicios": ["Consumo"], "top_n": 100},
+            ),
+            BuilderCase(
+                "strategic_decisions_queries.get_consolidar_query",
+                "todos_servicios",
+                {"categoria": "Residencial", "servicios": services, "top_n": 10000, "variable_columns_by_service": all_columns},
+            ),
+            BuilderCase(
+                "strategic_decisions_queries.get_potenciar_query",
+                "base",
+                {"categoria": "Residencial", "servicios": ["Consumo"], "top_n": 100},
+            ),
+            BuilderCase(
+                "strategic_decisions_queries.get_potenciar_query",
+                "todos_servicios",
+                {"categoria": "Residencial", "servicios": services, "top_n": 10000, "variable_columns_by_service": all_columns},
+            ),
+            BuilderCase(
+                "strategic_decisions_queries.get_recuperar_query",
+                "base",
+                {"categoria": "Residencial", "servicio": "Brilla", "top_n": 100},
+            ),
+            BuilderCase(
+                "strategic_decisions_queries.get_recuperar_query",
+                "todas_variables",
+                {"categoria": "Residencial", "servicio": "Brilla", "top_n": 10000, "variable_columns": VARIABLE_COLUMNS},
+            ),
+            BuilderCase(
+                "strategic_decisions_queries.get_fidelizar_query",
+                "base",
+                {"categoria": "Residencial", "servicio_ancla": "Consumo", "servicio_objetivo": "Brilla", "top_n": 100},
+            ),
+            BuilderCase(
+                "strategic_decisions_queries.get_fidelizar_query",
+                "todas_variables",
+                {
+                    "categoria": "Residencial",
+                    "servicio_ancla": "Consumo",
+                    "servicio_objetivo": "Brilla",
+                    "top_n": 10000,
+                    "variable_columns_ancla": VARIABLE_COLUMNS,
+                    "variable_columns_objetivo": VARIABLE_COLUMNS,
+                },
+            ),
+        ]
+    )
+    return cases
+
+
+def measure_case(case: BuilderCase, builder: Callable[..., SqlQuery], repeat: int = 50) -> BuilderMeasurement:
+    timings: list[float] = []
+    query = SqlQuery("", {})
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query = builder(**case.kwargs)
+        timings.append((time.perf_counter() - started) * 1000)
+    sql = query.sql
+
+    return BuilderMeasurement(
+        builder=case.builder,
+        variant=case.variant,
+        sql_bytes=len(sql.encode("utf-8")),
+        build_ms=round(min(timings), 4),
+        joins=len(_JOIN_PATTERN.findall(sql)),
+        literals=len(_STRING_LITERAL_PATTERN.findall(sql)),
+        params=len(query.params),
+    )
+
+
+def run_builder_benchmarks(
+    barrios: int = 2000,
+    contracts: int = 500,
+    repeat: int = 50,
+) -> list[BuilderMeasurement]:
+    builders = discover_builders()
+    return [measure_case(case, builders[case.builder], repeat) for case in build_cases(barrios, contracts)]
+
+
+def find_uncovered_builders(cases: list[BuilderCase]) -> list[str]:
+    covered = {case.builder for case in cases}
+    return sorted(set(discover_builders()) - covered)
+
+
+def check_thresholds(measurements: list[BuilderMeasurement], max_build_ms: float = MAX_BUILD_MS) -> list[str]:
+    violations: list[str] = []
+    base_bytes = {item.builder: item.sql_bytes for item in measurements if item.variant == "base"}
+
+    for item in measurements:
+        label = f"{item.builder}[{item.variant}]"
+        if item.sql_bytes > MAX_SQL_BYTES:
+            violations.append(f"{label}: {item.sql_bytes:,} bytes de SQL (máximo {MAX_SQL_BYTES:,})")
+        if item.build_ms > max_build_ms:
+            violations.append(f"{label}: {item.build_ms:.2f} ms de construcción (máximo {max_build_ms})")
+        if item.joins > MAX_JOINS:
+            violations.append(f"{label}: {item.joins} JOIN (máximo {MAX_JOINS})")
+        base = base_bytes.get(item.builder)
+        if item.builder.rsplit(".", 1)[-1] in CLAUSE_BUILDERS:
+            continue
+        if item.variant != "base" and base and item.sql_bytes / base > MAX_GROWTH:
+            violations.append(f"{label}: crece {item.sql_bytes / base:.1f}x frente al caso base (máximo {MAX_GROWTH}x)")
+    return violations
+
+
+def _format_table(measurements: list[BuilderMeasurement]) -> str:
+    header = f"{'builder':<70} {'variante':<16} {'bytes':>9} {'ms':>8} {'joins':>5} {'literales':>9} {'params':>6}"
+    rows = [
+        f"{item.builder:<70} {item.variant:<16} {item.sql_bytes:>9,} {item.build_ms:>8.3f} {item.joins:>5} "
+        f"{item.literals:>9} {item.params:>6}"
+        for item in measurements
+    ]
+    return "\n".join([header, *rows])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Microbenchmarks de los constructores de SQL.")
+    parser.add_argument("--barrios", type=int, default=2000)
+    parser.add_argument("--contracts", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    measurements = run_builder_benchmarks(args.barrios, args.contracts, args.repeat)
+    print(_format_table(measurements))
+
+    uncovered = find_uncovered_builders(build_cases(args.barrios, args.contracts))
+    violations = check_thresholds(measurements)
+    for builder in uncovered:
+        print(f"SIN CASO: {builder}")
+    for violation in violations:
+        print(f"UMBRAL: {violation}")
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps([asdict(item) for item in measurements], ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+    if uncovered or violations:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import argparse
+import json
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.harness import (
+    QueryCounter,
+    ScenarioResult,
+    build_report,
+    compare_reports,
+    measure_rerun,
+    use_fake_warehouse,
+    write_report,
+)
+
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / "app.py")
+PAGE_IDS = ("informacion_general", "valoracion_integral", "buscador_clientes", "decisiones_estrategicas")
+TOP_N_VALUES = (100, 1000, 10000)
+FILTER_SCENARIOS = (
+    {"Categoría": "Residencial"},
+    {"Categoría": "Comercial"},
+    {"Categoría": "Residencial", "Mercados": ["RISARALDA"]},
+    {"Categoría": "Residencial", "Mercados": ["CALDAS", "QUINDIO"], "Departamentos": ["CALDAS"]},
+    {"Categoría": "Comercial", "Departamentos": ["RISARALDA"], "Localidades": ["Pereira", "Dosquebradas"]},
+)
+STRATEGY_TAB_KEY = "decisiones_estrategia_tab"
+STRATEGIES = (
+    ("consolidar", "decisiones_con", {"decisiones_con_servicios": ["Consumo", "RTR"]}),
+    ("recuperar", "decisiones_rec", {"decisiones_rec_servicio": "Brilla"}),
+    ("fidelizar", "decisiones_fid", {"decisiones_fid_ancla": "Consumo", "decisiones_fid_objetivo": "Brilla"}),
+    ("potenciar", "decisiones_pot", {"decisiones_pot_servicios": ["Brilla", "Seguros"]}),
+)
+
+
+def _new_app(timeout: float) -> AppTest:
+    return AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+
+def _widget_by_label(collection, label: str):
+    for widget in collection:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No se encontró el control '{label}'.")
+
+
+def _navigate(app: AppTest, page_id: str) -> Callable[[], object]:
+    return lambda: app.button(key=f"btn_nav_{page_id}").click().run()
+
+
+def _apply_filters(app: AppTest, values: dict[str, object]) -> Callable[[], object]:
+    def action() -> object:
+        for label, value in values.items():
+            if isinstance(value, list):
+                _widget_by_label(app.multiselect, label).set_value(value)
+            else:
+                _widget_by_label(app.selectbox, label).set_value(value)
+        return _widget_by_label(app.button, "Aplicar filtros").click().run()
+
+    return action
+
+
+def _search_customer(app: AppTest, universo: str, tipo: str, identificacion: str) -> Callable[[], object]:
+    def action() -> object:
+        _widget_by_label(app.selectbox, "Universo").set_value(universo)
+        _widget_by_label(app.selectbox, "Tipo de identificación").set_value(tipo)
+        _widget_by_label(app.text_input, "Número de identificación").set_value(identificacion)
+        return _widget_by_label(app.button, "Buscar").click().run()
+
+    return action
+
+
+def _open_strategy(app: AppTest, strategy: str) -> Callable[[], object]:
+    return lambda: app.radio(key=STRATEGY_TAB_KEY).set_value(strategy).run()
+
+
+def _run_strategy(app: AppTest, prefix: str, values: dict[str, object], top_n: int) -> Callable[[], object]:
+    def action() -> object:
+        for key, value in values.items():
+            if isinstance(value, list):
+                app.multiselect(key=key).set_value(value)
+            else:
+                app.selectbox(key=key).set_value(value)
+        app.number_input(key=f"{prefix}_top_n").set_value(top_n)
+        return app.button(key=f"{prefix}_btn").click().run()
+
+    return action
+
+
+def _prepare_full_download(app: AppTest) -> Callable[[], object]:
+    return lambda: _widget_by_label(app.button, "Preparar descarga completa").click().run()
+
+
+def _sample_customers(limit: int) -> list[tuple[str, str, str]]:
+    from services.fake_warehouse import get_fake_connection
+
+    connection = get_fake_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(
+            f"""
+            SELECT 'Residencial', TipoIdentificacion, Identificacion
+            FROM analiticaefg.clienteintegral.dimensiones_residencial
+            WHERE rtr = 1
+            ORDER BY hash(Identificacion)
+            LIMIT {limit}
+            """
+        )
+        return [tuple(row) for row in cursor.fetchall()]
+    finally:
+        connection.close()
+
+
+def run_scenarios(iterations: int, timeout: float, warm: bool, customers: int) -> list[ScenarioResult]:
+    counter = QueryCounter()
+    results: list[ScenarioResult] = []
+
+    def run_steps(name: str, steps: Callable[[AppTest], list[tuple[str, Callable[[], object]]]]) -> None:
+        scenario = ScenarioResult(name=name)
+        for iteration in range(iterations):
+            if not warm:
+                st.cache_data.clear()
+            app = _new_app(timeout)
+            measure_rerun(counter, scenario, "arranque", iteration, app.run, lambda: len(app.exception))
+            for step, action in steps(app):
+                measure_rerun(counter, scenario, step, iteration, action, lambda: len(app.exception))
+        results.append(scenario)
+        logging.info("%s: %s", name, json.dumps(scenario.summary(), ensure_ascii=False))
+
+    run_steps(
+        "navegacion",
+        lambda app: [(page_id, _navigate(app, page_id)) for page_id in (*PAGE_IDS[1:], PAGE_IDS[0])],
+    )
+    run_steps(
+        "valoracion_filtros",
+        lambda app: [("abrir", _navigate(app, "valoracion_integral"))]
+        + [(f"filtro_{index}", _apply_filters(app, values)) for index, values in enumerate(FILTER_SCENARIOS)],
+    )
+
+    sampled = _sample_customers(customers)
+    run_steps(
+        "buscador",
+        lambda app: [("abrir", _navigate(app, "buscador_clientes"))]
+        + [(f"cliente_{index}", _search_customer(app, *customer)) for index, customer in enumerate(sampled)],
+    )
+
+    for strategy, prefix, values in STRATEGIES:
+        run_steps(
+            f"decisiones_{strategy}",
+            lambda app, strategy=strategy, prefix=prefix, values=values: [
+                ("abrir", _navigate(app, "decisiones_estrategicas")),
+                ("estrategia", _open_strategy(app, strategy)),
+            ]
+            + [(f"top_{top_n}", _run_strategy(app, prefix, values, top_n)) for top_n in TOP_N_VALUES],
+        )
+
+    run_steps(
+        "descargas",
+        lambda app: [
+            ("abrir", _navigate(app, "valoracion_integral")),
+            ("consolidado_completo", _prepare_full_download(app)),
+        ],
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end de las cuatro páginas con el warehouse sintético.")
+    parser.add_argument("--clients", type=int, default=200000)
+    parser.add_argument("--warehouse-dir", default="")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--customers", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--warm", action="store_true", help="No limpia st.cache_data entre iteraciones.")
+    parser.add_argument("--output")
+    parser.add_argument("--baseline", help="Reporte JSON anterior contra el cual buscar regresiones.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("cliente_integral.queries").setLevel(logging.WARNING)
+
+    use_fake_warehouse(args.clients, args.warehouse_dir)
+    scenarios = run_scenarios(args.iterations, args.timeout, args.warm, args.customers)
+    report = build_report(
+        scenarios,
+        {
+            "clients": args.clients,
+            "iterations": args.iterations,
+            "customers": args.customers,
+            "warm": args.warm,
+        },
+    )
+    path = write_report(report, args.output)
+    logging.info("Resultados guardados en %s", path)
+
+    if args.baseline:
+        regressions = compare_reports(report, json.loads(Path(args.baseline).read_text(encoding="utf-8")))
+        for regression in regressions:
+            logging.warning("Regresión: %s", regression)
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
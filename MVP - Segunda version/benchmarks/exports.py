@@ -0,0 +1,171 @@
+import argparse
+import json
+import statistics
+import time
+import unicodedata
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from features.decisiones_estrategicas.sections import _prepare_download_dataframe
+from features.valoracion_integral.sections import (
+    _prepare_consolidado_download_dataframe,
+    _prepare_detalle_download_dataframe,
+)
+from services.frame_dtypes import optimize_dtypes
+
+
+MIN_SPEEDUP = 5.0
+MIN_ROWS_FOR_SPEEDUP = 100_000
+SPEEDUP_VARIANTS = ("object",)
+
+TIPOS_IDENTIFICACION = (
+    "Cédula de ciudadanía",
+    "Cédula de extranjería",
+    "NIT",
+    "Pasaporte",
+    "Tarjeta de identidad",
+    None,
+)
+DEPARTAMENTOS = ("RISARALDA", "CALDAS", "QUINDÍO", "VALLE DEL CAUCA")
+
+PREPARERS: dict[str, Callable[[pd.DataFrame], pd.DataFrame]] = {
+    "decisiones": _prepare_download_dataframe,
+    "consolidado": _prepare_consolidado_download_dataframe,
+    "detalle": _prepare_detalle_download_dataframe,
+}
+
+
+@dataclass(frozen=True)
+class ExportMeasurement:
+    export: str
+    variant: str
+    rows: int
+    legacy_ms: float
+    prepare_ms: float
+    matches: bool
+
+    @property
+    def speedup(self) -> float:
+        return self.legacy_ms / self.prepare_ms if self.prepare_ms else float("inf")
+
+
+def _legacy_strip(value: object) -> object:
+    if not isinstance(value, str):
+        return value
+    return "".join(char for char in unicodedata.normalize("NFKD", value) if not unicodedata.combining(char))
+
+
+def _legacy_prepare(df: pd.DataFrame, rename_columns: bool) -> pd.DataFrame:
+    df = df.copy()
+    if rename_columns:
+        df.columns = [_legacy_strip(str(column)) for column in df.columns]
+    for column in df.columns:
+        if str(_legacy_strip(str(column))).replace(" ", "").lower() == "tipoidentificacion":
+            df[column] = df[column].apply(_legacy_strip)
+    return df
+
+
+def build_export_frame(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "TipoIdentificacion": np.asarray(TIPOS_IDENTIFICACION, dtype=object)[
+                rng.integers(0, len(TIPOS_IDENTIFICACION), rows)
+            ],
+            "Identificacion": np.char.zfill(rng.integers(0, 10**10, rows).astype(str), 10).astype(object),
+            "Departamento": np.asarray(DEPARTAMENTOS, dtype=object)[rng.integers(0, len(DEPARTAMENTOS), rows)],
+            "Categoría": np.where(rng.random(rows) < 0.8, "Residencial", "Comercial").astype(object),
+            "Score": rng.random(rows),
+            "Contratos": rng.integers(1, 12, rows),
+        }
+    )
+
+
+def _median_ms(run: Callable[[], pd.DataFrame], repeat: int) -> tuple[float, pd.DataFrame]:
+    timings: list[float] = []
+    result = pd.DataFrame()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 2), result
+
+
+def _same_values(left: pd.DataFrame, right: pd.DataFrame) -> bool:
+    if list(left.columns) != list(right.columns):
+        return False
+    return all(
+        left[column].astype(object).where(left[column].notna(), None).tolist()
+        == right[column].astype(object).where(right[column].notna(), None).tolist()
+        for column in left.columns
+    )
+
+
+def run_export_benchmarks(rows: int = 1_000_000, repeat: int = 3) -> list[ExportMeasurement]:
+    base = build_export_frame(rows)
+    variants = {"object": base, "optimizado": optimize_dtypes(base).frame}
+    measurements: list[ExportMeasurement] = []
+    for variant, df in variants.items():
+        for export, prepare in PREPARERS.items():
+            legacy_ms, expected = _median_ms(lambda: _legacy_prepare(df, export == "consolidado"), repeat)
+            prepare_ms, result = _median_ms(lambda: prepare(df), repeat)
+            measurements.append(
+                ExportMeasurement(export, variant, rows, legacy_ms, prepare_ms, _same_values(expected, result))
+            )
+    return measurements
+
+
+def check_thresholds(measurements: list[ExportMeasurement]) -> list[str]:
+    violations: list[str] = []
+    for item in measurements:
+        label = f"{item.export}[{item.variant}]"
+        if not item.matches:
+            violations.append(f"{label}: el resultado no coincide con la limpieza fila a fila")
+        if item.variant in SPEEDUP_VARIANTS and item.rows >= MIN_ROWS_FOR_SPEEDUP and item.speedup < MIN_SPEEDUP:
+            violations.append(f"{label}: {item.speedup:.1f}x más rápido que fila a fila (mínimo {MIN_SPEEDUP}x)")
+    return violations
+
+
+def _format_table(measurements: list[ExportMeasurement]) -> str:
+    header = f"{'export':<12} {'variante':<11} {'filas':>10} {'fila a fila ms':>15} {'factorize ms':>13} {'x':>7} {'igual':>6}"
+    rows = [
+        f"{item.export:<12} {item.variant:<11} {item.rows:>10,} {item.legacy_ms:>15.1f} {item.prepare_ms:>13.1f} "
+        f"{item.speedup:>7.1f} {'sí' if item.matches else 'no':>6}"
+        for item in measurements
+    ]
+    return "\n".join([header, *rows])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de la limpieza de texto en las descargas CSV.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    measurements = run_export_benchmarks(args.rows, args.repeat)
+    print(_format_table(measurements))
+
+    violations = check_thresholds(measurements)
+    for violation in violations:
+        print(f"UMBRAL: {violation}")
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(
+                [{**asdict(item), "speedup": round(item.speedup, 2)} for item in measurements],
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    if violations:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from services.query_log import QueryRecord, add_query_listener
+
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+REGRESSION_TOLERANCE = 0.2
+
+
+@dataclass(frozen=True)
+class RerunSample:
+    step: str
+    iteration: int
+    latency_ms: float
+    queries: int
+    cache_hits: int
+    exceptions: int = 0
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    samples: list[RerunSample] = field(default_factory=list)
+    process_peak_rss_mb: float = 0.0
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        steps: dict[str, list[RerunSample]] = {}
+        for sample in self.samples:
+            steps.setdefault(sample.step, []).append(sample)
+        return {step: summarize_samples(samples) for step, samples in steps.items()}
+
+    def to_payload(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "process_peak_rss_mb": round(self.process_peak_rss_mb, 1),
+            "summary": self.summary(),
+            "samples": [asdict(sample) for sample in self.samples],
+        }
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.queries = 0
+        self.cache_hits = 0
+        add_query_listener(self)
+
+    def __call__(self, record: QueryRecord) -> None:
+        if record.cache_hit:
+            self.cache_hits += 1
+        else:
+            self.queries += 1
+
+    def snapshot(self) -> tuple[int, int]:
+        return self.queries, self.cache_hits
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize_samples(samples: list[RerunSample]) -> dict[str, float]:
+    latencies = [sample.latency_ms for sample in samples]
+    return {
+        "runs": len(samples),
+        "p50_ms": round(percentile(latencies, 0.5), 1),
+        "p95_ms": round(percentile(latencies, 0.95), 1),
+        "max_ms": round(max(latencies, default=0.0), 1),
+        "queries_per_rerun": round(sum(sample.queries for sample in samples) / max(len(samples), 1), 2),
+        "cache_hits_per_rerun": round(sum(sample.cache_hits for sample in samples) / max(len(samples), 1), 2),
+        "exceptions": sum(sample.exceptions for sample in samples),
+    }
+
+
+def process_peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure_rerun(
+    counter: QueryCounter,
+    scenario: ScenarioResult,
+    step: str,
+    iteration: int,
+    action: Callable[[], object],
+    count_exceptions: Callable[[], int] = lambda: 0,
+) -> RerunSample:
+    queries_before, hits_before = counter.snapshot()
+    started = time.perf_counter()
+    action()
+    latency_ms = (time.perf_counter() - started) * 1000
+    queries_after, hits_after = counter.snapshot()
+    sample = RerunSample(
+        step=step,
+        iteration=iteration,
+        latency_ms=round(latency_ms, 2),
+        queries=queries_after - queries_before,
+        cache_hits=hits_after - hits_before,
+        exceptions=count_exceptions(),
+    )
+    scenario.samples.append(sample)
+    scenario.process_peak_rss_mb = process_peak_rss_mb()
+    return sample
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconocido"
+
+
+def build_report(scenarios: list[ScenarioResult], settings: dict[str, object]) -> dict[str, object]:
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "settings": settings,
+        "process_peak_rss_mb": round(process_peak_rss_mb(), 1),
+        "scenarios": [scenario.to_payload() for scenario in scenarios],
+    }
+
+
+def write_report(report: dict[str, object], output: str | None = None) -> Path:
+    path = Path(output) if output else RESULTS_DIR / f"{report['revision']}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def compare_reports(
+    current: dict[str, object],
+    baseline: dict[str, object],
+    tolerance: float = REGRESSION_TOLERANCE,
+) -> list[str]:
+    baseline_steps = {
+        (scenario["name"], step): values
+        for scenario in baseline["scenarios"]
+        for step, values in scenario["summary"].items()
+    }
+    regressions: list[str] = []
+    for scenario in current["scenarios"]:
+        for step, values in scenario["summary"].items():
+            previous = baseline_steps.get((scenario["name"], step))
+            if previous is None:
+                continue
+            if previous["p95_ms"] and values["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{scenario['name']}/{step}: p95 {previous['p95_ms']} ms -> {values['p95_ms']} ms"
+                )
+            if values["queries_per_rerun"] > previous["queries_per_rerun"]:
+                regressions.append(
+                    f"{scenario['name']}/{step}: consultas por rerun "
+                    f"{previous['queries_per_rerun']} -> {values['queries_per_rerun']}"
+                )
+    return regressions
+
+
+def use_fake_warehouse(clients: int, directory: str = "") -> None:
+    os.environ["WAREHOUSE_BACKEND"] = "fake"
+    os.environ["FAKE_WAREHOUSE_CLIENTS"] = str(clients)
+    from services.fake_warehouse import create_fake_warehouse, reset_fake_warehouse
+
+    reset_fake_warehouse(create_fake_warehouse(clients=clients, directory=directory))
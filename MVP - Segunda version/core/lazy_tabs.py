@@ -0,0 +1,61 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import streamlit as st
+
+from core.prefetch import prefetch
+
+
+@dataclass(frozen=True)
+class LazyTab:
+    tab_id: str
+    label: str
+    render: Callable[[], None]
+    prefetch: Callable[[], object] | None = None
+
+
+def resolve_tab(tabs: Sequence[LazyTab], selected: str | None, default: str | None = None) -> LazyTab:
+    by_id = {tab.tab_id: tab for tab in tabs}
+    return by_id.get(selected) or by_id.get(default) or tabs[0]
+
+
+def prefetch_tabs(tabs: Sequence[LazyTab], tab_ids: Sequence[str], key: str, token: str = "") -> None:
+    for tab in tabs:
+        if tab.tab_id in tab_ids and tab.prefetch is not None:
+            prefetch(key, f"{key}:{tab.tab_id}:{token}", tab.prefetch)
+
+
+def render_lazy_tabs(
+    tabs: Sequence[LazyTab],
+    *,
+    key: str,
+    default: str | None = None,
+    prefetch_ids: Sequence[str] = (),
+    prefetch_token: str = "",
+) -> str:
+    tab_ids = [tab.tab_id for tab in tabs]
+    selected = st.radio(
+        "Sección",
+        tab_ids,
+        index=tab_ids.index(default) if default in tab_ids else 0,
+        format_func={tab.tab_id: tab.label for tab in tabs}.get,
+        key=key,
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+    active = resolve_tab(tabs, selected, default)
+    active.render()
+    prefetch_tabs(tabs, [tab_id for tab_id in prefetch_ids if tab_id != active.tab_id], key, prefetch_token)
+    return active.tab_id
+
+
+@st.fragment
+def render_lazy_tabs_fragment(
+    tabs: Sequence[LazyTab],
+    *,
+    key: str,
+    default: str | None = None,
+    prefetch_ids: Sequence[str] = (),
+    prefetch_token: str = "",
+) -> None:
+    render_lazy_tabs(tabs, key=key, default=default, prefetch_ids=prefetch_ids, prefetch_token=prefetch_token)
@@ -0,0 +1,214 @@
+import math
+import os
+from collections.abc import Callable, MutableMapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import streamlit as st
+
+from core.session_storage import get_frame_store
+
+
+GRID_PAGE_SIZE = int(os.getenv("GRID_PAGE_SIZE", "100"))
+GRID_SOURCE_SUFFIX = "_source"
+GRID_VIEW_SUFFIX = "_view"
+SORT_ORDERS = ("descending", "ascending")
+SORT_ORDER_LABELS = {"descending": "Descendente", "ascending": "Ascendente"}
+
+
+@dataclass(frozen=True)
+class GridQuery:
+    search: str = ""
+    sort_by: str | None = None
+    descending: bool = True
+    page: int = 1
+    page_size: int = GRID_PAGE_SIZE
+
+
+@dataclass(frozen=True)
+class GridPage:
+    frame: pd.DataFrame
+    total_rows: int
+    page: int
+    pages: int
+    start: int
+
+
+def _sort_key(column: pa.ChunkedArray) -> pa.Array | pa.ChunkedArray:
+    if pa.types.is_dictionary(column.type):
+        return column.combine_chunks().indices
+    return column
+
+
+def _is_text(column: pa.ChunkedArray) -> bool:
+    column_type = column.type.value_type if pa.types.is_dictionary(column.type) else column.type
+    return pa.types.is_string(column_type) or pa.types.is_large_string(column_type)
+
+
+class ArrowGridSource:
+    def __init__(
+        self,
+        df: pd.DataFrame | pa.Table,
+        column_config: dict[str, object] | None = None,
+        view_cache: dict[str, object] | None = None,
+    ) -> None:
+        self.table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+        self.column_config = column_config or {}
+        self.view_cache = {} if view_cache is None else view_cache
+
+    @property
+    def columns(self) -> list[str]:
+        return self.table.column_names
+
+    @property
+    def num_rows(self) -> int:
+        return self.table.num_rows
+
+    def _matches(self, search: str) -> pa.Array | None:
+        needle = search.strip().lower()
+        if not needle:
+            return None
+        mask = None
+        for name in self.columns:
+            column = self.table.column(name)
+            if not _is_text(column):
+                continue
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(pa.string())
+            matches = pc.fill_null(pc.match_substring(pc.utf8_lower(column), needle), False)
+            mask = matches if mask is None else pc.or_(mask, matches)
+        return mask if mask is not None else pa.array(np.zeros(self.num_rows, dtype=bool))
+
+    def _view(self, search: str, sort_by: str | None, descending: bool) -> pa.Array:
+        view_key = (search.strip().lower(), sort_by if sort_by in self.columns else None, descending)
+        if self.view_cache.get("key") == view_key:
+            return self.view_cache["indices"]
+
+        indices = pa.array(np.arange(self.num_rows, dtype=np.int64))
+        mask = self._matches(search)
+        if mask is not None:
+            indices = pc.filter(indices, mask)
+        if view_key[1] is not None and len(indices) > 1:
+            keys = pc.take(_sort_key(self.table.column(view_key[1])), indices)
+            order = pc.array_sort_indices(
+                keys,
+                order=SORT_ORDERS[0] if descending else SORT_ORDERS[1],
+                null_placement="at_end",
+            )
+            indices = pc.take(indices, order)
+
+        self.view_cache.update(key=view_key, indices=indices)
+        return indices
+
+    def query(self, query: GridQuery) -> GridPage:
+        indices = self._view(query.search, query.sort_by, query.descending)
+        total_rows = len(indices)
+        page_size = max(query.page_size, 1)
+        pages = max(math.ceil(total_rows / page_size), 1)
+        page = min(max(query.page, 1), pages)
+        start = (page - 1) * page_size
+        window = self.table.take(indices.slice(start, page_size))
+        return GridPage(window.to_pandas(), total_rows, page, pages, start)
+
+
+def get_grid_source(
+    key: str,
+    token: str,
+    build: Callable[[], ArrowGridSource],
+    session_mapping: MutableMapping[str, object] | None = None,
+) -> ArrowGridSource:
+    session_mapping = st.session_state if session_mapping is None else session_mapping
+    source_key = f"{key}{GRID_SOURCE_SUFFIX}"
+    store = get_frame_store(session_mapping)
+    cached = session_mapping.get(source_key)
+    if cached is not None and cached[0] == token:
+        table = store.get(source_key)
+        if table is not None:
+            return ArrowGridSource(table, cached[1], cached[2])
+    source = build()
+    store.put(source_key, source.table)
+    session_mapping[source_key] = (token, source.column_config, source.view_cache)
+    return source
+
+
+@st.fragment
+def render_paged_grid(
+    key: str,
+    token: str,
+    build: Callable[[], ArrowGridSource],
+    *,
+    default_sort: str | None = None,
+    default_descending: bool = True,
+    page_size: int = GRID_PAGE_SIZE,
+    column_order: Sequence[str] | None = None,
+    render_detail: Callable[[pd.Series], None] | None = None,
+) -> None:
+    source = get_grid_source(key, token, build)
+    columns = source.columns
+
+    search_col, sort_col, order_col = st.columns([2, 1.4, 1], gap="small")
+    with search_col:
+        search = st.text_input("Buscar en el listado", key=f"{key}_search", placeholder="Escribe para filtrar")
+    with sort_col:
+        sort_by = st.selectbox(
+            "Ordenar por",
+            columns,
+            index=columns.index(default_sort) if default_sort in columns else 0,
+            key=f"{key}_sort",
+        )
+    with order_col:
+        order = st.selectbox(
+            "Orden",
+            SORT_ORDERS,
+            index=0 if default_descending else 1,
+            format_func=SORT_ORDER_LABELS.get,
+            key=f"{key}_order",
+        )
+
+    page_key = f"{key}_page"
+    view_key = f"{key}{GRID_VIEW_SUFFIX}"
+    view = (search, sort_by, order, token)
+    if st.session_state.get(view_key) != view:
+        st.session_state[view_key] = view
+        st.session_state[page_key] = 1
+    grid_page = source.query(
+        GridQuery(search, sort_by, order == "descending", st.session_state.get(page_key, 1), page_size)
+    )
+    if st.session_state.get(page_key, 1) != grid_page.page:
+        st.session_state[page_key] = grid_page.page
+    table_options = {
+        "column_config": source.column_config,
+        "column_order": column_order,
+        "width": "stretch",
+        "hide_index": True,
+    }
+    if render_detail is None:
+        st.dataframe(grid_page.frame, **table_options)
+    else:
+        event = st.dataframe(
+            grid_page.frame,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"{key}_table",
+            **table_options,
+        )
+
+    info_col, page_col = st.columns([3, 1], gap="small")
+    with page_col:
+        st.number_input("Página", min_value=1, max_value=grid_page.pages, step=1, key=page_key)
+    with info_col:
+        if grid_page.total_rows:
+            st.caption(
+                f"Filas {grid_page.start + 1:,}–{grid_page.start + len(grid_page.frame):,} "
+                f"de {grid_page.total_rows:,} · página {grid_page.page} de {grid_page.pages}".replace(",", ".")
+            )
+        else:
+            st.caption("Ningún registro coincide con la búsqueda.")
+
+    if render_detail is not None:
+        selected_rows = [row for row in event.selection.rows if row < len(grid_page.frame)]
+        if selected_rows:
+            render_detail(grid_page.frame.iloc[selected_rows[0]])
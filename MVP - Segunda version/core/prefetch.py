@@ -0,0 +1,52 @@
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from services.metrics import PREFETCH_TASKS
+
+
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "true").lower() in {"1", "true", "yes"}
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "2"))
+
+LOGGER = logging.getLogger("cliente_integral.prefetch")
+
+_executor: ThreadPoolExecutor | None = None
+_pending: set[str] = set()
+_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=max(PREFETCH_WORKERS, 1), thread_name_prefix="prefetch")
+    return _executor
+
+
+def _run(view: str, key: str, run: Callable[[], object]) -> None:
+    try:
+        run()
+    except Exception as exc:
+        PREFETCH_TASKS.inc(view, "error")
+        LOGGER.warning(
+            json.dumps({"event": "prefetch", "view": view, "error": type(exc).__name__}, ensure_ascii=False)
+        )
+    else:
+        PREFETCH_TASKS.inc(view, "ok")
+    finally:
+        with _lock:
+            _pending.discard(key)
+
+
+def prefetch(view: str, key: str, run: Callable[[], object]) -> Future | None:
+    if not PREFETCH_ENABLED:
+        return None
+    with _lock:
+        if key in _pending:
+            PREFETCH_TASKS.inc(view, "skipped")
+            return None
+        _pending.add(key)
+        executor = _get_executor()
+    return executor.submit(_run, view, key, run)
@@ -0,0 +1,288 @@
+import cProfile
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from services.query_log import QueryRecord, add_query_listener
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+except ImportError:
+    PyinstrumentProfiler = None
+
+
+PROFILING_ENV = "APP_PROFILING"
+PROFILING_QUERY_PARAM = "profile"
+PROFILING_DUMP_DIR = Path(os.getenv("APP_PROFILING_DUMP_DIR", Path(tempfile.gettempdir()) / "cliente_integral_profiles"))
+PROFILING_MAX_DUMPS = int(os.getenv("APP_PROFILING_MAX_DUMPS", "50"))
+DUMP_MODES = ("cprofile", "pyinstrument")
+ENABLED_VALUES = {"1", "true", "yes", "on", *DUMP_MODES}
+
+SPAN_COLORS = {
+    "page": "#0B74C8",
+    "render": "#5CA9E6",
+    "format": "#F59E0B",
+    "load": "#16A34A",
+    "query": "#B42318",
+}
+
+LOGGER = logging.getLogger("cliente_integral.profiling")
+
+_cprofile_lock = threading.Lock()
+
+Result = TypeVar("Result")
+
+
+@dataclass(frozen=True)
+class ProfileSpan:
+    name: str
+    kind: str
+    start_ms: float
+    duration_ms: float
+    depth: int
+
+
+@dataclass
+class ProfilingRun:
+    mode: str
+    started: float = field(default_factory=time.perf_counter)
+    spans: list[ProfileSpan] = field(default_factory=list)
+    depth: int = 0
+    dump_path: Path | None = None
+
+    def add_span(self, name: str, kind: str, started: float, finished: float, depth: int) -> None:
+        self.spans.append(
+            ProfileSpan(
+                name=name,
+                kind=kind,
+                start_ms=(started - self.started) * 1000,
+                duration_ms=(finished - started) * 1000,
+                depth=depth,
+            )
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                {
+                    "Paso": f"{'  ' * span.depth}{span.name}",
+                    "Tipo": span.kind,
+                    "Inicio (ms)": round(span.start_ms, 1),
+                    "Duración (ms)": round(span.duration_ms, 1),
+                }
+                for span in sorted(self.spans, key=lambda span: span.start_ms)
+            ],
+            columns=["Paso", "Tipo", "Inicio (ms)", "Duración (ms)"],
+        )
+
+
+_active_run: ContextVar[ProfilingRun | None] = ContextVar("profiling_run", default=None)
+
+
+def _normalize_mode(value: str | None) -> str | None:
+    normalized = (value or "").strip().lower()
+    if normalized not in ENABLED_VALUES:
+        return None
+    return normalized if normalized in DUMP_MODES else "timers"
+
+
+def _resolve_mode(env_value: str | None, query_value: str | None) -> str | None:
+    env_mode = _normalize_mode(env_value)
+    if env_mode is None:
+        return None
+    return _normalize_mode(query_value) or env_mode
+
+
+def get_profiling_mode() -> str | None:
+    return _resolve_mode(os.getenv(PROFILING_ENV), st.query_params.get(PROFILING_QUERY_PARAM))
+
+
+def get_active_run() -> ProfilingRun | None:
+    return _active_run.get()
+
+
+@contextmanager
+def profile_span(name: str, kind: str = "render") -> Iterator[None]:
+    run = _active_run.get()
+    if run is None:
+        yield
+        return
+
+    depth = run.depth
+    run.depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        run.depth = depth
+        run.add_span(name, kind, started, time.perf_counter(), depth)
+
+
+def profiled(kind: str = "render") -> Callable[[Callable[..., Result]], Callable[..., Result]]:
+    def decorator(func: Callable[..., Result]) -> Callable[..., Result]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Result:
+            if _active_run.get() is None:
+                return func(*args, **kwargs)
+            with profile_span(func.__name__, kind):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _record_query_span(record: QueryRecord) -> None:
+    run = _active_run.get()
+    if run is None or record.cache_hit:
+        return
+    finished = time.perf_counter()
+    run.add_span(
+        f"{record.loader} · SQL {record.fingerprint}",
+        "query",
+        finished - record.total_ms / 1000,
+        finished,
+        run.depth,
+    )
+
+
+def _build_dump_path(extension: str) -> Path:
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else "sin_sesion"
+    PROFILING_DUMP_DIR.mkdir(parents=True, exist_ok=True)
+    return PROFILING_DUMP_DIR / f"{session_id}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.{extension}"
+
+
+def _prune_dumps(max_dumps: int | None = None) -> None:
+    max_dumps = PROFILING_MAX_DUMPS if max_dumps is None else max_dumps
+    dumps = sorted(
+        (path for path in PROFILING_DUMP_DIR.glob("*") if path.suffix in {".prof", ".html"}),
+        key=lambda path: path.stat().st_mtime_ns,
+    )
+    for path in dumps[: max(len(dumps) - max_dumps, 0)]:
+        path.unlink(missing_ok=True)
+
+
+def _start_cprofile() -> cProfile.Profile | None:
+    if not _cprofile_lock.acquire(blocking=False):
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        _cprofile_lock.release()
+        return None
+    return profiler
+
+
+@contextmanager
+def profiling_run(mode: str | None) -> Iterator[ProfilingRun | None]:
+    if mode is None:
+        yield None
+        return
+
+    profiler: cProfile.Profile | None = None
+    instrument = None
+
+    if mode == "cprofile":
+        profiler = _start_cprofile()
+        if profiler is None:
+            LOGGER.warning("cProfile ya está activo en otra sesión; este rerun usa el modo timers.")
+            mode = "timers"
+    elif mode == "pyinstrument" and PyinstrumentProfiler is not None:
+        instrument = PyinstrumentProfiler()
+        instrument.start()
+
+    run = ProfilingRun(mode=mode)
+    token = _active_run.set(run)
+    try:
+        yield run
+    finally:
+        _active_run.reset(token)
+        if profiler is not None:
+            profiler.disable()
+            _cprofile_lock.release()
+        try:
+            if profiler is not None:
+                run.dump_path = _build_dump_path("prof")
+                profiler.dump_stats(run.dump_path)
+            elif instrument is not None:
+                instrument.stop()
+                run.dump_path = _build_dump_path("html")
+                run.dump_path.write_text(instrument.output_html(), encoding="utf-8")
+            if run.dump_path is not None:
+                _prune_dumps()
+        except OSError:
+            LOGGER.exception("No fue posible guardar el perfil de la sesión.")
+            run.dump_path = None
+
+
+def _build_waterfall_figure(run: ProfilingRun) -> go.Figure:
+    spans = sorted(run.spans, key=lambda span: span.start_ms)
+    labels = [f"{index:02d} {'· ' * span.depth}{span.name}" for index, span in enumerate(spans, start=1)]
+
+    fig = go.Figure(
+        go.Bar(
+            x=[span.duration_ms for span in spans],
+            base=[span.start_ms for span in spans],
+            y=labels,
+            orientation="h",
+            marker=dict(color=[SPAN_COLORS.get(span.kind, "#7A869A") for span in spans]),
+            customdata=[[span.kind, span.duration_ms] for span in spans],
+            hovertemplate="<b>%{y}</b><br>%{customdata[0]} · %{customdata[1]:.1f} ms<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        height=max(240, 22 * len(spans) + 60),
+        margin=dict(l=10, r=10, t=10, b=10),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(title="ms desde el inicio del rerun", showgrid=True, gridcolor="#E8EEF5"),
+        yaxis=dict(title="", autorange="reversed", tickfont=dict(size=11)),
+        showlegend=False,
+    )
+    return fig
+
+
+def render_profiling_panel(run: ProfilingRun | None) -> None:
+    if run is None:
+        return
+
+    total_ms = max((span.start_ms + span.duration_ms for span in run.spans), default=0.0)
+    totals = run.to_dataframe().groupby("Tipo")["Duración (ms)"].sum() if run.spans else pd.Series(dtype=float)
+
+    with st.expander(f"⏱️ Perfil del rerun · {total_ms:,.0f} ms", expanded=False):
+        if not run.spans:
+            st.info("No se registraron pasos en este rerun.")
+            return
+
+        cols = st.columns(4)
+        for col, kind in zip(cols, ("query", "load", "format", "render")):
+            col.metric(kind, f"{totals.get(kind, 0.0):,.0f} ms")
+        st.caption("Los tiempos de tipo load incluyen sus consultas; los de render incluyen sus pasos anidados.")
+
+        st.plotly_chart(_build_waterfall_figure(run), width="stretch", config={"displayModeBar": False})
+        st.dataframe(run.to_dataframe(), width="stretch", hide_index=True)
+
+        if run.dump_path is not None:
+            st.caption(f"Perfil guardado en `{run.dump_path}`.")
+        elif run.mode == "pyinstrument" and PyinstrumentProfiler is None:
+            st.warning("pyinstrument no está instalado; solo se muestran los temporizadores.")
+
+
+add_query_listener(_record_query_span)
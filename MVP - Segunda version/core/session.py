@@ -2,6 +2,8 @@
 
 import streamlit as st
 
+from core.session_storage import clear_session_frames
+
 
 NAVIGATION_KEY = "seccion_activa"
 PAGE_STATE_PREFIXES = ("dashboard_", "info_", "buscador_", "decisiones_")
@@ -23,4 +25,4 @@ def clear_state_mapping(
 
 def reset_app_state(preserve_keys: set[str] | None = None) -> None:
     clear_state_mapping(st.session_state, preserve_keys=preserve_keys)
-    st.cache_data.clear()
+    clear_session_frames(st.session_state)
@@ -0,0 +1,170 @@
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+from services.cache_budget import estimate_size
+from services.metrics import SESSION_FRAME_BYTES
+
+
+FRAME_STORE_KEY = "_session_frame_store"
+SPILL_THRESHOLD_BYTES = int(os.getenv("SESSION_FRAME_SPILL_BYTES", str(8 * 1024 * 1024)))
+MEMORY_CAP_BYTES = int(os.getenv("SESSION_FRAME_MEMORY_CAP_BYTES", str(32 * 1024 * 1024)))
+DISK_CAP_BYTES = int(os.getenv("SESSION_FRAME_DISK_CAP_BYTES", str(256 * 1024 * 1024)))
+SPILL_DIR = os.getenv("SESSION_FRAME_SPILL_DIR", "")
+
+
+@dataclass
+class StoredFrame:
+    size: int
+    frame: pd.DataFrame | pa.Table | None = None
+    path: Path | None = None
+    arrow: bool = False
+
+    @property
+    def spilled(self) -> bool:
+        return self.path is not None
+
+
+def _release_session_frames(sizes: dict[str, int], directories: list[Path]) -> None:
+    SESSION_FRAME_BYTES.dec("disk", amount=sizes["disk"])
+    SESSION_FRAME_BYTES.dec("memory", amount=sizes["memory"])
+    for directory in directories:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class SessionFrameStore:
+    def __init__(
+        self,
+        spill_threshold_bytes: int = SPILL_THRESHOLD_BYTES,
+        memory_cap_bytes: int = MEMORY_CAP_BYTES,
+        disk_cap_bytes: int = DISK_CAP_BYTES,
+        spill_dir: str = SPILL_DIR,
+    ) -> None:
+        self.spill_threshold_bytes = spill_threshold_bytes
+        self.memory_cap_bytes = memory_cap_bytes
+        self.disk_cap_bytes = disk_cap_bytes
+        self.spill_dir = spill_dir
+        self._entries: OrderedDict[str, StoredFrame] = OrderedDict()
+        self._sizes = {"memory": 0, "disk": 0}
+        self._directories: list[Path] = []
+        self._lock = threading.RLock()
+        weakref.finalize(self, _release_session_frames, self._sizes, self._directories)
+
+    @property
+    def directory(self) -> Path:
+        if not self._directories:
+            self._directories.append(
+                Path(tempfile.mkdtemp(prefix="cliente_integral_session_", dir=self.spill_dir or None))
+            )
+        return self._directories[0]
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._sizes["memory"]
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._sizes["disk"]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def is_spilled(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.spilled
+
+    def _account(self, storage: str, amount: int) -> None:
+        self._sizes[storage] += amount
+        SESSION_FRAME_BYTES.inc(storage, amount=amount)
+
+    def _spill(self, entry: StoredFrame) -> None:
+        path = self.directory / f"{uuid.uuid4().hex}.parquet"
+        try:
+            table = entry.frame if entry.arrow else pa.Table.from_pandas(entry.frame, preserve_index=False)
+            pq.write_table(table, path)
+        except (pa.ArrowException, OSError):
+            path.unlink(missing_ok=True)
+            return
+        self._account("memory", -entry.size)
+        entry.frame = None
+        entry.path = path
+        entry.size = path.stat().st_size
+        self._account("disk", entry.size)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        if entry.spilled:
+            self._account("disk", -entry.size)
+            entry.path.unlink(missing_ok=True)
+        else:
+            self._account("memory", -entry.size)
+
+    def _enforce_caps(self) -> None:
+        for entry in list(self._entries.values()):
+            if self.memory_bytes <= self.memory_cap_bytes:
+                break
+            if not entry.spilled:
+                self._spill(entry)
+        while self.disk_bytes > self.disk_cap_bytes and self._entries:
+            self._drop(next(iter(self._entries)))
+
+    def put(self, key: str, df: pd.DataFrame | pa.Table) -> None:
+        with self._lock:
+            self._drop(key)
+            entry = StoredFrame(size=estimate_size(df), frame=df, arrow=isinstance(df, pa.Table))
+            self._entries[key] = entry
+            self._account("memory", entry.size)
+            if entry.size >= self.spill_threshold_bytes:
+                self._spill(entry)
+            self._enforce_caps()
+
+    def get(self, key: str) -> pd.DataFrame | pa.Table | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            if not entry.spilled:
+                return entry.frame
+            path, arrow = entry.path, entry.arrow
+        table = pq.read_table(path, memory_map=True)
+        return table if arrow else table.to_pandas()
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+
+def get_frame_store(session_mapping: MutableMapping[str, object] | None = None) -> SessionFrameStore:
+    session_mapping = st.session_state if session_mapping is None else session_mapping
+    store = session_mapping.get(FRAME_STORE_KEY)
+    if store is None:
+        store = SessionFrameStore()
+        session_mapping[FRAME_STORE_KEY] = store
+    return store
+
+
+def clear_session_frames(session_mapping: MutableMapping[str, object] | None = None) -> None:
+    session_mapping = st.session_state if session_mapping is None else session_mapping
+    store = session_mapping.get(FRAME_STORE_KEY)
+    if store is not None:
+        store.clear()
@@ -0,0 +1,61 @@
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+NUMBER_FORMAT = "%.2f"
+SCORE_LEVEL_LABELS = ("⚪ Muy bajo", "🔵 Bajo", "🟡 Medio", "🟠 Alto", "🔴 Muy alto")
+
+
+def is_zero_to_one(values: pd.Series) -> bool:
+    numeric = pd.to_numeric(values, errors="coerce").dropna()
+    return not numeric.empty and bool(numeric.between(0, 1).all())
+
+
+def score_levels(values: pd.Series, labels: Sequence[str] = SCORE_LEVEL_LABELS) -> pd.Categorical:
+    numeric = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    low, high = np.nanmin(numeric, initial=np.inf), np.nanmax(numeric, initial=-np.inf)
+    codes = np.full(len(numeric), -1, dtype="int8")
+    valid = ~np.isnan(numeric)
+    if valid.any():
+        span = high - low
+        scaled = (numeric[valid] - low) / span if span > 0 else np.zeros(valid.sum())
+        codes[valid] = np.minimum((scaled * len(labels)).astype("int8"), len(labels) - 1)
+    return pd.Categorical.from_codes(codes, categories=list(labels))
+
+
+def with_score_level(df: pd.DataFrame, score_column: str, level_column: str = "Nivel") -> pd.DataFrame:
+    if score_column not in df.columns:
+        return df
+    df = df.copy(deep=False)
+    df.insert(df.columns.get_loc(score_column) + 1, level_column, score_levels(df[score_column]))
+    return df
+
+
+def build_column_config(
+    df: pd.DataFrame,
+    *,
+    checkbox_columns: Sequence[str] = (),
+    progress_columns: Sequence[str] = (),
+    text_columns: Sequence[str] = (),
+    number_format: str = NUMBER_FORMAT,
+) -> dict[str, object]:
+    config: dict[str, object] = {}
+    for column in df.columns:
+        name = str(column)
+        if column in checkbox_columns:
+            config[name] = st.column_config.CheckboxColumn(name, disabled=True)
+        elif column in progress_columns:
+            config[name] = st.column_config.ProgressColumn(
+                name,
+                format=number_format,
+                min_value=0.0,
+                max_value=1.0,
+            )
+        elif column in text_columns:
+            config[name] = st.column_config.TextColumn(name)
+        elif pd.api.types.is_numeric_dtype(df[column].dtype) and not pd.api.types.is_bool_dtype(df[column].dtype):
+            config[name] = st.column_config.NumberColumn(name, format=number_format)
+    return config
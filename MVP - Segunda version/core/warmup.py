@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from streamlit import runtime
+
+from features.buscador_clientes.data import load_tipo_identificacion_options
+from features.decisiones_estrategicas.data import load_service_options, load_table_columns
+from features.valoracion_integral.data import (
+    load_clientes_mayor_aporte,
+    load_combinaciones_servicios,
+    load_consolidado_general,
+    load_filter_options,
+    load_kpis,
+    load_numero_servicios,
+    load_penetracion_servicios,
+    load_service_classification,
+    load_service_classification_profile,
+)
+from features.valoracion_integral.models import DashboardFilters
+from repositories.strategic_decisions_queries import get_consolidado_variable_table, get_service_options
+from services.metrics import CACHE_WARMUP_PROGRESS, CACHE_WARMUP_TASKS
+
+
+WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "true").lower() in {"1", "true", "yes"}
+WARMUP_WORKERS = int(os.getenv("CACHE_WARMUP_WORKERS", "4"))
+WARMUP_RUNTIME_TIMEOUT_S = float(os.getenv("CACHE_WARMUP_RUNTIME_TIMEOUT_S", "120"))
+WARMUP_CATEGORIES = ("Residencial", "Comercial")
+
+
+def _build_logger() -> logging.Logger:
+    logger = logging.getLogger("cliente_integral.warmup")
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(os.getenv("CACHE_WARMUP_LOG_LEVEL", "INFO").upper())
+        logger.propagate = False
+    return logger
+
+
+LOGGER = _build_logger()
+
+
+@dataclass(frozen=True)
+class WarmupTask:
+    name: str
+    run: Callable[[], object]
+
+
+@dataclass
+class WarmupStatus:
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def progress(self) -> float:
+        if not self.total:
+            return 1.0 if self.finished_at else 0.0
+        return (self.done + self.failed) / self.total
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def mark(self, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self.done += 1
+            else:
+                self.failed += 1
+
+    def to_payload(self) -> dict[str, object]:
+        elapsed_end = self.finished_at or time.time()
+        return {
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "progress": round(self.progress, 3),
+            "elapsed_s": round(elapsed_end - self.started_at, 2) if self.started_at else 0.0,
+            "finished": self.finished,
+        }
+
+
+_status = WarmupStatus()
+_thread: threading.Thread | None = None
+_thread_lock = threading.Lock()
+
+
+def build_warmup_tasks() -> list[WarmupTask]:
+    filters = DashboardFilters()
+    tasks = [
+        WarmupTask("load_filter_options", load_filter_options),
+        WarmupTask("load_tipo_identificacion_options", load_tipo_identificacion_options),
+        WarmupTask("load_kpis", lambda: load_kpis(filters)),
+        WarmupTask("load_penetracion_servicios", lambda: load_penetracion_servicios(filters)),
+        WarmupTask("load_numero_servicios", lambda: load_numero_servicios(filters)),
+        WarmupTask("load_combinaciones_servicios", lambda: load_combinaciones_servicios(filters)),
+        WarmupTask("load_clientes_mayor_aporte", lambda: load_clientes_mayor_aporte(filters)),
+        WarmupTask("load_service_classification", lambda: load_service_classification(filters, "brilla")),
+        WarmupTask(
+            "load_service_classification_profile",
+            lambda: load_service_classification_profile(filters, "brilla"),
+        ),
+        WarmupTask("load_consolidado_general", lambda: load_consolidado_general(filters)),
+    ]
+    for categoria in WARMUP_CATEGORIES:
+        tasks.append(WarmupTask(f"load_service_options[{categoria}]", lambda c=categoria: load_service_options(c)))
+        for servicio in get_service_options(categoria):
+            table_name = get_consolidado_variable_table(servicio.lower(), categoria)
+            tasks.append(WarmupTask(f"load_table_columns[{table_name}]", lambda t=table_name: load_table_columns(t)))
+    return tasks
+
+
+def _run_task(task: WarmupTask, status: WarmupStatus) -> None:
+    started = time.perf_counter()
+    try:
+        task.run()
+    except Exception as exc:
+        status.mark(ok=False)
+        CACHE_WARMUP_TASKS.inc(task.name, "error")
+        LOGGER.warning(
+            json.dumps({"event": "warmup_task", "task": task.name, "error": type(exc).__name__}, ensure_ascii=False)
+        )
+    else:
+        status.mark(ok=True)
+        CACHE_WARMUP_TASKS.inc(task.name, "ok")
+        LOGGER.info(
+            json.dumps(
+                {
+                    "event": "warmup_task",
+                    "task": task.name,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+                    **status.to_payload(),
+                },
+                ensure_ascii=False,
+            )
+        )
+    CACHE_WARMUP_PROGRESS.set(status.progress)
+
+
+def run_warmup(
+    tasks: list[WarmupTask] | None = None,
+    workers: int = WARMUP_WORKERS,
+    status: WarmupStatus | None = None,
+) -> WarmupStatus:
+    tasks = build_warmup_tasks() if tasks is None else tasks
+    status = status or WarmupStatus()
+    status.total = len(tasks)
+    status.started_at = time.time()
+    CACHE_WARMUP_PROGRESS.set(status.progress)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="cache-warmup") as executor:
+        for task in tasks:
+            executor.submit(_run_task, task, status)
+
+    status.finished_at = time.time()
+    CACHE_WARMUP_PROGRESS.set(1.0)
+    LOGGER.info(json.dumps({"event": "warmup_finished", **status.to_payload()}, ensure_ascii=False))
+    return status
+
+
+def wait_for_runtime(timeout: float = WARMUP_RUNTIME_TIMEOUT_S, interval: float = 0.2) -> bool:
+    deadline = time.monotonic() + timeout
+    while not runtime.exists():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+
+def _warmup_worker(tasks: list[WarmupTask] | None, wait_for_streamlit: bool) -> None:
+    if wait_for_streamlit and not wait_for_runtime():
+        LOGGER.warning("El runtime de Streamlit no inició a tiempo; se omite el precalentamiento de caché.")
+        return
+    run_warmup(tasks, status=_status)
+
+
+def start_cache_warmup(
+    tasks: list[WarmupTask] | None = None,
+    wait_for_streamlit: bool = True,
+) -> threading.Thread | None:
+    global _thread
+    if not WARMUP_ENABLED:
+        return None
+
+    with _thread_lock:
+        if _thread is not None:
+            return _thread
+        _thread = threading.Thread(
+            target=_warmup_worker,
+            args=(tasks, wait_for_streamlit),
+            name="cache-warmup",
+            daemon=True,
+        )
+        _thread.start()
+        return _thread
+
+
+def get_warmup_status() -> WarmupStatus:
+    return _status
@@ -2,7 +2,6 @@ import re
 from collections.abc import Iterable
 
 import pandas as pd
-import streamlit as st
 
 from features.buscador_clientes.models import CustomerProfile, CustomerSearchRequest, CustomerSearchResult
 from repositories.dashboard_queries import get_dimension_service_columns
@@ -16,6 +15,7 @@ from repositories.client_search_queries import (
     get_tipo_identificacion_options_query,
 )
 from services.databricks_conn import run_query
+from services.loader_cache import cached_loader
 
 
 NAME_CANDIDATES = [
@@ -174,7 +174,7 @@ def _get_active_services(dimensiones_df: pd.DataFrame, universo: str) -> tuple[s
     return tuple(active_services)
 
 
-@st.cache_data(ttl=3600)
+@cached_loader(ttl=3600, shared=False)
 def load_tipo_identificacion_options() -> list[str]:
     df = run_query(get_tipo_identificacion_options_query())
     if df.empty:
@@ -182,34 +182,34 @@ def load_tipo_identificacion_options() -> list[str]:
     return sorted(df.iloc[:, 0].dropna().astype(str).unique().tolist())
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_cliente_raw(tipo_identificacion: str, identificacion: str) -> pd.DataFrame:
     return run_query(get_cliente_raw_query(tipo_identificacion, identificacion))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_cliente_contratos_raw(tipo_identificacion: str, identificacion: str, universo: str) -> pd.DataFrame:
     return run_query(get_cliente_contratos_raw_query(tipo_identificacion, identificacion, universo))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_cliente_contratos_summary_raw(tipo_identificacion: str, identificacion: str, universo: str) -> pd.DataFrame:
     return run_query(get_cliente_contratos_summary_query(tipo_identificacion, identificacion, universo))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_contratos_detalle(contracts: tuple[str, ...], universo: str) -> pd.DataFrame:
     if not contracts:
         return pd.DataFrame()
     return run_query(get_contratos_detalle_query(list(contracts), universo))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_cliente_dimensiones(tipo_identificacion: str, identificacion: str, universo: str) -> pd.DataFrame:
     return run_query(get_cliente_dimensiones_query(tipo_identificacion, identificacion, universo))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_cliente_detalle_servicio(
     tipo_identificacion: str,
     identificacion: str,
@@ -85,6 +85,6 @@ def render() -> None:
     with contracts_detail_slot.container():
         with st.spinner("Cargando detalle de contratos..."):
             contratos = load_customer_contracts(current_request)
-            render_contracts_details(contratos)
+            render_contracts_details(contratos, repr(current_request))
 
     set_loading(False)
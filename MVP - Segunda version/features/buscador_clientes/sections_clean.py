@@ -1,6 +1,10 @@
+import html
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from core.paged_grid import ArrowGridSource, render_paged_grid
 from features.buscador_clientes.models import CustomerProfile, CustomerSearchRequest
 
 
@@ -13,6 +17,20 @@ SERVICE_ICONS = {
     "Brilla": "💳",
     "Efisoluciones": "⚙️",
 }
+CONTRACTS_GRID_KEY = "buscador_contratos_grid"
+CONTRACTS_PAGE_SIZE = 25
+CONTRACT_TABLE_COLUMNS = ("Contrato", "Estado", "Categoria", "Localidad", "Departamento")
+CONTRACT_DETAIL_FIELDS = (
+    ("Contrato", "Contrato"),
+    ("Estado", "Estado"),
+    ("Categoria", "Categoría"),
+    ("Subcategoria", "Subcategoría"),
+    ("Direccion", "Dirección"),
+    ("Barrio", "Barrio"),
+    ("Localidad", "Localidad"),
+    ("Departamento", "Departamento"),
+    ("Mercado", "Mercado"),
+)
 
 
 def load_styles() -> None:
@@ -71,6 +89,7 @@ def load_styles() -> None:
             margin-bottom: 0.9rem;
             min-height: 132px;
         }
+        .metric-grid { display: grid; grid-template-columns: repeat(4, minmax(0, 1fr)); gap: 0 1rem; }
         .metric-label { font-size: 0.8rem; text-transform: uppercase; letter-spacing: 0.05em; color: #6b7280; margin-bottom: 0.45rem; }
         .metric-value { font-size: 1.18rem; font-weight: 700; color: #17212f; margin-bottom: 0.65rem; word-break: break-word; }
         .metric-track { width: 100%; height: 7px; border-radius: 999px; background: #edf2f7; overflow: hidden; }
@@ -251,6 +270,35 @@ def _render_metric_card(label: str, value: object) -> None:
     st.markdown(html, unsafe_allow_html=True)
 
 
+def _metric_grid_html(row: pd.Series) -> str:
+    normalized = pd.Series([_normalize_metric_value(value) for value in row.tolist()], dtype=object)
+    missing = normalized.isna().to_numpy()
+    numeric = pd.to_numeric(normalized, errors="coerce").to_numpy(dtype="float64")
+    is_number = normalized.map(lambda value: isinstance(value, (float, np.floating))).to_numpy(dtype=bool) & ~missing
+
+    values = normalized.astype(str).to_numpy(dtype=object)
+    values[is_number] = np.char.mod("%.2f", numeric[is_number])
+    values[missing] = "No disponible"
+    with np.errstate(invalid="ignore"):
+        widths = np.where((numeric >= 0) & (numeric <= 1), numeric * 100.0, np.nan)
+
+    cards = [
+        f'<div class="metric-card"><div class="metric-label">{label}</div><div class="metric-value">{value}</div>'
+        + (
+            f'<div class="metric-track"><div class="metric-fill" style="width:{width:.1f}%"></div></div>'
+            if not np.isnan(width)
+            else ""
+        )
+        + "</div>"
+        for label, value, width in zip(
+            map(html.escape, map(str, row.index)),
+            map(html.escape, values),
+            widths,
+        )
+    ]
+    return f'<div class="metric-grid">{"".join(cards)}</div>'
+
+
 def render_customer_integral_overview(
     df_dimensiones: pd.DataFrame,
     servicios_activos: tuple[str, ...],
@@ -324,12 +372,7 @@ def render_service_details_dashboard(detalle_servicios: dict[str, dict[str, pd.D
                         for column in df.columns
                         if str(column).strip().lower() not in {"tipoidentificacion", "identificacion"}
                     ]
-                    for start in range(0, len(visible_columns), 4):
-                        current_columns = visible_columns[start:start + 4]
-                        cols = st.columns(4, gap="medium")
-                        for col, column_name in zip(cols, current_columns):
-                            with col:
-                                _render_metric_card(str(column_name), row.get(column_name))
+                    st.markdown(_metric_grid_html(row[visible_columns]), unsafe_allow_html=True)
 
 
 def render_contracts_summary(total_contracts: int, active_contracts: int) -> None:
@@ -354,26 +397,35 @@ def render_contracts_summary(total_contracts: int, active_contracts: int) -> Non
                 )
 
 
-def render_contracts_details(df_contracts: pd.DataFrame) -> None:
+def _render_contract_detail(row: pd.Series) -> None:
+    col1, col2 = st.columns(2, gap="large")
+    for col, fields in zip((col1, col2), (CONTRACT_DETAIL_FIELDS[:5], CONTRACT_DETAIL_FIELDS[5:])):
+        with col:
+            st.markdown(
+                "  \n".join(
+                    f"**{label}:** {row.get(column) if pd.notna(row.get(column)) else 'No disponible'}"
+                    for column, label in fields
+                )
+            )
+
+
+def render_contracts_details(df_contracts: pd.DataFrame, token: str = "") -> None:
     if df_contracts.empty:
         return
 
-    for _, row in df_contracts.iterrows():
-        contrato = row.get("Contrato", "Sin contrato")
-        estado = row.get("Estado", "Sin estado")
-        with st.expander(f"Contrato {contrato} | Estado: {estado}", expanded=False):
-            col1, col2 = st.columns(2, gap="large")
-            with col1:
-                st.markdown(f"**Contrato:** {contrato}")
-                st.markdown(f"**Estado:** {estado}")
-                st.markdown(f"**Categoría:** {row.get('Categoria', 'No disponible')}")
-                st.markdown(f"**Subcategoría:** {row.get('Subcategoria', 'No disponible')}")
-                st.markdown(f"**Dirección:** {row.get('Direccion', 'No disponible')}")
-            with col2:
-                st.markdown(f"**Barrio:** {row.get('Barrio', 'No disponible')}")
-                st.markdown(f"**Localidad:** {row.get('Localidad', 'No disponible')}")
-                st.markdown(f"**Departamento:** {row.get('Departamento', 'No disponible')}")
-                st.markdown(f"**Mercado:** {row.get('Mercado', 'No disponible')}")
+    st.caption("Selecciona un contrato para ver su detalle.")
+    render_paged_grid(
+        CONTRACTS_GRID_KEY,
+        token,
+        lambda: ArrowGridSource(
+            df_contracts.astype({column: "string" for column in df_contracts.select_dtypes("object").columns})
+        ),
+        default_sort="Contrato" if "Contrato" in df_contracts.columns else None,
+        default_descending=False,
+        page_size=CONTRACTS_PAGE_SIZE,
+        column_order=[column for column in CONTRACT_TABLE_COLUMNS if column in df_contracts.columns],
+        render_detail=_render_contract_detail,
+    )
 
 
 def render_contracts_section(df_contracts: pd.DataFrame) -> None:
@@ -2,7 +2,6 @@ import re
 from collections.abc import Iterable, Sequence
 
 import pandas as pd
-import streamlit as st
 
 from features.decisiones_estrategicas.models import (
     ConsolidarRequest,
@@ -20,6 +19,7 @@ from repositories.strategic_decisions_queries import (
     get_table_columns_query,
 )
 from services.databricks_conn import run_query
+from services.loader_cache import cached_loader
 
 
 EXCLUDED_KEY_COLUMNS = {"idcliente", "tipoidentificacion", "identificacion"}
@@ -75,12 +75,12 @@ def count_contract_items(value: object) -> int:
     return len(_extract_contract_items_from_value(value))
 
 
-@st.cache_data(ttl=3600)
+@cached_loader(ttl=3600, shared=False)
 def load_service_options(categoria: str) -> list[str]:
     return get_service_options(categoria)
 
 
-@st.cache_data(ttl=3600)
+@cached_loader(ttl=3600, shared=False)
 def load_table_columns(table_name: str) -> list[str]:
     df_columns = run_query(get_table_columns_query(table_name))
     if df_columns.empty:
@@ -101,7 +101,7 @@ def _build_variable_columns_map(request: ConsolidarRequest) -> dict[str, Sequenc
     return columns_map
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_consolidar_result(request: ConsolidarRequest) -> pd.DataFrame:
     variable_columns = _build_variable_columns_map(request)
     df = run_query(
@@ -122,7 +122,7 @@ def load_consolidar_result(request: ConsolidarRequest) -> pd.DataFrame:
     return df
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_recuperar_result(request: RecuperarRequest) -> pd.DataFrame:
     variable_columns: Sequence[str] = ()
     if request.servicio:
@@ -147,7 +147,7 @@ def load_recuperar_result(request: RecuperarRequest) -> pd.DataFrame:
     return df
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_fidelizar_result(request: FidelizarRequest) -> pd.DataFrame:
     variable_columns_ancla: Sequence[str] = ()
     variable_columns_objetivo: Sequence[str] = ()
@@ -192,7 +192,7 @@ def _build_variable_columns_map_for_services(
     return columns_map
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_potenciar_result(request: PotenciarRequest) -> pd.DataFrame:
     variable_columns = _build_variable_columns_map_for_services(request.categoria, request.servicios)
     df = run_query(
@@ -1,5 +1,3 @@
-import unicodedata
-
 import pandas as pd
 import streamlit as st
 
@@ -10,32 +8,51 @@ from features.decisiones_estrategicas.models import (
     PotenciarRequest,
     RecuperarRequest,
 )
+from core.paged_grid import ArrowGridSource, render_paged_grid
+from core.table_config import build_column_config, is_zero_to_one, with_score_level
+from services.lazy_export import LazyCsvExport
+from services.text_cleanup import strip_accents, strip_accents_columns
 
 
 def _normalize_column_name(name: str) -> str:
-    return "".join(
-        char for char in unicodedata.normalize("NFKD", name) if not unicodedata.combining(char)
-    ).replace(" ", "").lower()
+    return strip_accents(name).replace(" ", "").lower()
 
 
 def _prepare_download_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
 
-    df_download = df.copy()
-    for column in df_download.columns:
-        if _normalize_column_name(str(column)) == "tipoidentificacion":
-            df_download[column] = df_download[column].apply(
-                lambda value: "".join(
-                    char
-                    for char in unicodedata.normalize("NFKD", value)
-                    if not unicodedata.combining(char)
-                )
-                if isinstance(value, str)
-                else value
-            )
+    return strip_accents_columns(
+        df,
+        [column for column in df.columns if _normalize_column_name(str(column)) == "tipoidentificacion"],
+    )
+
+
+def _build_csv_export(export_name: str, request: object, df_resultado: pd.DataFrame) -> LazyCsvExport:
+    return LazyCsvExport(
+        export_name,
+        f"{export_name}:{request!r}",
+        lambda: _prepare_download_dataframe(df_resultado),
+    )
+
 
-    return df_download
+def _build_result_grid(df_resultado: pd.DataFrame, score_column: str) -> ArrowGridSource:
+    df_display = with_score_level(df_resultado, score_column)
+    progress_columns = []
+    if score_column in df_display.columns:
+        df_display[score_column] = pd.to_numeric(df_display[score_column], errors="coerce")
+        if is_zero_to_one(df_display[score_column]):
+            progress_columns.append(score_column)
+    return ArrowGridSource(df_display, build_column_config(df_display, progress_columns=progress_columns))
+
+
+def _render_result_table(grid_key: str, request: object, df_resultado: pd.DataFrame, score_column: str) -> None:
+    render_paged_grid(
+        grid_key,
+        repr(request),
+        lambda: _build_result_grid(df_resultado, score_column),
+        default_sort=score_column,
+    )
 
 
 def load_styles() -> None:
@@ -323,20 +340,16 @@ def render_consolidar_results(df_resultado: pd.DataFrame, request: ConsolidarReq
     st.success(f"Se encontraron {len(df_resultado)} clientes para la estrategia de consolidación.")
     _render_result_cards(df_resultado)
 
-    csv_data = _prepare_download_dataframe(df_resultado).to_csv(index=False).encode("utf-8")
     st.download_button(
         "Descargar listado (CSV)",
-        data=csv_data,
+        data=_build_csv_export("decisiones_consolidar", request, df_resultado),
         file_name=f"consolidacion_{request.categoria.lower()}.csv",
         mime="text/csv",
         key="decisiones_con_download",
+        on_click="ignore",
     )
 
-    st.dataframe(
-        df_resultado.style.background_gradient(subset=["Score_CON"], cmap="Oranges"),
-        use_container_width=True,
-        hide_index=True,
-    )
+    _render_result_table("decisiones_con_grid", request, df_resultado, "Score_CON")
 
 
 def render_recuperar_intro() -> None:
@@ -445,20 +458,16 @@ def render_recuperar_results(df_resultado: pd.DataFrame, request: RecuperarReque
                 unsafe_allow_html=True,
             )
 
-    csv_data = _prepare_download_dataframe(df_resultado).to_csv(index=False).encode("utf-8")
     st.download_button(
         "Descargar plan de acción (CSV)",
-        data=csv_data,
+        data=_build_csv_export("decisiones_recuperar", request, df_resultado),
         file_name=f"recuperacion_{request.servicio.lower()}_{request.categoria.lower()}.csv",
         mime="text/csv",
         key="decisiones_rec_download",
+        on_click="ignore",
     )
 
-    st.dataframe(
-        df_resultado.style.background_gradient(subset=["Score_REC"], cmap="Reds"),
-        use_container_width=True,
-        hide_index=True,
-    )
+    _render_result_table("decisiones_rec_grid", request, df_resultado, "Score_REC")
 
 
 def render_fidelizar_intro() -> None:
@@ -583,20 +592,16 @@ def render_fidelizar_results(df_resultado: pd.DataFrame, request: FidelizarReque
                 unsafe_allow_html=True,
             )
 
-    csv_data = _prepare_download_dataframe(df_resultado).to_csv(index=False).encode("utf-8")
     st.download_button(
         "Descargar listado (CSV)",
-        data=csv_data,
+        data=_build_csv_export("decisiones_fidelizar", request, df_resultado),
         file_name=f"fidelizacion_{request.categoria.lower()}.csv",
         mime="text/csv",
         key="decisiones_fid_download",
+        on_click="ignore",
     )
 
-    st.dataframe(
-        df_resultado.style.background_gradient(subset=["Score_FID"], cmap="Blues"),
-        use_container_width=True,
-        hide_index=True,
-    )
+    _render_result_table("decisiones_fid_grid", request, df_resultado, "Score_FID")
 
 
 def render_potenciar_intro() -> None:
@@ -708,20 +713,16 @@ def render_potenciar_results(df_resultado: pd.DataFrame, request: PotenciarReque
                 unsafe_allow_html=True,
             )
 
-    csv_data = _prepare_download_dataframe(df_resultado).to_csv(index=False).encode("utf-8")
     st.download_button(
         "Descargar resultados (CSV)",
-        data=csv_data,
+        data=_build_csv_export("decisiones_potenciar", request, df_resultado),
         file_name=f"potenciacion_{request.categoria.lower()}.csv",
         mime="text/csv",
         key="decisiones_pot_download",
+        on_click="ignore",
     )
 
-    st.dataframe(
-        df_resultado.style.background_gradient(subset=["Score_POT"], cmap="YlGn"),
-        use_container_width=True,
-        hide_index=True,
-    )
+    _render_result_table("decisiones_pot_grid", request, df_resultado, "Score_POT")
 
 
 def render_placeholder_strategy(title: str, description: str) -> None:
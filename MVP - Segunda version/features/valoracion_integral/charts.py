@@ -3,14 +3,12 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from core.profiling import profiled
 from features.valoracion_integral.formatters import human_format
+from services.figure_cache import cached_figure
 
 
-def render_penetracion_servicios_chart(df: pd.DataFrame) -> None:
-    if df.empty:
-        st.info("No hay datos para clientes por servicio.")
-        return
-
+def _build_penetracion_servicios_figure(df: pd.DataFrame) -> go.Figure:
     df = df.copy()
     df["clientes"] = df["clientes"].fillna(0)
     df = df.sort_values("clientes", ascending=True)
@@ -51,14 +49,20 @@ def render_penetracion_servicios_chart(df: pd.DataFrame) -> None:
         bargap=0.28,
     )
 
-    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+    return fig
 
 
-def render_numero_servicios_chart(df: pd.DataFrame) -> None:
+@profiled("render")
+def render_penetracion_servicios_chart(df: pd.DataFrame) -> None:
     if df.empty:
-        st.info("No hay datos para número de servicios por cliente.")
+        st.info("No hay datos para clientes por servicio.")
         return
 
+    fig = cached_figure("penetracion_servicios", df, _build_penetracion_servicios_figure)
+    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+
+
+def _build_numero_servicios_figure(df: pd.DataFrame) -> go.Figure:
     df = df.copy()
     df["NumeroServicios"] = df["NumeroServicios"].astype(int)
     df["clientes"] = df["clientes"].fillna(0)
@@ -108,14 +112,20 @@ def render_numero_servicios_chart(df: pd.DataFrame) -> None:
         ),
     )
 
-    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+    return fig
 
 
-def render_combinaciones_servicios_chart(df: pd.DataFrame) -> None:
+@profiled("render")
+def render_numero_servicios_chart(df: pd.DataFrame) -> None:
     if df.empty:
-        st.info("No hay datos para combinaciones de servicios.")
+        st.info("No hay datos para número de servicios por cliente.")
         return
 
+    fig = cached_figure("numero_servicios", df, _build_numero_servicios_figure)
+    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+
+
+def _build_combinaciones_servicios_figure(df: pd.DataFrame) -> go.Figure:
     df = df.copy()
     df["clientes"] = df["clientes"].fillna(0)
     df = df.sort_values("clientes", ascending=True)
@@ -144,14 +154,20 @@ def render_combinaciones_servicios_chart(df: pd.DataFrame) -> None:
         bargap=0.22,
     )
 
-    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+    return fig
 
 
-def render_clientes_mayor_aporte_chart(df: pd.DataFrame) -> None:
+@profiled("render")
+def render_combinaciones_servicios_chart(df: pd.DataFrame) -> None:
     if df.empty:
-        st.info("No hay datos para clientes con mayor aporte.")
+        st.info("No hay datos para combinaciones de servicios.")
         return
 
+    fig = cached_figure("combinaciones_servicios", df, _build_combinaciones_servicios_figure)
+    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+
+
+def _build_clientes_mayor_aporte_figure(df: pd.DataFrame) -> go.Figure:
     df = df.copy()
     df["AporteTotal"] = df["AporteTotal"].fillna(0)
     df = df.sort_values("AporteTotal", ascending=True)
@@ -185,14 +201,20 @@ def render_clientes_mayor_aporte_chart(df: pd.DataFrame) -> None:
         bargap=0.22,
     )
 
-    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+    return fig
 
 
-def render_clasificacion_distribution_chart(df: pd.DataFrame) -> None:
+@profiled("render")
+def render_clientes_mayor_aporte_chart(df: pd.DataFrame) -> None:
     if df.empty:
-        st.info("No hay datos de clasificación integral.")
+        st.info("No hay datos para clientes con mayor aporte.")
         return
 
+    fig = cached_figure("clientes_mayor_aporte", df, _build_clientes_mayor_aporte_figure)
+    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+
+
+def _build_clasificacion_distribution_figure(df: pd.DataFrame) -> go.Figure:
     df = df.copy()
     df["clientes"] = df["clientes"].fillna(0)
 
@@ -247,14 +269,20 @@ def render_clasificacion_distribution_chart(df: pd.DataFrame) -> None:
         bargap=0.22,
     )
 
-    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+    return fig
 
 
-def render_clasificacion_temporal_chart(df: pd.DataFrame) -> None:
+@profiled("render")
+def render_clasificacion_distribution_chart(df: pd.DataFrame) -> None:
     if df.empty:
-        st.info("No hay datos temporales de clasificación.")
+        st.info("No hay datos de clasificación integral.")
         return
 
+    fig = cached_figure("clasificacion_distribution", df, _build_clasificacion_distribution_figure)
+    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+
+
+def _build_clasificacion_temporal_figure(df: pd.DataFrame) -> go.Figure:
     color_map = {
         "Premium multiservicio": "#C4D600",
         "Top en su servicio": "#0B74C8",
@@ -291,14 +319,20 @@ def render_clasificacion_temporal_chart(df: pd.DataFrame) -> None:
         legend=dict(orientation="h", y=-0.2, x=0, font=dict(size=11)),
     )
 
-    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+    return fig
 
 
-def render_service_classification_chart(df: pd.DataFrame) -> None:
+@profiled("render")
+def render_clasificacion_temporal_chart(df: pd.DataFrame) -> None:
     if df.empty:
-        st.info("No hay datos de clasificación por servicio.")
+        st.info("No hay datos temporales de clasificación.")
         return
 
+    fig = cached_figure("clasificacion_temporal", df, _build_clasificacion_temporal_figure)
+    st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
+
+
+def _build_service_classification_figure(df: pd.DataFrame) -> go.Figure:
     df = df.copy()
     df["clientes"] = df["clientes"].fillna(0)
     df = df.sort_values("clientes", ascending=True)
@@ -327,4 +361,14 @@ def render_service_classification_chart(df: pd.DataFrame) -> None:
         bargap=0.22,
     )
 
+    return fig
+
+
+@profiled("render")
+def render_service_classification_chart(df: pd.DataFrame) -> None:
+    if df.empty:
+        st.info("No hay datos de clasificación por servicio.")
+        return
+
+    fig = cached_figure("service_classification", df, _build_service_classification_figure)
     st.plotly_chart(fig, width='stretch', config={"displayModeBar": False})
@@ -1,8 +1,12 @@
 ﻿import pandas as pd
-import streamlit as st
 
 from features.valoracion_integral.models import DashboardFilters
 from repositories.dashboard_queries import (
+    COMPACT_IN_THRESHOLD,
+    UBICACION_KEY_COLUMN,
+    UBICACION_KEYED_COLUMNS,
+    FilterValues,
+    compact_filter_values,
     get_clientes_mayor_aporte_query,
     get_clasificacion_integral_distribution_query,
     get_clasificacion_integral_query,
@@ -16,68 +20,100 @@ from repositories.dashboard_queries import (
     get_penetracion_servicios_query,
     get_service_classification_query,
     get_service_classification_profile_query,
+    get_ubicacion_keys_query,
 )
 from services.databricks_conn import run_query
+from services.loader_cache import cached_loader
 
 TABLE_PREVIEW_LIMIT = 100
 
 
-def _filters_kwargs(filters: DashboardFilters) -> dict[str, list[str] | str]:
+def _location_filters_kwargs(filters: DashboardFilters) -> dict[str, FilterValues]:
+    selections = {
+        "departamento": filters.departamentos,
+        "localidad": filters.localidades,
+        "barrio": filters.barrios,
+    }
+    key_lookups: dict[str, dict[str, tuple[int, ...]]] = {}
+    if any(len(values) > COMPACT_IN_THRESHOLD for values in selections.values()):
+        key_lookups = load_ubicacion_keys()
+
     return {
-        "categoria": filters.categoria,
-        "departamentos": list(filters.departamentos),
-        "localidades": list(filters.localidades),
-        "barrios": list(filters.barrios),
+        "departamentos": compact_filter_values("departamento", filters.departamentos, key_lookups.get("departamento")),
+        "localidades": compact_filter_values("localidad", filters.localidades, key_lookups.get("localidad")),
+        "barrios": compact_filter_values("barrio", filters.barrios, key_lookups.get("barrio")),
         "mercados": list(filters.mercados),
     }
 
 
-@st.cache_data(ttl=3600)
+def _filters_kwargs(filters: DashboardFilters) -> dict[str, FilterValues | str]:
+    return {
+        "categoria": filters.categoria,
+        **_location_filters_kwargs(filters),
+    }
+
+
+@cached_loader(ttl=3600, shared=False)
+def load_ubicacion_keys() -> dict[str, dict[str, tuple[int, ...]]]:
+    df_keys = run_query(get_ubicacion_keys_query())
+    if df_keys.empty:
+        return {}
+    df_keys[UBICACION_KEY_COLUMN] = df_keys[UBICACION_KEY_COLUMN].astype(int)
+    return {
+        column: {
+            str(value): tuple(sorted(keys))
+            for value, keys in df_keys.groupby(column)[UBICACION_KEY_COLUMN]
+        }
+        for column in UBICACION_KEYED_COLUMNS
+    }
+
+
+@cached_loader(ttl=3600)
 def load_filter_options() -> pd.DataFrame:
     return run_query(get_filter_options_query())
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_kpis(filters: DashboardFilters) -> pd.DataFrame:
     return run_query(get_kpis_query(**_filters_kwargs(filters)))
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_penetracion_servicios(filters: DashboardFilters) -> pd.DataFrame:
     return run_query(get_penetracion_servicios_query(**_filters_kwargs(filters)))
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_numero_servicios(filters: DashboardFilters) -> pd.DataFrame:
     return run_query(get_numero_servicios_query(**_filters_kwargs(filters)))
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_combinaciones_servicios(filters: DashboardFilters) -> pd.DataFrame:
     return run_query(get_combinaciones_servicios_query(**_filters_kwargs(filters)))
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300, shared=False)
 def load_clientes_mayor_aporte(filters: DashboardFilters) -> pd.DataFrame:
     return run_query(get_clientes_mayor_aporte_query(**_filters_kwargs(filters)))
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_clasificacion_integral(filters: DashboardFilters) -> pd.DataFrame:
     return run_query(get_clasificacion_integral_query(**_filters_kwargs(filters)))
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_clasificacion_integral_distribution(filters: DashboardFilters) -> pd.DataFrame:
     return run_query(get_clasificacion_integral_distribution_query(**_filters_kwargs(filters)))
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_clasificacion_integral_temporal(filters: DashboardFilters) -> pd.DataFrame:
     return run_query(get_clasificacion_integral_temporal_query(**_filters_kwargs(filters)))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_consolidado_general(
     filters: DashboardFilters,
     limit: int | None = TABLE_PREVIEW_LIMIT,
@@ -85,7 +121,7 @@ def load_consolidado_general(
     return run_query(get_consolidado_general_query(**_filters_kwargs(filters), limit=limit))
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_loader(ttl=300, show_spinner=False, shared=False)
 def load_detalle_servicio(
     filters: DashboardFilters,
     servicio: str,
@@ -97,38 +133,29 @@ def load_detalle_servicio(
             servicio=servicio,
             categoria=filters.categoria,
             tipo_detalle=tipo_detalle,
-            departamentos=list(filters.departamentos),
-            localidades=list(filters.localidades),
-            barrios=list(filters.barrios),
-            mercados=list(filters.mercados),
+            **_location_filters_kwargs(filters),
             limit=limit,
         )
     )
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_service_classification(filters: DashboardFilters, servicio: str) -> pd.DataFrame:
     return run_query(
         get_service_classification_query(
             categoria=filters.categoria,
             servicio=servicio,
-            departamentos=list(filters.departamentos),
-            localidades=list(filters.localidades),
-            barrios=list(filters.barrios),
-            mercados=list(filters.mercados),
+            **_location_filters_kwargs(filters),
         )
     )
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_service_classification_profile(filters: DashboardFilters, servicio: str) -> pd.DataFrame:
     return run_query(
         get_service_classification_profile_query(
             categoria=filters.categoria,
             servicio=servicio,
-            departamentos=list(filters.departamentos),
-            localidades=list(filters.localidades),
-            barrios=list(filters.barrios),
-            mercados=list(filters.mercados),
+            **_location_filters_kwargs(filters),
         )
     )
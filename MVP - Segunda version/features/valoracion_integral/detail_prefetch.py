@@ -0,0 +1,63 @@
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+
+from features.valoracion_integral.models import DetailSelection
+
+
+MAX_TRACKED_SELECTIONS = 64
+
+
+class DetailTransitions:
+    def __init__(self, max_sources: int = MAX_TRACKED_SELECTIONS) -> None:
+        self.max_sources = max_sources
+        self._counts: OrderedDict[DetailSelection, Counter[DetailSelection]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, previous: DetailSelection | None, current: DetailSelection) -> None:
+        if previous is None or previous == current:
+            return
+        with self._lock:
+            counts = self._counts.setdefault(previous, Counter())
+            counts[current] += 1
+            self._counts.move_to_end(previous)
+            while len(self._counts) > self.max_sources:
+                self._counts.popitem(last=False)
+
+    def most_likely(
+        self,
+        current: DetailSelection,
+        candidates: Sequence[DetailSelection],
+    ) -> DetailSelection | None:
+        with self._lock:
+            counts = self._counts.get(current)
+            if not counts:
+                return None
+            ranked = counts.most_common()
+        allowed = set(candidates)
+        return next((selection for selection, _ in ranked if selection in allowed), None)
+
+
+def default_next_selection(
+    current: DetailSelection,
+    servicios: Sequence[str],
+    tipos: Sequence[str],
+) -> DetailSelection:
+    tipo_index = tipos.index(current.tipo)
+    if tipo_index + 1 < len(tipos):
+        return DetailSelection(current.servicio, tipos[tipo_index + 1])
+    servicio_index = servicios.index(current.servicio)
+    return DetailSelection(servicios[(servicio_index + 1) % len(servicios)], tipos[0])
+
+
+def predict_next_selection(
+    current: DetailSelection,
+    servicios: Sequence[str],
+    tipos: Sequence[str],
+    transitions: DetailTransitions,
+) -> DetailSelection:
+    candidates = [DetailSelection(servicio, tipo) for servicio in servicios for tipo in tipos]
+    return transitions.most_likely(current, candidates) or default_next_selection(current, servicios, tipos)
+
+
+DETAIL_TRANSITIONS = DetailTransitions()
@@ -31,3 +31,9 @@ class DashboardFilters:
             "localidades": list(self.localidades),
             "barrios": list(self.barrios),
         }
+
+
+@dataclass(frozen=True)
+class DetailSelection:
+    servicio: str
+    tipo: str
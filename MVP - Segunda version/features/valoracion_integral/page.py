@@ -10,6 +10,7 @@ from features.valoracion_integral.data import (
     load_penetracion_servicios,
 )
 from features.valoracion_integral.filters import render_filters_form
+from features.valoracion_integral.models import DashboardFilters
 from features.valoracion_integral.sections import (
     load_styles,
     render_consolidado_section,
@@ -22,36 +23,52 @@ from features.valoracion_integral.sections import (
 from features.valoracion_integral.state import get_filters, initialize_state, update_filters
 
 
-def render() -> None:
-    initialize_state()
-    load_styles()
-    render_header()
-
+@st.fragment
+def render_filters_panel() -> None:
     current_filters = get_filters()
     df_options = load_filter_options()
     updated_filters = render_filters_form(df_options, current_filters)
 
     if updated_filters != current_filters:
         update_filters(updated_filters)
+        st.rerun(scope="app")
 
-    filters = get_filters()
-    df_kpis = load_kpis(filters)
 
-    if df_kpis.empty:
-        st.warning("No se encontraron datos para los filtros seleccionados.")
-        return
+@st.fragment
+def render_penetracion_panel(filters: DashboardFilters) -> None:
+    render_penetracion_section(load_penetracion_servicios(filters), load_numero_servicios(filters))
 
-    render_kpis(df_kpis)
 
-    df_penetracion = load_penetracion_servicios(filters)
-    df_num_servicios = load_numero_servicios(filters)
-    render_penetracion_section(df_penetracion, df_num_servicios)
+@st.fragment
+def render_indicadores_panel(filters: DashboardFilters) -> None:
+    render_nuevos_indicadores_section(load_combinaciones_servicios(filters), load_clientes_mayor_aporte(filters))
 
-    df_combinaciones = load_combinaciones_servicios(filters)
-    df_aporte = load_clientes_mayor_aporte(filters)
-    render_nuevos_indicadores_section(df_combinaciones, df_aporte)
 
+@st.fragment
+def render_classification_panel(filters: DashboardFilters) -> None:
     render_service_classification_section(filters)
 
-    df_consolidado = load_consolidado_general(filters)
-    render_consolidado_section(df_consolidado, filters)
+
+@st.fragment
+def render_consolidado_panel(filters: DashboardFilters) -> None:
+    render_consolidado_section(load_consolidado_general(filters), filters)
+
+
+def render() -> None:
+    initialize_state()
+    load_styles()
+    render_header()
+
+    render_filters_panel()
+
+    filters = get_filters()
+    df_kpis = load_kpis(filters)
+    if df_kpis.empty:
+        st.warning("No se encontraron datos para los filtros seleccionados.")
+        return
+
+    render_kpis(df_kpis)
+    render_penetracion_panel(filters)
+    render_indicadores_panel(filters)
+    render_classification_panel(filters)
+    render_consolidado_panel(filters)
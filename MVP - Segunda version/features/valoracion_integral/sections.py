@@ -1,7 +1,13 @@
-﻿import pandas as pd
+﻿from collections.abc import Callable
+
+import pandas as pd
 import streamlit as st
-import unicodedata
 
+from core.lazy_tabs import LazyTab, render_lazy_tabs_fragment
+from core.prefetch import prefetch
+from core.profiling import profiled
+from core.session_storage import SessionFrameStore, get_frame_store
+from core.table_config import build_column_config
 from features.valoracion_integral.charts import (
     render_clientes_mayor_aporte_chart,
     render_clasificacion_distribution_chart,
@@ -18,8 +24,12 @@ from features.valoracion_integral.data import (
     load_service_classification,
     load_service_classification_profile,
 )
+from features.valoracion_integral.detail_prefetch import DETAIL_TRANSITIONS, predict_next_selection
 from features.valoracion_integral.formatters import format_millions, format_number
-from features.valoracion_integral.models import DashboardFilters
+from features.valoracion_integral.models import DashboardFilters, DetailSelection
+from features.valoracion_integral.state import swap_detail_selection
+from services.lazy_export import LazyCsvExport
+from services.text_cleanup import strip_accents, strip_accents_columns
 
 
 CONSOLIDADO_SERVICE_LABELS = {
@@ -39,6 +49,7 @@ CONSOLIDADO_SERVICE_LABELS = {
 }
 
 CONSOLIDADO_SECTION_HEIGHT = 700
+CLASSIFIED_SERVICES = ("brilla",)
 
 
 def load_styles() -> None:
@@ -149,6 +160,7 @@ def load_styles() -> None:
     )
 
 
+@profiled("render")
 def render_header() -> None:
     st.markdown(
         """
@@ -173,6 +185,7 @@ def _render_section_header(title: str, subtitle: str) -> None:
     )
 
 
+@profiled("render")
 def render_kpi_card(title: str, value: str, icon: str) -> None:
     st.markdown(
         f"""
@@ -188,6 +201,7 @@ def render_kpi_card(title: str, value: str, icon: str) -> None:
     )
 
 
+@profiled("render")
 def render_kpis(df_kpis: pd.DataFrame) -> None:
     row = df_kpis.iloc[0]
     col1, col2, col3, col4 = st.columns(4)
@@ -210,6 +224,7 @@ def render_kpis(df_kpis: pd.DataFrame) -> None:
         )
 
 
+@profiled("render")
 def render_penetracion_section(df_penetracion: pd.DataFrame, df_num_servicios: pd.DataFrame) -> None:
     col1, col2 = st.columns(2, gap="large")
 
@@ -230,6 +245,7 @@ def render_penetracion_section(df_penetracion: pd.DataFrame, df_num_servicios: p
             render_numero_servicios_chart(df_num_servicios)
 
 
+@profiled("render")
 def render_nuevos_indicadores_section(
     df_combinaciones: pd.DataFrame,
     df_aporte: pd.DataFrame,
@@ -253,6 +269,7 @@ def render_nuevos_indicadores_section(
             render_clientes_mayor_aporte_chart(df_aporte)
 
 
+@profiled("render")
 def render_clasificacion_section(df_distribution: pd.DataFrame, df_temporal: pd.DataFrame) -> None:
     col1, col2 = st.columns(2, gap="large")
 
@@ -283,6 +300,7 @@ def render_clasificacion_section(df_distribution: pd.DataFrame, df_temporal: pd.
             render_clasificacion_temporal_chart(df_temporal)
 
 
+@profiled("render")
 def render_service_classification_section(filters: DashboardFilters) -> None:
     categoria = filters.categoria
     if categoria == "Residencial":
@@ -307,44 +325,71 @@ def render_service_classification_section(filters: DashboardFilters) -> None:
             "Distribución y perfil promedio de clasificación para cada servicio disponible.",
         )
 
-        for service_tab, (servicio, servicio_label) in zip(st.tabs([label for _, label in servicios]), servicios):
-            with service_tab:
-                if servicio != "brilla":
-                    st.info(f"Aún no hay clasificación disponible para {servicio_label}.")
-                    continue
-
-                df_clasificacion = load_service_classification(filters, servicio)
-                total_clientes = int(df_clasificacion["clientes"].sum()) if not df_clasificacion.empty else 0
-                df_profile = load_service_classification_profile(filters, servicio)
-
-                col1, col2 = st.columns([1.55, 1], gap="large")
-
-                with col1:
-                    with st.container(border=True):
-                        _render_section_header(
-                            f"Distribución - {servicio_label}",
-                            "Clasificación RFM de los clientes filtrados dentro del servicio.",
-                        )
-                        summary_col, _ = st.columns([0.52, 0.48], gap="medium")
-                        with summary_col:
-                            st.markdown(
-                                f"""
-                                <div class="search-summary-card" style="margin-bottom:0.5rem;">
-                                    <div class="search-summary-label">Total clientes del servicio</div>
-                                    <div class="search-summary-value" style="font-size:1.9rem;">{format_millions(total_clientes)}</div>
-                                </div>
-                                """,
-                                unsafe_allow_html=True,
-                            )
-                        render_service_classification_chart(df_clasificacion)
-
-                with col2:
-                    with st.container(border=True):
-                        _render_section_header(
-                            f"Perfil promedio - {servicio_label}",
-                            "Promedio de las dimensiones de los clientes en este servicio.",
-                        )
-                        _render_service_profile_average(df_profile)
+        render_lazy_tabs_fragment(
+            [
+                LazyTab(
+                    tab_id=servicio,
+                    label=servicio_label,
+                    render=lambda s=servicio, label=servicio_label: _render_service_classification_tab(
+                        filters, s, label
+                    ),
+                    prefetch=(
+                        (lambda s=servicio: _load_service_classification_tab(filters, s))
+                        if servicio in CLASSIFIED_SERVICES
+                        else None
+                    ),
+                )
+                for servicio, servicio_label in servicios
+            ],
+            key=f"dashboard_clasificacion_tab_{categoria}",
+            prefetch_ids=CLASSIFIED_SERVICES,
+            prefetch_token=str(hash(filters)),
+        )
+
+
+def _load_service_classification_tab(filters: DashboardFilters, servicio: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    return (
+        load_service_classification(filters, servicio),
+        load_service_classification_profile(filters, servicio),
+    )
+
+
+def _render_service_classification_tab(filters: DashboardFilters, servicio: str, servicio_label: str) -> None:
+    if servicio not in CLASSIFIED_SERVICES:
+        st.info(f"Aún no hay clasificación disponible para {servicio_label}.")
+        return
+
+    df_clasificacion, df_profile = _load_service_classification_tab(filters, servicio)
+    total_clientes = int(df_clasificacion["clientes"].sum()) if not df_clasificacion.empty else 0
+
+    col1, col2 = st.columns([1.55, 1], gap="large")
+
+    with col1:
+        with st.container(border=True):
+            _render_section_header(
+                f"Distribución - {servicio_label}",
+                "Clasificación RFM de los clientes filtrados dentro del servicio.",
+            )
+            summary_col, _ = st.columns([0.52, 0.48], gap="medium")
+            with summary_col:
+                st.markdown(
+                    f"""
+                    <div class="search-summary-card" style="margin-bottom:0.5rem;">
+                        <div class="search-summary-label">Total clientes del servicio</div>
+                        <div class="search-summary-value" style="font-size:1.9rem;">{format_millions(total_clientes)}</div>
+                    </div>
+                    """,
+                    unsafe_allow_html=True,
+                )
+            render_service_classification_chart(df_clasificacion)
+
+    with col2:
+        with st.container(border=True):
+            _render_section_header(
+                f"Perfil promedio - {servicio_label}",
+                "Promedio de las dimensiones de los clientes en este servicio.",
+            )
+            _render_service_profile_average(df_profile)
 
 
 def _render_summary_metric_card(title: str, value: object) -> None:
@@ -414,8 +459,7 @@ def _render_service_profile_average(df_profile: pd.DataFrame) -> None:
 
 
 def _normalize_column_name(value: str) -> str:
-    normalized = unicodedata.normalize("NFKD", value)
-    return "".join(char for char in normalized if not unicodedata.combining(char)).lower()
+    return strip_accents(value).lower()
 
 
 def _rename_columns_by_normalized_name(df: pd.DataFrame, rename_map: dict[str, str]) -> pd.DataFrame:
@@ -428,52 +472,29 @@ def _rename_columns_by_normalized_name(df: pd.DataFrame, rename_map: dict[str, s
     )
 
 
+def _get_tipo_identificacion_columns(df: pd.DataFrame) -> list[object]:
+    return [column for column in df.columns if _normalize_column_name(str(column)) == "tipoidentificacion"]
+
+
+@profiled("format")
 def _prepare_consolidado_download_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
 
-    df = df.copy()
-    df.columns = [
-        "".join(
-            char
-            for char in unicodedata.normalize("NFKD", str(column))
-            if not unicodedata.combining(char)
-        )
-        for column in df.columns
-    ]
-    for column in df.columns:
-        if _normalize_column_name(str(column)) == "tipoidentificacion":
-            df[column] = df[column].apply(
-                lambda value: "".join(
-                    char
-                    for char in unicodedata.normalize("NFKD", value)
-                    if not unicodedata.combining(char)
-                )
-                if isinstance(value, str)
-                else value
-            )
-    return df
+    df = df.copy(deep=False)
+    df.columns = [strip_accents(str(column)) for column in df.columns]
+    return strip_accents_columns(df, _get_tipo_identificacion_columns(df))
 
 
+@profiled("format")
 def _prepare_detalle_download_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
 
-    df = df.copy()
-    for column in df.columns:
-        if _normalize_column_name(str(column)) == "tipoidentificacion":
-            df[column] = df[column].apply(
-                lambda value: "".join(
-                    char
-                    for char in unicodedata.normalize("NFKD", value)
-                    if not unicodedata.combining(char)
-                )
-                if isinstance(value, str)
-                else value
-            )
-    return df
+    return strip_accents_columns(df, _get_tipo_identificacion_columns(df))
 
 
+@profiled("format")
 def _format_consolidado_dataframe(df: pd.DataFrame, categoria: str) -> pd.DataFrame:
     if df.empty:
         return df
@@ -490,8 +511,7 @@ def _format_consolidado_dataframe(df: pd.DataFrame, categoria: str) -> pd.DataFr
 
     for col in CONSOLIDADO_SERVICE_LABELS[categoria].values():
         if col in df.columns:
-            numeric_values = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
-            df[col] = numeric_values.apply(lambda value: "✅" if value == 1 else "❌")
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int) == 1
 
     return df
 
@@ -516,52 +536,51 @@ def _get_zero_to_one_columns(df: pd.DataFrame, excluded_columns: list[str] | Non
     return valid_columns
 
 
-def _style_consolidado_dataframe(df: pd.DataFrame, categoria: str):
-    service_columns = [
-        column for column in CONSOLIDADO_SERVICE_LABELS[categoria].values() if column in df.columns
-    ]
-    numeric_columns = [column for column in _get_numeric_columns(df) if column not in service_columns]
-
-    def service_cell_style(value: object) -> str:
-        if value == "✅":
-            return "background-color: #e8f7ee; color: #166534; font-weight: 600; text-align: center;"
-        if value == "❌":
-            return "background-color: #fdecec; color: #b42318; font-weight: 600; text-align: center;"
-        return ""
-
-    styled = df.style
-    if service_columns:
-        styled = styled.map(service_cell_style, subset=service_columns)
-    if numeric_columns:
-        styled = styled.format("{:.2f}", subset=numeric_columns)
-
-    return styled.set_properties(
-        **{
-            "border-color": "#e7edf3",
-            "font-size": "0.92rem",
-        }
-    )
-
-
-def _style_detalle_dataframe(df: pd.DataFrame, tipo_detalle: str):
-    excluded_columns = [
+def _get_identifier_columns(df: pd.DataFrame) -> list[str]:
+    return [
         column
         for column in df.columns
         if _normalize_column_name(str(column)) in {"tipoidentificacion", "identificacion"}
     ]
-    numeric_columns = _get_numeric_columns(df)
-    styled = df.style
-    if numeric_columns:
-        styled = styled.format("{:.2f}", subset=numeric_columns)
-
-    return styled.set_properties(
-        **{
-            "border-color": "#e7edf3",
-            "font-size": "0.92rem",
-        }
+
+
+@profiled("format")
+def _consolidado_column_config(df: pd.DataFrame, categoria: str) -> dict[str, object]:
+    return build_column_config(
+        df,
+        checkbox_columns=[
+            column for column in CONSOLIDADO_SERVICE_LABELS[categoria].values() if column in df.columns
+        ],
+        text_columns=_get_identifier_columns(df),
+    )
+
+
+@profiled("format")
+def _detalle_column_config(df: pd.DataFrame) -> dict[str, object]:
+    identifier_columns = _get_identifier_columns(df)
+    return build_column_config(
+        df,
+        progress_columns=[
+            column
+            for column in _get_zero_to_one_columns(df, identifier_columns)
+            if pd.api.types.is_float_dtype(df[column].dtype)
+        ],
+        text_columns=identifier_columns,
     )
 
 
+def _stored_frame(
+    store: SessionFrameStore,
+    cache_key: str,
+    reload: Callable[[], pd.DataFrame],
+) -> Callable[[], pd.DataFrame]:
+    def load() -> pd.DataFrame:
+        df_download = store.get(cache_key)
+        return reload() if df_download is None else df_download
+
+    return load
+
+
 @st.fragment
 def _render_lazy_download_button(
     *,
@@ -572,15 +591,19 @@ def _render_lazy_download_button(
     query_loader,
     formatter,
 ) -> None:
+    store = get_frame_store()
     if st.button(button_label, key=f"{cache_key}_prepare"):
         with st.spinner("Consultando la tabla completa para descarga..."):
-            st.session_state[cache_key] = formatter(query_loader())
+            store.put(cache_key, formatter(query_loader()))
 
-    cached_df = st.session_state.get(cache_key)
-    if cached_df is not None:
+    if cache_key in store:
         st.download_button(
             download_label,
-            cached_df.to_csv(index=False).encode("utf-8"),
+            LazyCsvExport(
+                file_name.removesuffix(".csv"),
+                cache_key,
+                _stored_frame(store, cache_key, lambda: formatter(query_loader())),
+            ),
             file_name,
             "text/csv",
             key=f"{cache_key}_download",
@@ -588,6 +611,7 @@ def _render_lazy_download_button(
         )
 
 
+@profiled("render")
 def render_consolidado_section(
     df_consolidado: pd.DataFrame,
     filters: DashboardFilters,
@@ -608,7 +632,8 @@ def render_consolidado_section(
             else:
                 st.caption(f"Mostrando top {TABLE_PREVIEW_LIMIT} registros para cuidar memoria.")
                 st.dataframe(
-                    _style_consolidado_dataframe(df_consolidado_fmt, categoria),
+                    df_consolidado_fmt,
+                    column_config=_consolidado_column_config(df_consolidado_fmt, categoria),
                     width='stretch',
                     height=420,
                 )
@@ -649,37 +674,78 @@ def render_consolidado_section(
                 ("Variables", "variables"),
             ]
 
-            for servicio_tab, (servicio, servicio_label) in zip(st.tabs([label for _, label in servicios]), servicios):
-                with servicio_tab:
-                    for tipo_tab, (tipo_label, tipo_value) in zip(st.tabs([label for label, _ in tipos]), tipos):
-                        with tipo_tab:
-                            df_detalle = load_detalle_servicio(
-                                filters=filters,
-                                servicio=servicio,
-                                tipo_detalle=tipo_value,
-                            )
-
-                            if df_detalle.empty:
-                                st.info("No hay detalle disponible para esta combinación.")
-                            else:
-                                st.caption(f"Mostrando top {TABLE_PREVIEW_LIMIT} registros para cuidar memoria.")
-                                st.dataframe(
-                                    _style_detalle_dataframe(df_detalle, tipo_value),
-                                    width='stretch',
-                                    height=380,
-                                )
-                                _render_lazy_download_button(
-                                    button_label="Preparar descarga completa",
-                                    download_label="Descargar CSV completo",
-                                    cache_key=(
-                                        f"detalle_full_{categoria}_{servicio}_{tipo_value}_{hash(filters)}"
-                                    ),
-                                    file_name=f"{servicio}_{tipo_value}.csv",
-                                    query_loader=lambda s=servicio, t=tipo_value: load_detalle_servicio(
-                                        filters=filters,
-                                        servicio=s,
-                                        tipo_detalle=t,
-                                        limit=None,
-                                    ),
-                                    formatter=_prepare_detalle_download_dataframe,
-                                )
+            _render_detalle_viewer(filters, servicios, tipos)
+
+
+@st.fragment
+def _render_detalle_viewer(
+    filters: DashboardFilters,
+    servicios: list[tuple[str, str]],
+    tipos: list[tuple[str, str]],
+) -> None:
+    categoria = filters.categoria
+    servicio_labels = dict(servicios)
+    tipo_labels = {tipo_value: tipo_label for tipo_label, tipo_value in tipos}
+
+    servicio_col, tipo_col = st.columns([1.4, 1], gap="small")
+    with servicio_col:
+        servicio = st.radio(
+            "Servicio",
+            list(servicio_labels),
+            format_func=servicio_labels.get,
+            key=f"dashboard_detalle_servicio_{categoria}",
+            horizontal=True,
+        )
+    with tipo_col:
+        tipo_value = st.radio(
+            "Tipo de detalle",
+            list(tipo_labels),
+            format_func=tipo_labels.get,
+            key=f"dashboard_detalle_tipo_{categoria}",
+            horizontal=True,
+        )
+
+    selection = DetailSelection(servicio, tipo_value)
+    DETAIL_TRANSITIONS.record(swap_detail_selection(selection), selection)
+    _render_detalle_tab(filters, servicio, tipo_value)
+
+    predicted = predict_next_selection(selection, list(servicio_labels), list(tipo_labels), DETAIL_TRANSITIONS)
+    prefetch(
+        "detalle_servicio",
+        f"detalle_servicio:{predicted.servicio}:{predicted.tipo}:{hash(filters)}",
+        lambda: load_detalle_servicio(filters=filters, servicio=predicted.servicio, tipo_detalle=predicted.tipo),
+    )
+
+
+def _render_detalle_tab(filters: DashboardFilters, servicio: str, tipo_value: str) -> None:
+    categoria = filters.categoria
+    df_detalle = load_detalle_servicio(
+        filters=filters,
+        servicio=servicio,
+        tipo_detalle=tipo_value,
+    )
+
+    if df_detalle.empty:
+        st.info("No hay detalle disponible para esta combinación.")
+        return
+
+    st.caption(f"Mostrando top {TABLE_PREVIEW_LIMIT} registros para cuidar memoria.")
+    st.dataframe(
+        df_detalle,
+        column_config=_detalle_column_config(df_detalle),
+        width='stretch',
+        height=380,
+    )
+    _render_lazy_download_button(
+        button_label="Preparar descarga completa",
+        download_label="Descargar CSV completo",
+        cache_key=f"detalle_full_{categoria}_{servicio}_{tipo_value}_{hash(filters)}",
+        file_name=f"{servicio}_{tipo_value}.csv",
+        query_loader=lambda: load_detalle_servicio(
+            filters=filters,
+            servicio=servicio,
+            tipo_detalle=tipo_value,
+            limit=None,
+        ),
+        formatter=_prepare_detalle_download_dataframe,
+    )
@@ -1,9 +1,10 @@
 ﻿import streamlit as st
 
-from features.valoracion_integral.models import DashboardFilters
+from features.valoracion_integral.models import DashboardFilters, DetailSelection
 
 
 FILTERS_KEY = "dashboard_filters_applied"
+DETAIL_SELECTION_KEY = "dashboard_detalle_selection"
 
 
 def initialize_state() -> None:
@@ -18,3 +19,9 @@ def get_filters() -> DashboardFilters:
 
 def update_filters(filters: DashboardFilters) -> None:
     st.session_state[FILTERS_KEY] = filters.to_payload()
+
+
+def swap_detail_selection(selection: DetailSelection) -> DetailSelection | None:
+    previous = st.session_state.get(DETAIL_SELECTION_KEY)
+    st.session_state[DETAIL_SELECTION_KEY] = selection
+    return previous
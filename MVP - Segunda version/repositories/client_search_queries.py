@@ -1,6 +1,7 @@
 from typing import Iterable
 
 from repositories.dashboard_queries import get_dimension_service_columns, get_dimension_table
+from repositories.sql_query import SqlQuery, build_param_list
 
 CLIENT_TABLE = "analiticaefg.clienteintegral.modelo_dimcliente"
 CLIENT_CONTRACTS_TABLES = {
@@ -20,69 +21,67 @@ CATEGORY_MAPPING = {
 }
 
 
-def escape_sql_value(value: str) -> str:
-    return value.replace("'", "''")
+def _cliente_params(tipo_identificacion: str, identificacion: str) -> dict[str, object]:
+    return {"tipo_identificacion": tipo_identificacion, "identificacion": identificacion}
 
 
-def get_tipo_identificacion_options_query() -> str:
-    return f"""
+def get_tipo_identificacion_options_query() -> SqlQuery:
+    sql = f"""
     SELECT DISTINCT TipoIdentificacion
     FROM {CLIENT_CONTRACTS_TABLES['Residencial']}
     WHERE TipoIdentificacion IS NOT NULL
     ORDER BY TipoIdentificacion
     """
+    return SqlQuery(sql, {})
 
 
-def get_cliente_raw_query(tipo_identificacion: str, identificacion: str) -> str:
-    tipo_identificacion = escape_sql_value(tipo_identificacion)
-    identificacion = escape_sql_value(identificacion)
-    return f"""
+def get_cliente_raw_query(tipo_identificacion: str, identificacion: str) -> SqlQuery:
+    sql = f"""
     SELECT *
     FROM {CLIENT_TABLE}
-    WHERE TipoIdentificacion = '{tipo_identificacion}'
-      AND Identificacion = '{identificacion}'
+    WHERE TipoIdentificacion = :tipo_identificacion
+      AND Identificacion = :identificacion
     QUALIFY ROW_NUMBER() OVER (
         PARTITION BY TipoIdentificacion, Identificacion
         ORDER BY TipoIdentificacion, Identificacion
     ) = 1
     """
+    return SqlQuery(sql, _cliente_params(tipo_identificacion, identificacion))
 
 
-def get_cliente_contratos_raw_query(tipo_identificacion: str, identificacion: str, universo: str) -> str:
+def get_cliente_contratos_raw_query(tipo_identificacion: str, identificacion: str, universo: str) -> SqlQuery:
     if universo not in CLIENT_CONTRACTS_TABLES:
         raise ValueError(f"Universo no válido: {universo}")
-    tipo_identificacion = escape_sql_value(tipo_identificacion)
-    identificacion = escape_sql_value(identificacion)
     contracts_table = CLIENT_CONTRACTS_TABLES[universo]
-    return f"""
+    sql = f"""
     SELECT *
     FROM {contracts_table}
-    WHERE TipoIdentificacion = '{tipo_identificacion}'
-      AND Identificacion = '{identificacion}'
+    WHERE TipoIdentificacion = :tipo_identificacion
+      AND Identificacion = :identificacion
     """
+    return SqlQuery(sql, _cliente_params(tipo_identificacion, identificacion))
 
 
-def get_cliente_contratos_summary_query(tipo_identificacion: str, identificacion: str, universo: str) -> str:
+def get_cliente_contratos_summary_query(tipo_identificacion: str, identificacion: str, universo: str) -> SqlQuery:
     if universo not in CLIENT_CONTRACTS_SUMMARY_TABLES:
         raise ValueError(f"Universo no válido: {universo}")
-    tipo_identificacion = escape_sql_value(tipo_identificacion)
-    identificacion = escape_sql_value(identificacion)
     summary_table = CLIENT_CONTRACTS_SUMMARY_TABLES[universo]
-    return f"""
+    sql = f"""
     SELECT TipoIdentificacion, Identificacion, contratos, ContratosActivos
     FROM {summary_table}
-    WHERE TipoIdentificacion = '{tipo_identificacion}'
-      AND Identificacion = '{identificacion}'
+    WHERE TipoIdentificacion = :tipo_identificacion
+      AND Identificacion = :identificacion
     """
+    return SqlQuery(sql, _cliente_params(tipo_identificacion, identificacion))
 
 
-def _build_contract_in_clause(contracts: Iterable[str]) -> str:
+def _build_contract_in_clause(contracts: Iterable[str]) -> SqlQuery:
     normalized = [str(contract).strip() for contract in contracts if str(contract).strip()]
-    quoted = ", ".join([f"'{escape_sql_value(contract)}'" for contract in normalized])
-    return f"c.Contrato IN ({quoted})"
+    placeholders = build_param_list("contrato", normalized)
+    return SqlQuery(f"c.Contrato IN ({placeholders.sql})", placeholders.params)
 
 
-def get_contratos_detalle_query(contracts: list[str], universo: str) -> str:
+def get_contratos_detalle_query(contracts: list[str], universo: str) -> SqlQuery:
     if universo not in CATEGORY_MAPPING:
         raise ValueError(f"Universo no válido: {universo}")
     if not contracts:
@@ -91,7 +90,7 @@ def get_contratos_detalle_query(contracts: list[str], universo: str) -> str:
     category = CATEGORY_MAPPING[universo]
     contract_filter = _build_contract_in_clause(contracts)
 
-    return f"""
+    sql = f"""
     SELECT
         c.Contrato,
         c.Estado,
@@ -107,29 +106,29 @@ def get_contratos_detalle_query(contracts: list[str], universo: str) -> str:
       ON u.IdBarrio = c.Barrio
     WHERE c.Valido = 1
       AND c.Categoria = {category}
-      AND {contract_filter}
+      AND {contract_filter.sql}
     ORDER BY c.Contrato
     """
+    return SqlQuery(sql, contract_filter.params)
 
 
-def get_cliente_dimensiones_query(tipo_identificacion: str, identificacion: str, universo: str) -> str:
+def get_cliente_dimensiones_query(tipo_identificacion: str, identificacion: str, universo: str) -> SqlQuery:
     if universo not in CATEGORY_MAPPING:
         raise ValueError(f"Universo no válido: {universo}")
 
-    tipo_identificacion = escape_sql_value(tipo_identificacion)
-    identificacion = escape_sql_value(identificacion)
     dimension_table = get_dimension_table(universo)
 
-    return f"""
+    sql = f"""
     SELECT *
     FROM {dimension_table}
-    WHERE TipoIdentificacion = '{tipo_identificacion}'
-      AND Identificacion = '{identificacion}'
+    WHERE TipoIdentificacion = :tipo_identificacion
+      AND Identificacion = :identificacion
     QUALIFY ROW_NUMBER() OVER (
         PARTITION BY TipoIdentificacion, Identificacion
         ORDER BY TipoIdentificacion, Identificacion
     ) = 1
     """
+    return SqlQuery(sql, _cliente_params(tipo_identificacion, identificacion))
 
 
 def get_cliente_detalle_servicio_query(
@@ -138,7 +137,7 @@ def get_cliente_detalle_servicio_query(
     universo: str,
     servicio: str,
     tipo_detalle: str,
-) -> str:
+) -> SqlQuery:
     if tipo_detalle not in {"dimensiones", "indicadores", "variables"}:
         raise ValueError(f"Tipo de detalle inválido: {tipo_detalle}")
 
@@ -146,13 +145,12 @@ def get_cliente_detalle_servicio_query(
     if servicio.lower() not in valid_services:
         raise ValueError(f"Servicio inválido para {universo}: {servicio}")
 
-    tipo_identificacion = escape_sql_value(tipo_identificacion)
-    identificacion = escape_sql_value(identificacion)
     table_name = f"analiticaefg.clienteintegral.{servicio.lower()}_{universo.lower()}_consolidado_{tipo_detalle}"
 
-    return f"""
+    sql = f"""
     SELECT *
     FROM {table_name}
-    WHERE TipoIdentificacion = '{tipo_identificacion}'
-      AND Identificacion = '{identificacion}'
+    WHERE TipoIdentificacion = :tipo_identificacion
+      AND Identificacion = :identificacion
     """
+    return SqlQuery(sql, _cliente_params(tipo_identificacion, identificacion))
@@ -1,4 +1,7 @@
-﻿from typing import Optional
+﻿from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+from repositories.sql_query import SqlQuery, build_param_list, merge_params
 
 
 TABLES = {
@@ -41,17 +44,78 @@ MARKET_MAPPING = {
 }
 
 UBICACION_TABLE = "analiticaefg.clienteintegral.modelo_dimubicacion"
+UBICACION_KEY_COLUMN = "IdBarrio"
+UBICACION_KEYED_COLUMNS = ("departamento", "localidad", "barrio")
+COMPACT_IN_THRESHOLD = 50
+MIN_KEY_RANGE_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class KeyedSelection:
+    values: tuple[str, ...]
+    keys: tuple[int, ...]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+FilterValues = Union[list[str], KeyedSelection]
 
 
-def escape_sql_value(value: str) -> str:
-    return value.replace("'", "''")
+def compress_key_ranges(keys: Sequence[int]) -> list[tuple[int, int]]:
+    ranges: list[tuple[int, int]] = []
+    for key in sorted(set(keys)):
+        if ranges and key == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], key)
+        else:
+            ranges.append((key, key))
+    return ranges
 
 
-def build_in_clause(column: str, values: Optional[list[str]]) -> str:
+def build_key_predicate(column: str, keys: Sequence[int]) -> str:
+    conditions: list[str] = []
+    singles: list[str] = []
+    for start, end in compress_key_ranges(keys):
+        if end - start + 1 >= MIN_KEY_RANGE_LENGTH:
+            conditions.append(f"{column} BETWEEN {start} AND {end}")
+        else:
+            singles.extend(str(key) for key in range(start, end + 1))
+    if singles:
+        conditions.append(f"{column} IN ({', '.join(singles)})")
+    if not conditions:
+        return "1=0"
+    return " OR ".join(conditions)
+
+
+def build_in_clause(column: str, values: Optional[FilterValues]) -> SqlQuery:
     if not values:
-        return ""
-    quoted = ", ".join([f"'{escape_sql_value(value)}'" for value in values])
-    return f" AND {column} IN ({quoted}) "
+        return SqlQuery("", {})
+    if isinstance(values, KeyedSelection):
+        if column not in UBICACION_KEYED_COLUMNS:
+            raise ValueError(f"La columna {column} no admite selección por llaves de ubicación.")
+        return SqlQuery(
+            f" AND {column} IN (SELECT {column} FROM {UBICACION_TABLE}"
+            f" WHERE {build_key_predicate(UBICACION_KEY_COLUMN, values.keys)}) ",
+            {},
+        )
+    placeholders = build_param_list(column, list(values))
+    return SqlQuery(f" AND {column} IN ({placeholders.sql}) ", placeholders.params)
+
+
+def compact_filter_values(
+    column: str,
+    values: Optional[Sequence[str]],
+    key_lookup: Optional[dict[str, tuple[int, ...]]],
+    threshold: int = COMPACT_IN_THRESHOLD,
+) -> FilterValues:
+    values = list(values or [])
+    if len(values) <= threshold or column not in UBICACION_KEYED_COLUMNS or not key_lookup:
+        return values
+    if any(value not in key_lookup for value in values):
+        return values
+
+    keys = sorted({key for value in values for key in key_lookup[value]})
+    return KeyedSelection(values=tuple(sorted(set(values))), keys=tuple(keys))
 
 
 def build_limit_clause(limit: Optional[int] = None) -> str:
@@ -91,21 +155,22 @@ def map_ui_markets_to_db_values(markets: Optional[list[str]]) -> list[str]:
 
 
 def build_filters_where(
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
-    where = " WHERE 1=1 "
-    where += build_in_clause("departamento", departamentos)
-    where += build_in_clause("localidad", localidades)
-    where += build_in_clause("barrio", barrios)
-    where += build_in_clause("MercadoRelevante", map_ui_markets_to_db_values(mercados))
-    return where
-
-
-def get_filter_options_query() -> str:
-    return f"""
+) -> SqlQuery:
+    clauses = [
+        build_in_clause("departamento", departamentos),
+        build_in_clause("localidad", localidades),
+        build_in_clause("barrio", barrios),
+        build_in_clause("MercadoRelevante", map_ui_markets_to_db_values(mercados)),
+    ]
+    return SqlQuery(" WHERE 1=1 " + "".join(clause.sql for clause in clauses), merge_params(*clauses))
+
+
+def get_filter_options_query() -> SqlQuery:
+    sql = f"""
         SELECT DISTINCT
             mercado,
             departamento,
@@ -114,15 +179,29 @@ def get_filter_options_query() -> str:
         FROM {UBICACION_TABLE}
         ORDER BY departamento, localidad, barrio
     """
+    return SqlQuery(sql, {})
+
+
+def get_ubicacion_keys_query() -> SqlQuery:
+    sql = f"""
+        SELECT
+            {UBICACION_KEY_COLUMN},
+            departamento,
+            localidad,
+            barrio
+        FROM {UBICACION_TABLE}
+        WHERE {UBICACION_KEY_COLUMN} IS NOT NULL
+    """
+    return SqlQuery(sql, {})
 
 
 def get_kpis_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     config = get_source_config(categoria)
     dimension_table = get_dimension_table(categoria)
     service_columns = get_dimension_service_columns(categoria)
@@ -131,13 +210,13 @@ def get_kpis_query(
         [f"COALESCE(dim.{column}, 0)" for column, _ in service_columns]
     )
 
-    return f"""
+    sql = f"""
     WITH clientes_filtrados AS (
         SELECT DISTINCT
             TipoIdentificacion,
             Identificacion
         FROM {config['clientes']}
-        {where_clause}
+        {where_clause.sql}
     ),
     clientes_dim AS (
         SELECT
@@ -166,15 +245,16 @@ def get_kpis_query(
             FROM clientes_dim
         ) AS PorcentajeClientesTresOMasServicios
     """
+    return SqlQuery(sql, where_clause.params)
 
 
 def get_penetracion_servicios_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     config = get_source_config(categoria)
     dimension_table = get_dimension_table(categoria)
     service_columns = get_dimension_service_columns(categoria)
@@ -189,13 +269,13 @@ def get_penetracion_servicios_query(
         ]
     )
 
-    return f"""
+    sql = f"""
     WITH clientes_filtrados AS (
         SELECT DISTINCT
             TipoIdentificacion,
             Identificacion
         FROM {config['clientes']}
-        {where_clause}
+        {where_clause.sql}
     ),
     clientes AS (
         SELECT
@@ -209,15 +289,16 @@ def get_penetracion_servicios_query(
     )
     {union_queries}
     """
+    return SqlQuery(sql, where_clause.params)
 
 
 def get_numero_servicios_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     config = get_source_config(categoria)
     dimension_table = get_dimension_table(categoria)
     service_columns = get_dimension_service_columns(categoria)
@@ -227,13 +308,13 @@ def get_numero_servicios_query(
     )
     max_servicios = len(service_columns)
 
-    return f"""
+    sql = f"""
     WITH clientes_filtrados AS (
         SELECT DISTINCT
             TipoIdentificacion,
             Identificacion
         FROM {config['clientes']}
-        {where_clause}
+        {where_clause.sql}
     ),
     clientes AS (
         SELECT
@@ -254,6 +335,7 @@ def get_numero_servicios_query(
     HAVING NumeroServicios BETWEEN 1 AND {max_servicios}
     ORDER BY NumeroServicios
     """
+    return SqlQuery(sql, where_clause.params)
 
 
 def _build_service_combination_expr(service_columns: list[tuple[str, str]]) -> str:
@@ -265,11 +347,11 @@ def _build_service_combination_expr(service_columns: list[tuple[str, str]]) -> s
 
 def get_combinaciones_servicios_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     config = get_source_config(categoria)
     dimension_table = get_dimension_table(categoria)
     service_columns = get_dimension_service_columns(categoria)
@@ -279,13 +361,13 @@ def get_combinaciones_servicios_query(
     )
     combinacion_expr = _build_service_combination_expr(service_columns)
 
-    return f"""
+    sql = f"""
     WITH clientes_filtrados AS (
         SELECT DISTINCT
             TipoIdentificacion,
             Identificacion
         FROM {config['clientes']}
-        {where_clause}
+        {where_clause.sql}
     ),
     clientes_dim AS (
         SELECT
@@ -307,15 +389,16 @@ def get_combinaciones_servicios_query(
     ORDER BY clientes DESC, CombinacionServicios
     LIMIT 5
     """
+    return SqlQuery(sql, where_clause.params)
 
 
 def get_clientes_mayor_aporte_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     config = get_source_config(categoria)
     dimension_table = get_dimension_table(categoria)
     service_columns = get_dimension_service_columns(categoria)
@@ -352,13 +435,13 @@ def get_clientes_mayor_aporte_query(
         [f"COALESCE(a{index}.ganancia_{column.lower()}, 0)" for index, (column, _) in enumerate(service_columns, start=1)]
     )
 
-    return f"""
+    sql = f"""
     WITH clientes_filtrados AS (
         SELECT DISTINCT
             TipoIdentificacion,
             Identificacion
         FROM {config['clientes']}
-        {where_clause}
+        {where_clause.sql}
     ),
     {aporte_ctes_sql},
     clientes_aporte AS (
@@ -385,25 +468,26 @@ def get_clientes_mayor_aporte_query(
     ORDER BY AporteTotal DESC, Cliente
     LIMIT 5
     """
+    return SqlQuery(sql, where_clause.params)
 
 
 def _build_clasificacion_base_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     config = get_source_config(categoria)
     dimension_table = get_dimension_table(categoria)
     where_clause = build_filters_where(departamentos, localidades, barrios, mercados)
-    return f"""
+    sql = f"""
     WITH base_filtrada AS (
         SELECT DISTINCT
             TipoIdentificacion,
             Identificacion
         FROM {config['clientes']}
-        {where_clause}
+        {where_clause.sql}
     ),
     clasif AS (
         SELECT
@@ -413,17 +497,18 @@ def _build_clasificacion_base_query(
         FROM {dimension_table}
     )
     """
+    return SqlQuery(sql, where_clause.params)
 
 
 def get_clasificacion_integral_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     base_query = _build_clasificacion_base_query(categoria, departamentos, localidades, barrios, mercados)
-    return base_query + """
+    sql = base_query.sql + """
     SELECT
         COALESCE(c.ClasificacionIntegral, 'Sin clasificación') AS ClasificacionIntegral,
         COUNT(*) AS clientes
@@ -434,27 +519,28 @@ def get_clasificacion_integral_query(
     GROUP BY COALESCE(c.ClasificacionIntegral, 'Sin clasificación')
     ORDER BY clientes DESC
     """
+    return SqlQuery(sql, base_query.params)
 
 
 def get_clasificacion_integral_distribution_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     return get_clasificacion_integral_query(categoria, departamentos, localidades, barrios, mercados)
 
 
 def get_clasificacion_integral_temporal_query(
     categoria: str,
-    departamentos: Optional[list[str]] = None,
-    localidades: Optional[list[str]] = None,
-    barrios: Optional[list[str]] = None,
+    departamentos: Optional[FilterValues] = None,
+    localidades: Optional[FilterValues] = None,
+    barrios: Optional[FilterValues] = None,
     mercados: Optional[list[str]] = None,
-) -> str:
+) -> SqlQuery:
     base_query = _build_clasificacion_base_query(categoria, departamentos, localidades, barrios, mercados)
-    return base_query + """
+    sql = base_query.sql + """
     SELECT
         'Marzo 2026' AS periodo,
         COALESCE(c.ClasificacionIntegral, 'Sin clasificación') AS ClasificacionIntegral,
@@ -466,6 +552,7 @@ def get_clasificacion_integral_temporal_query(
     GROUP BY COALESCE(c.ClasificacionIntegral, 'Sin clasificación')
     ORDER BY ClasificacionIntegral
     """
+    return SqlQuery(sql, base_query.params)
 
 
 CONSOLIDADO_DIM_TABLE = {
@@ -480,7 +567,7 @@ def get_consolidado_general_query(
     barrios=None,
     mercados=None,
     limit: Optional[int] = None,
-):
+) -> SqlQuery:
     config = get_source_config(categoria)
     base_table = config["clientes"]
     dimension_table = DIMENSION_TABLES[categoria]
@@ -500,12 +587,12 @@ def get_consolidado_general_query(
     else: 
         extra = "dim.Efisoluciones"
 
-    return f"""
+    sql = f"""
     WITH 
         clientes_filtrados as (
         SELECT distinct tipoidentificacion, identificacion
         from {base_table}
-        {where_clause})
+        {where_clause.sql})
 
     SELECT 
         dim.TipoIdentificacion,
@@ -524,6 +611,7 @@ def get_consolidado_general_query(
         and dim.identificacion=c.identificacion
     {limit_clause}
     """
+    return SqlQuery(sql, where_clause.params)
 
 SERVICIOS_RESIDENCIAL = ["consumo", "rtr", "sad", "seguros", "brilla"]
 SERVICIOS_COMERCIAL = ["consumo", "rtr", "efisoluciones", "brilla"]
@@ -549,7 +637,7 @@ def get_detalle_servicio_query(
     barrios=None,
     mercados=None,
     limit: Optional[int] = None,
-):
+) -> SqlQuery:
 
     categoria_sql = categoria.lower()
     config = get_source_config(categoria)
@@ -576,14 +664,14 @@ def get_detalle_servicio_query(
 
     limit_clause = build_limit_clause(limit)
 
-    return f"""
+    sql = f"""
     WITH
         clientes_filtrados AS (
             SELECT DISTINCT
                 TipoIdentificacion,
                 Identificacion
             FROM {base_table}
-            {where_clause}
+            {where_clause.sql}
         )
     SELECT detalle.*
     FROM {table_name} detalle
@@ -592,6 +680,7 @@ def get_detalle_servicio_query(
        AND detalle.Identificacion = clientes.Identificacion
     {limit_clause}
     """
+    return SqlQuery(sql, where_clause.params)
 
 
 def get_service_classification_query(
@@ -601,7 +690,7 @@ def get_service_classification_query(
     localidades=None,
     barrios=None,
     mercados=None,
-) -> str:
+) -> SqlQuery:
     service_table = SERVICE_CLASSIFICATION_TABLES.get(categoria, {}).get(servicio.lower())
     if not service_table:
         raise ValueError(f"No hay clasificación disponible para {servicio} en {categoria}.")
@@ -614,13 +703,13 @@ def get_service_classification_query(
         mercados=mercados,
     )
 
-    return f"""
+    sql = f"""
     WITH clientes_filtrados AS (
         SELECT DISTINCT
             TipoIdentificacion,
             Identificacion
         FROM {config['clientes']}
-        {where_clause}
+        {where_clause.sql}
     )
     SELECT
         COALESCE(det.ClasificacionRFM, 'Sin clasificación') AS ClasificacionRFM,
@@ -632,6 +721,7 @@ def get_service_classification_query(
     GROUP BY COALESCE(det.ClasificacionRFM, 'Sin clasificación')
     ORDER BY clientes DESC, ClasificacionRFM
     """
+    return SqlQuery(sql, where_clause.params)
 
 
 def get_service_classification_profile_query(
@@ -641,7 +731,7 @@ def get_service_classification_profile_query(
     localidades=None,
     barrios=None,
     mercados=None,
-) -> str:
+) -> SqlQuery:
     service_table = SERVICE_CLASSIFICATION_TABLES.get(categoria, {}).get(servicio.lower())
     if not service_table:
         raise ValueError(f"No hay clasificación disponible para {servicio} en {categoria}.")
@@ -654,13 +744,13 @@ def get_service_classification_profile_query(
         mercados=mercados,
     )
 
-    return f"""
+    sql = f"""
     WITH clientes_filtrados AS (
         SELECT DISTINCT
             TipoIdentificacion,
             Identificacion
         FROM {config['clientes']}
-        {where_clause}
+        {where_clause.sql}
     )
     SELECT
         AVG(COALESCE(det.Economica, 0)) AS Economica,
@@ -672,3 +762,4 @@ def get_service_classification_profile_query(
         ON det.TipoIdentificacion = clientes.TipoIdentificacion
        AND det.Identificacion = clientes.Identificacion
     """
+    return SqlQuery(sql, where_clause.params)
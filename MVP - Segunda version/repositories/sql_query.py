@@ -0,0 +1,55 @@
+import hashlib
+import json
+import re
+from collections.abc import Sequence
+from typing import NamedTuple
+
+
+_PARAM_NAME_PATTERN = re.compile(r"[^0-9a-z_]+")
+_QUOTED_COMMENT_OR_WHITESPACE_PATTERN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|(?:\s+|--[^\n]*|/\*.*?\*/)+",
+    re.DOTALL,
+)
+
+
+class SqlQuery(NamedTuple):
+    sql: str
+    params: dict[str, object]
+
+
+def param_name(prefix: str, index: int | None = None) -> str:
+    name = _PARAM_NAME_PATTERN.sub("_", prefix.lower()).strip("_")
+    return name if index is None else f"{name}_{index}"
+
+
+def build_param_list(prefix: str, values: Sequence[object]) -> SqlQuery:
+    params = {param_name(prefix, index): value for index, value in enumerate(sorted(set(values)))}
+    return SqlQuery(", ".join(f":{name}" for name in params), params)
+
+
+def merge_params(*queries: SqlQuery) -> dict[str, object]:
+    params: dict[str, object] = {}
+    for query in queries:
+        for name, value in query.params.items():
+            if name in params and params[name] != value:
+                raise ValueError(f"Parámetro duplicado con valores distintos: {name}")
+            params[name] = value
+    return params
+
+
+def _canonicalize_token(match: re.Match) -> str:
+    token = match.group()
+    return token if token[0] in "'\"`" else " "
+
+
+def canonicalize_sql(sql: str) -> str:
+    return _QUOTED_COMMENT_OR_WHITESPACE_PATTERN.sub(_canonicalize_token, sql).strip()
+
+
+def normalize_query(query: SqlQuery) -> SqlQuery:
+    return SqlQuery(canonicalize_sql(query.sql), dict(sorted(query.params.items())))
+
+
+def statement_key(query: SqlQuery) -> str:
+    payload = json.dumps([query.sql, sorted(query.params.items())], ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
@@ -1,6 +1,7 @@
 from collections.abc import Sequence
 
 from repositories.dashboard_queries import get_dimension_service_columns
+from repositories.sql_query import SqlQuery
 
 
 CONTRACT_TABLES = {
@@ -9,10 +10,6 @@ CONTRACT_TABLES = {
 }
 
 
-def escape_sql_value(value: str) -> str:
-    return value.replace("'", "''")
-
-
 def get_service_options(categoria: str) -> list[str]:
     return [label for _, label in get_dimension_service_columns(categoria)]
 
@@ -21,6 +18,14 @@ def _get_service_key_lookup(categoria: str) -> dict[str, str]:
     return {label: column.lower() for column, label in get_dimension_service_columns(categoria)}
 
 
+def _normalize_services(categoria: str, servicios: Sequence[str]) -> list[tuple[str, str]]:
+    service_lookup = _get_service_key_lookup(categoria)
+    for servicio in servicios:
+        if servicio not in service_lookup:
+            raise ValueError(f"Servicio no válido para {categoria}: {servicio}")
+    return [(label, service_key) for label, service_key in service_lookup.items() if label in servicios]
+
+
 def get_contract_table(categoria: str) -> str:
     if categoria not in CONTRACT_TABLES:
         raise ValueError(f"Categoría no válida: {categoria}")
@@ -37,16 +42,17 @@ def get_consolidado_variable_table(servicio: str, categoria: str) -> str:
     return f"analiticaefg.clienteintegral.{servicio}_{categoria_sql}_consolidado_variables"
 
 
-def get_table_columns_query(full_name: str) -> str:
+def get_table_columns_query(full_name: str) -> SqlQuery:
     catalog, schema, table = full_name.split(".")
-    return f"""
+    sql = f"""
     SELECT column_name
     FROM system.information_schema.columns
-    WHERE table_catalog = '{escape_sql_value(catalog)}'
-      AND table_schema = '{escape_sql_value(schema)}'
-      AND table_name = '{escape_sql_value(table)}'
+    WHERE table_catalog = :table_catalog
+      AND table_schema = :table_schema
+      AND table_name = :table_name
     ORDER BY ordinal_position
     """
+    return SqlQuery(sql, {"table_catalog": catalog, "table_schema": schema, "table_name": table})
 
 
 def get_consolidar_query(
@@ -54,20 +60,14 @@ def get_consolidar_query(
     servicios: Sequence[str],
     top_n: int,
     variable_columns_by_service: dict[str, Sequence[str]] | None = None,
-) -> str:
+) -> SqlQuery:
     if not servicios:
         raise ValueError("Debe seleccionar al menos un servicio.")
     if top_n <= 0:
         raise ValueError("top_n debe ser mayor que cero.")
 
     variable_columns_by_service = variable_columns_by_service or {}
-    service_lookup = _get_service_key_lookup(categoria)
-    normalized_services: list[tuple[str, str]] = []
-    for servicio in servicios:
-        service_key = service_lookup.get(servicio)
-        if not service_key:
-            raise ValueError(f"Servicio no válido para {categoria}: {servicio}")
-        normalized_services.append((servicio, service_key))
+    normalized_services = _normalize_services(categoria, servicios)
 
     dim_tables = {
         servicio_label: get_consolidado_dimension_table(service_key, categoria)
@@ -81,7 +81,7 @@ def get_consolidar_query(
     selects_scores: list[str] = []
     joins_dim: list[str] = []
     from_clause = ""
-    for index, (servicio_label, _) in enumerate(normalized_services):
+    for index, (servicio_label, service_key) in enumerate(normalized_services):
         alias = f"d{index}"
         if index == 0:
             from_clause = f"{dim_tables[servicio_label]} {alias}"
@@ -97,7 +97,7 @@ def get_consolidar_query(
                 0.55 * (0.55 * {alias}.Relacional + 0.45 * {alias}.Cumplimiento)
                 + 0.30 * {alias}.Economica
                 + 0.15 * (1 - {alias}.Potencial)
-            ) AS score_{service_lookup[servicio_label]}"""
+            ) AS score_{service_key}"""
         )
 
     score_columns = [f"score_{service_key}" for _, service_key in normalized_services]
@@ -121,7 +121,7 @@ def get_consolidar_query(
 
     contract_table = get_contract_table(categoria)
 
-    return f"""
+    sql = f"""
     WITH base AS (
         SELECT
             d0.TipoIdentificacion,
@@ -149,6 +149,7 @@ def get_consolidar_query(
     ORDER BY b.Score_CON DESC
     LIMIT {top_n}
     """
+    return SqlQuery(sql, {})
 
 
 def get_recuperar_query(
@@ -156,7 +157,7 @@ def get_recuperar_query(
     servicio: str,
     top_n: int,
     variable_columns: Sequence[str] | None = None,
-) -> str:
+) -> SqlQuery:
     if top_n <= 0:
         raise ValueError("top_n debe ser mayor que cero.")
 
@@ -177,7 +178,7 @@ def get_recuperar_query(
 
     contract_table = get_contract_table(categoria)
 
-    return f"""
+    sql = f"""
     WITH base AS (
         SELECT
             d.TipoIdentificacion,
@@ -208,6 +209,7 @@ def get_recuperar_query(
     ORDER BY s.Score_REC DESC
     LIMIT {top_n}
     """
+    return SqlQuery(sql, {})
 
 
 def get_fidelizar_query(
@@ -217,7 +219,7 @@ def get_fidelizar_query(
     top_n: int,
     variable_columns_ancla: Sequence[str] | None = None,
     variable_columns_objetivo: Sequence[str] | None = None,
-) -> str:
+) -> SqlQuery:
     if top_n <= 0:
         raise ValueError("top_n debe ser mayor que cero.")
 
@@ -249,7 +251,7 @@ def get_fidelizar_query(
 
     contract_table = get_contract_table(categoria)
 
-    return f"""
+    sql = f"""
     WITH base AS (
         SELECT
             a.TipoIdentificacion,
@@ -298,6 +300,7 @@ def get_fidelizar_query(
     ORDER BY s.Score_FID DESC
     LIMIT {top_n}
     """
+    return SqlQuery(sql, {})
 
 
 def get_potenciar_query(
@@ -305,20 +308,14 @@ def get_potenciar_query(
     servicios: Sequence[str],
     top_n: int,
     variable_columns_by_service: dict[str, Sequence[str]] | None = None,
-) -> str:
+) -> SqlQuery:
     if not servicios:
         raise ValueError("Debe seleccionar al menos un servicio.")
     if top_n <= 0:
         raise ValueError("top_n debe ser mayor que cero.")
 
     variable_columns_by_service = variable_columns_by_service or {}
-    service_lookup = _get_service_key_lookup(categoria)
-    normalized_services: list[tuple[str, str]] = []
-    for servicio in servicios:
-        service_key = service_lookup.get(servicio)
-        if not service_key:
-            raise ValueError(f"Servicio no válido para {categoria}: {servicio}")
-        normalized_services.append((servicio, service_key))
+    normalized_services = _normalize_services(categoria, servicios)
 
     dim_tables = {
         servicio_label: get_consolidado_dimension_table(service_key, categoria)
@@ -371,7 +368,7 @@ def get_potenciar_query(
 
     contract_table = get_contract_table(categoria)
 
-    return f"""
+    sql = f"""
     WITH base AS (
         SELECT
             t0.TipoIdentificacion,
@@ -399,3 +396,4 @@ def get_potenciar_query(
     ORDER BY b.Score_POT DESC
     LIMIT {top_n}
     """
+    return SqlQuery(sql, {})
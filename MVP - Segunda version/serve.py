@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from streamlit.web import cli as stcli
+
+load_dotenv()
+
+from core.warmup import start_cache_warmup  # noqa: E402
+from services.metrics import start_metrics_server  # noqa: E402
+
+APP_PATH = Path(__file__).resolve().parent / "app.py"
+
+
+def main() -> None:
+    start_metrics_server()
+    start_cache_warmup()
+    sys.argv = ["streamlit", "run", str(APP_PATH), *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from services.metrics import LOADER_CACHE_BYTES, LOADER_CACHE_EVICTIONS
+
+
+CGROUP_MEMORY_LIMIT_PATHS = (
+    Path("/sys/fs/cgroup/memory.max"),
+    Path("/sys/fs/cgroup/memory/memory.limit_in_bytes"),
+)
+DEFAULT_MEMORY_LIMIT_BYTES = 512 * 1024 * 1024
+UNLIMITED_MEMORY_THRESHOLD = 1 << 60
+
+CACHE_MEMORY_FRACTION = float(os.getenv("CACHE_MEMORY_FRACTION", "0.35"))
+CACHE_MEMORY_BUDGET_BYTES = int(os.getenv("CACHE_MEMORY_BUDGET_BYTES", "0"))
+
+
+def _build_logger() -> logging.Logger:
+    logger = logging.getLogger("cliente_integral.cache_budget")
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(os.getenv("CACHE_BUDGET_LOG_LEVEL", "INFO").upper())
+        logger.propagate = False
+    return logger
+
+
+LOGGER = _build_logger()
+
+
+def cgroup_memory_limit(paths: tuple[Path, ...] = CGROUP_MEMORY_LIMIT_PATHS) -> int | None:
+    for path in paths:
+        try:
+            raw = path.read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if raw == "max" or not raw.isdigit():
+            return None
+        limit = int(raw)
+        return limit if limit < UNLIMITED_MEMORY_THRESHOLD else None
+    return None
+
+
+def default_budget_bytes() -> int:
+    if CACHE_MEMORY_BUDGET_BYTES > 0:
+        return CACHE_MEMORY_BUDGET_BYTES
+    limit = cgroup_memory_limit() or DEFAULT_MEMORY_LIMIT_BYTES
+    return int(limit * CACHE_MEMORY_FRACTION)
+
+
+def estimate_size(value: object) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, (pa.Table, pa.RecordBatch)):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(key) + estimate_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class BudgetEntry:
+    loader: str
+    size: int
+    expires_at: float
+    evict: Callable[[], None]
+
+
+class CacheBudget:
+    def __init__(self, budget_bytes: int | None = None) -> None:
+        self.budget_bytes = default_budget_bytes() if budget_bytes is None else budget_bytes
+        self._entries: OrderedDict[str, BudgetEntry] = OrderedDict()
+        self._loader_bytes: dict[str, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def loader_bytes(self, loader: str) -> int:
+        return self._loader_bytes.get(loader, 0)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _drop(self, key: str) -> BudgetEntry | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+            self._loader_bytes[entry.loader] = self._loader_bytes.get(entry.loader, 0) - entry.size
+            LOADER_CACHE_BYTES.set(self._loader_bytes[entry.loader], entry.loader)
+        return entry
+
+    def _collect_victims(self) -> list[BudgetEntry]:
+        now = time.time()
+        victims = [self._drop(key) for key, entry in list(self._entries.items()) if entry.expires_at <= now]
+        while self._total_bytes > self.budget_bytes and self._entries:
+            victims.append(self._drop(next(iter(self._entries))))
+        return [victim for victim in victims if victim is not None]
+
+    def _evict(self, victims: list[BudgetEntry], reason: str) -> None:
+        for victim in victims:
+            try:
+                victim.evict()
+            except Exception as exc:
+                LOGGER.warning(
+                    json.dumps(
+                        {"event": "cache_evict_failed", "loader": victim.loader, "error": type(exc).__name__},
+                        ensure_ascii=False,
+                    )
+                )
+                continue
+            LOADER_CACHE_EVICTIONS.inc(victim.loader, reason)
+            LOGGER.debug(
+                json.dumps(
+                    {"event": "cache_evict", "loader": victim.loader, "bytes": victim.size, "reason": reason},
+                    ensure_ascii=False,
+                )
+            )
+
+    def record(self, key: str, loader: str, size: int, ttl: float, evict: Callable[[], None]) -> None:
+        if size > self.budget_bytes:
+            self._evict([BudgetEntry(loader, size, 0.0, evict)], "oversized")
+            return
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = BudgetEntry(loader, size, time.time() + ttl, evict)
+            self._total_bytes += size
+            self._loader_bytes[loader] = self._loader_bytes.get(loader, 0) + size
+            LOADER_CACHE_BYTES.set(self._loader_bytes[loader], loader)
+            victims = self._collect_victims()
+        self._evict(victims, "budget")
+
+    def touch(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def discard_loader(self, loader: str) -> None:
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.loader == loader]:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+
+_budget = CacheBudget()
+
+
+def get_cache_budget() -> CacheBudget:
+    return _budget
@@ -1,12 +1,32 @@
 import os
+import time
+
 import pandas as pd
 from databricks import sql
 from dotenv import load_dotenv
 
+from repositories.sql_query import SqlQuery, normalize_query, statement_key
+from services.metrics import WAREHOUSE_CONNECTIONS_IN_USE, WAREHOUSE_CONNECTIONS_OPENED
+from services.query_log import QueryRecord, classify_result_cache, fingerprint_sql, get_current_loader, record_query
+
 load_dotenv()
 
+WAREHOUSE_BACKENDS = ("databricks", "fake")
+
+
+def get_warehouse_backend() -> str:
+    backend = os.getenv("WAREHOUSE_BACKEND", "databricks").strip().lower()
+    if backend not in WAREHOUSE_BACKENDS:
+        raise ValueError(f"Backend de warehouse no válido: {backend}")
+    return backend
+
 
 def get_connection():
+    if get_warehouse_backend() == "fake":
+        from services.fake_warehouse import get_fake_connection
+
+        return get_fake_connection()
+
     host = os.getenv("DATABRICKS_HOST")
     http_path = os.getenv("DATABRICKS_HTTP_PATH")
     token = os.getenv("DATABRICKS_TOKEN")
@@ -31,9 +51,66 @@ def get_connection():
     )
 
 
-def run_query(query: str) -> pd.DataFrame:
+def _elapsed_ms(start: float, end: float) -> float:
+    return round((end - start) * 1000, 2)
+
+
+def run_query(query: SqlQuery | str, params: dict[str, object] | None = None) -> pd.DataFrame:
+    if isinstance(query, SqlQuery):
+        query, params = query.sql, {**query.params, **(params or {})}
+    statement = normalize_query(SqlQuery(query, params or {}))
+    query, params = statement
+    loader_name = get_current_loader()
+    fingerprint = fingerprint_sql(query)
+    started = time.perf_counter()
+
     conn = get_connection()
+    connected = time.perf_counter()
+    executed: float | None = None
+    WAREHOUSE_CONNECTIONS_OPENED.inc()
+    WAREHOUSE_CONNECTIONS_IN_USE.inc()
     try:
-        return pd.read_sql(query, conn)
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, parameters=params or None)
+            executed = time.perf_counter()
+            columns = [description[0] for description in cursor.description or []]
+            df = pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=True)
+        finally:
+            cursor.close()
+    except Exception as exc:
+        failed = time.perf_counter()
+        record_query(
+            QueryRecord(
+                fingerprint=fingerprint,
+                loader=loader_name,
+                cache_hit=False,
+                connect_ms=_elapsed_ms(started, connected),
+                execute_ms=_elapsed_ms(connected, executed or failed),
+                fetch_ms=_elapsed_ms(executed, failed) if executed else 0.0,
+                error=type(exc).__name__,
+            ),
+            query,
+        )
+        raise
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+        WAREHOUSE_CONNECTIONS_IN_USE.dec()
+
+    fetched = time.perf_counter()
+    execute_ms = _elapsed_ms(connected, executed)
+    record_query(
+        QueryRecord(
+            fingerprint=fingerprint,
+            loader=loader_name,
+            cache_hit=False,
+            connect_ms=_elapsed_ms(started, connected),
+            execute_ms=execute_ms,
+            fetch_ms=_elapsed_ms(executed, fetched),
+            rows=len(df),
+            bytes=int(df.memory_usage(index=True, deep=True).sum()),
+            result_cache=classify_result_cache(statement_key(statement), execute_ms),
+        ),
+        query,
+    )
+    return df
@@ -0,0 +1,441 @@
+import argparse
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+import duckdb
+
+from repositories.dashboard_queries import DIMENSION_SERVICE_COLUMNS, MARKET_MAPPING
+
+
+FAKE_WAREHOUSE_CLIENTS = int(os.getenv("FAKE_WAREHOUSE_CLIENTS", "1000000"))
+FAKE_WAREHOUSE_DIR = os.getenv("FAKE_WAREHOUSE_DIR", "")
+BARRIOS_POR_LOCALIDAD = int(os.getenv("FAKE_WAREHOUSE_BARRIOS_POR_LOCALIDAD", "40"))
+
+CATALOGS = {
+    "analiticaefg": "clienteintegral",
+    "dwhbiefg": "comun",
+}
+SCHEMA = "analiticaefg.clienteintegral"
+CONTRATO_TABLE = "dwhbiefg.comun.dimcontrato"
+
+LOCALIDADES = {
+    "RISARALDA": ("Pereira", "Dosquebradas", "Santa Rosa de Cabal", "La Virginia", "Belén de Umbría"),
+    "QUINDIO": ("Armenia", "Calarcá", "Montenegro", "Quimbaya", "La Tebaida"),
+    "CALDAS": ("Manizales", "Chinchiná", "Villamaría", "La Dorada", "Riosucio"),
+    "OCCIDENTE": ("Cartago", "Ansermanuevo", "El Águila", "Alcalá"),
+}
+DEPARTAMENTOS = {
+    "RISARALDA": "RISARALDA",
+    "QUINDIO": "QUINDIO",
+    "CALDAS": "CALDAS",
+    "OCCIDENTE": "VALLE DEL CAUCA",
+}
+SERVICE_RATES = {
+    "consumo": 0.96,
+    "rtr": 0.55,
+    "brilla": 0.38,
+    "sad": 0.22,
+    "seguros": 0.17,
+    "efisoluciones": 0.12,
+}
+NOMBRES = ("José", "María", "Luis", "Ana", "Carlos", "Sofía", "Andrés", "Valentina", "Julián", "Camila")
+APELLIDOS = ("García", "Rodríguez", "Muñoz", "Peña", "López", "Gómez", "Ríos", "Castaño", "Ospina", "Giraldo")
+
+_TRANSLATED_TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'|`|::|:(?=[A-Za-z_])")
+
+LOGGER = logging.getLogger("cliente_integral.fake_warehouse")
+
+_shared_connection: duckdb.DuckDBPyConnection | None = None
+_shared_lock = threading.Lock()
+
+
+def _translate_token(match: re.Match) -> str:
+    token = match.group()
+    if token == "`":
+        return '"'
+    if token == ":":
+        return "$"
+    return token
+
+
+def translate_sql(query: str) -> str:
+    return _TRANSLATED_TOKEN_PATTERN.sub(_translate_token, query)
+
+
+class FakeWarehouseCursor:
+    def __init__(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        self._cursor = cursor
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, query: str, parameters=None) -> "FakeWarehouseCursor":
+        self._cursor.execute(translate_sql(query), parameters or None)
+        return self
+
+    def fetchall(self) -> list[tuple]:
+        return self._cursor.fetchall()
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class FakeWarehouseConnection:
+    def __init__(self, connection: duckdb.DuckDBPyConnection) -> None:
+        self._connection = connection
+
+    def cursor(self) -> FakeWarehouseCursor:
+        return FakeWarehouseCursor(self._connection.cursor())
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def _service_tables() -> list[tuple[str, str]]:
+    services: list[tuple[str, str]] = []
+    for categoria, columns in DIMENSION_SERVICE_COLUMNS.items():
+        services.extend((column.lower(), categoria.lower()) for column, _ in columns)
+    return services
+
+
+def _sql_list(values) -> str:
+    return "[" + ", ".join("'" + str(value).replace("'", "''") + "'" for value in values) + "]"
+
+
+def _attach_catalogs(connection: duckdb.DuckDBPyConnection, directory: str = "") -> None:
+    for catalog, schema in CATALOGS.items():
+        location = str(Path(directory) / f"{catalog}.duckdb") if directory else ":memory:"
+        connection.execute(f"ATTACH '{location}' AS {catalog}")
+        connection.execute(f"CREATE SCHEMA IF NOT EXISTS {catalog}.{schema}")
+
+
+def is_populated(connection: duckdb.DuckDBPyConnection) -> bool:
+    tables = connection.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE database_name = 'dwhbiefg' AND table_name = 'dimcontrato'"
+    ).fetchone()[0]
+    return bool(tables)
+
+
+def _create_ubicacion(connection: duckdb.DuckDBPyConnection) -> None:
+    rows = ",\n        ".join(
+        f"('{MARKET_MAPPING[mercado]}', '{DEPARTAMENTOS[mercado]}', '{localidad}')"
+        for mercado, localidades in LOCALIDADES.items()
+        for localidad in localidades
+    )
+    connection.execute(
+        f"""
+        CREATE OR REPLACE TABLE {SCHEMA}.modelo_dimubicacion AS
+        SELECT
+            l.mercado,
+            l.departamento,
+            l.localidad,
+            'Barrio ' || lpad(CAST(b.range + 1 AS VARCHAR), 3, '0') || ' - ' || l.localidad AS barrio,
+            CAST(ROW_NUMBER() OVER (ORDER BY l.departamento, l.localidad, b.range) AS INTEGER) AS IdBarrio
+        FROM (VALUES
+        {rows}
+        ) AS l(mercado, departamento, localidad)
+        CROSS JOIN range({BARRIOS_POR_LOCALIDAD}) b
+        """
+    )
+
+
+def _create_clientes_base(connection: duckdb.DuckDBPyConnection, clients: int) -> None:
+    flags = ",\n            ".join(
+        f"CAST(u(i, 'srv_{service}') < {rate} AS INTEGER) AS srv_{service}"
+        for service, rate in SERVICE_RATES.items()
+    )
+    connection.execute(
+        f"""
+        CREATE OR REPLACE TEMP TABLE _clientes AS
+        WITH base AS (
+            SELECT
+                range AS i,
+                CASE WHEN u(range, 'categoria') < 0.86 THEN 'Residencial' ELSE 'Comercial' END AS categoria
+            FROM range({clients})
+        )
+        SELECT
+            i,
+            categoria,
+            CASE
+                WHEN categoria = 'Comercial' AND u(i, 'tipo') < 0.7 THEN 'NIT'
+                WHEN u(i, 'tipo') < 0.95 THEN 'CC'
+                ELSE 'CE'
+            END AS TipoIdentificacion,
+            CAST(1000000 + i AS VARCHAR) AS Identificacion,
+            CAST(1 + floor(pow(u(i, 'barrio'), 2) * (SELECT COUNT(*) FROM {SCHEMA}.modelo_dimubicacion)) AS INTEGER)
+                AS IdBarrio,
+            CAST(1 + floor(u(i, 'contratos') * u(i, 'contratos_2') * 4) AS INTEGER) AS n_contratos,
+            u(i, 'economica') AS Economica,
+            u(i, 'cumplimiento') AS Cumplimiento,
+            u(i, 'relacional') AS Relacional,
+            u(i, 'potencial') AS Potencial,
+            {flags}
+        FROM base
+        """
+    )
+
+
+def _create_contratos(connection: duckdb.DuckDBPyConnection) -> None:
+    connection.execute(
+        """
+        CREATE OR REPLACE TEMP TABLE _contratos AS
+        SELECT
+            c.i,
+            c.categoria,
+            c.TipoIdentificacion,
+            c.Identificacion,
+            c.IdBarrio,
+            CAST(20000000 + c.i * 4 + k.range AS VARCHAR) AS Contrato,
+            CASE
+                WHEN u(c.i * 4 + k.range, 'estado') < 0.82 THEN 'Activo'
+                WHEN u(c.i * 4 + k.range, 'estado') < 0.93 THEN 'Suspendido'
+                ELSE 'Retirado'
+            END AS Estado
+        FROM _clientes c
+        CROSS JOIN range(4) k
+        WHERE k.range < c.n_contratos
+        """
+    )
+    connection.execute(
+        f"""
+        CREATE OR REPLACE TABLE {CONTRATO_TABLE} AS
+        SELECT
+            Contrato,
+            Estado,
+            CASE WHEN categoria = 'Residencial' THEN 1 ELSE 2 END AS Categoria,
+            CAST(1 + floor(u(i, 'estrato') * 6) AS INTEGER) AS Subcategoria,
+            'CALLE ' || CAST(1 + hash(Contrato, 'calle') % 120 AS VARCHAR)
+                || ' # ' || CAST(1 + hash(Contrato, 'carrera') % 90 AS VARCHAR)
+                || ' - ' || CAST(1 + hash(Contrato, 'placa') % 99 AS VARCHAR) AS Direccion,
+            IdBarrio AS Barrio,
+            1 AS Valido
+        FROM _contratos
+        """
+    )
+
+
+def _create_modelo_tables(connection: duckdb.DuckDBPyConnection) -> None:
+    connection.execute(
+        f"""
+        CREATE OR REPLACE TABLE {SCHEMA}.modelo_dimcliente AS
+        SELECT
+            TipoIdentificacion,
+            Identificacion,
+            list_element({_sql_list(NOMBRES)}, CAST(1 + hash(i, 'nombre') % {len(NOMBRES)} AS INTEGER)) AS Nombre,
+            list_element({_sql_list(APELLIDOS)}, CAST(1 + hash(i, 'apellido') % {len(APELLIDOS)} AS INTEGER))
+                AS Apellido
+        FROM _clientes
+        """
+    )
+
+    for categoria in DIMENSION_SERVICE_COLUMNS:
+        suffix = categoria.lower()
+        service_columns = ", ".join(
+            f"srv_{column.lower()} AS {column}" for column, _ in DIMENSION_SERVICE_COLUMNS[categoria]
+        )
+        numero_servicios = " + ".join(f"srv_{column.lower()}" for column, _ in DIMENSION_SERVICE_COLUMNS[categoria])
+        connection.execute(
+            f"""
+            CREATE OR REPLACE TABLE {SCHEMA}.modelo_datoscliente{suffix} AS
+            SELECT
+                c.TipoIdentificacion,
+                c.Identificacion,
+                u.departamento,
+                u.localidad,
+                u.barrio,
+                u.mercado AS MercadoRelevante,
+                c.Contrato
+            FROM _contratos c
+            INNER JOIN {SCHEMA}.modelo_dimubicacion u
+                ON u.IdBarrio = c.IdBarrio
+            WHERE c.categoria = '{categoria}'
+            """
+        )
+        connection.execute(
+            f"""
+            CREATE OR REPLACE TABLE {SCHEMA}.modelo_contratos{suffix} AS
+            SELECT
+                TipoIdentificacion,
+                Identificacion,
+                list(Contrato ORDER BY Contrato) AS Contratos,
+                list(Contrato ORDER BY Contrato) FILTER (WHERE Estado = 'Activo') AS ContratosActivos
+            FROM _contratos
+            WHERE categoria = '{categoria}'
+            GROUP BY TipoIdentificacion, Identificacion
+            """
+        )
+        connection.execute(
+            f"""
+            CREATE OR REPLACE TABLE {SCHEMA}.dimensiones_{suffix} AS
+            WITH base AS (
+                SELECT *, {numero_servicios} AS NumeroServicios,
+                    (Economica + Cumplimiento + Relacional) / 3 AS Score
+                FROM _clientes
+                WHERE categoria = '{categoria}'
+            )
+            SELECT
+                TipoIdentificacion,
+                Identificacion,
+                {service_columns},
+                CASE
+                    WHEN u(i, 'sin_clasificacion') < 0.03 THEN NULL
+                    WHEN NumeroServicios >= 3 AND Score >= 0.55 THEN 'Premium multiservicio'
+                    WHEN NumeroServicios >= 3 THEN 'Pasivo multiservicio'
+                    WHEN Score >= 0.7 THEN 'Top en su servicio'
+                    WHEN Score >= 0.5 THEN 'En desarrollo'
+                    WHEN Potencial >= 0.6 THEN 'Oportunidad de expansión'
+                    ELSE 'En riesgo'
+                END AS ClasificacionIntegral,
+                Economica,
+                Cumplimiento,
+                Relacional,
+                Potencial
+            FROM base
+            """
+        )
+
+
+def _create_consolidado_tables(connection: duckdb.DuckDBPyConnection) -> None:
+    for service, categoria in _service_tables():
+        prefix = f"{SCHEMA}.{service}_{categoria}_consolidado"
+        source = f"""
+            SELECT *
+            FROM _clientes
+            WHERE categoria = '{categoria.capitalize()}'
+              AND srv_{service} = 1
+        """
+        connection.execute(
+            f"""
+            CREATE OR REPLACE TABLE {prefix}_dimensiones AS
+            WITH base AS (
+                SELECT
+                    i,
+                    TipoIdentificacion,
+                    Identificacion,
+                    least(1.0, greatest(0.0, Economica + (u(i, '{service}_eco') - 0.5) * 0.3)) AS Economica,
+                    least(1.0, greatest(0.0, Cumplimiento + (u(i, '{service}_cum') - 0.5) * 0.3)) AS Cumplimiento,
+                    least(1.0, greatest(0.0, Relacional + (u(i, '{service}_rel') - 0.5) * 0.3)) AS Relacional,
+                    least(1.0, greatest(0.0, Potencial + (u(i, '{service}_pot') - 0.5) * 0.3)) AS Potencial
+                FROM ({source})
+            )
+            SELECT
+                TipoIdentificacion,
+                Identificacion,
+                Economica,
+                Cumplimiento,
+                Relacional,
+                Potencial,
+                CASE
+                    WHEN u(i, '{service}_rfm') < 0.04 THEN NULL
+                    WHEN Economica >= 0.75 AND Relacional >= 0.6 THEN 'Campeones'
+                    WHEN Cumplimiento >= 0.6 AND Relacional >= 0.5 THEN 'Leales'
+                    WHEN Potencial >= 0.6 THEN 'Potenciales'
+                    WHEN Cumplimiento < 0.25 THEN 'En riesgo'
+                    WHEN Relacional < 0.3 THEN 'Hibernando'
+                    ELSE 'Necesitan atención'
+                END AS ClasificacionRFM
+            FROM base
+            """
+        )
+        connection.execute(
+            f"""
+            CREATE OR REPLACE TABLE {prefix}_indicadores AS
+            SELECT
+                TipoIdentificacion,
+                Identificacion,
+                CAST(floor(u(i, '{service}_recencia') * 365) AS INTEGER) AS Recencia,
+                CAST(1 + floor(u(i, '{service}_frecuencia') * 24) AS INTEGER) AS Frecuencia,
+                round(u(i, '{service}_monetario') * 2500000, 2) AS Monetario,
+                CAST(1 + floor(u(i, '{service}_antiguedad') * 240) AS INTEGER) AS AntiguedadMeses,
+                round(pow(u(i, '{service}_mora'), 4) * 900000, 2) AS CarteraVencida
+            FROM ({source})
+            """
+        )
+        rtr_columns = ""
+        if service == "rtr":
+            rtr_columns = f""",
+                [
+                    DATE '2026-03-31' + CAST(floor(u(i, 'rtr_fecha_1') * 720) AS INTEGER),
+                    DATE '2026-03-31' + CAST(720 + floor(u(i, 'rtr_fecha_2') * 1800) AS INTEGER)
+                ] AS fechas_proximas_rtr"""
+        connection.execute(
+            f"""
+            CREATE OR REPLACE TABLE {prefix}_variables AS
+            SELECT
+                TipoIdentificacion,
+                Identificacion,
+                round((Economica - 0.15) * u(i, '{service}_ganancia') * 850000, 2) AS ganancia_total,
+                CAST(18 + floor(u(i, '{service}_edad') * 70) AS INTEGER) AS edad_cliente,
+                round(u(i, '{service}_factura') * 420000, 2) AS valor_promedio_factura,
+                n_contratos AS numero_contratos{rtr_columns}
+            FROM ({source})
+            """
+        )
+
+
+def build_fake_warehouse(connection: duckdb.DuckDBPyConnection, clients: int = FAKE_WAREHOUSE_CLIENTS) -> None:
+    if clients <= 0:
+        raise ValueError("El número de clientes debe ser mayor que cero.")
+
+    started = time.perf_counter()
+    connection.execute("CREATE OR REPLACE TEMP MACRO u(i, salt) AS (hash(i, salt) % 1000000) / 1000000.0")
+    _create_ubicacion(connection)
+    _create_clientes_base(connection, clients)
+    _create_contratos(connection)
+    _create_modelo_tables(connection)
+    _create_consolidado_tables(connection)
+    connection.execute("DROP TABLE _contratos")
+    connection.execute("DROP TABLE _clientes")
+    LOGGER.info(
+        "Warehouse sintético generado con %s clientes en %.1f s.",
+        f"{clients:,}",
+        time.perf_counter() - started,
+    )
+
+
+def create_fake_warehouse(
+    clients: int = FAKE_WAREHOUSE_CLIENTS,
+    directory: str = FAKE_WAREHOUSE_DIR,
+) -> duckdb.DuckDBPyConnection:
+    if directory:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    connection = duckdb.connect()
+    _attach_catalogs(connection, directory)
+    if not is_populated(connection):
+        build_fake_warehouse(connection, clients)
+    return connection
+
+
+def get_fake_connection() -> FakeWarehouseConnection:
+    global _shared_connection
+    with _shared_lock:
+        if _shared_connection is None:
+            _shared_connection = create_fake_warehouse()
+        return FakeWarehouseConnection(_shared_connection.cursor())
+
+
+def reset_fake_warehouse(connection: duckdb.DuckDBPyConnection | None = None) -> None:
+    global _shared_connection
+    with _shared_lock:
+        if _shared_connection is not None and _shared_connection is not connection:
+            _shared_connection.close()
+        _shared_connection = connection
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Genera el warehouse sintético en disco.")
+    parser.add_argument("--clients", type=int, default=FAKE_WAREHOUSE_CLIENTS)
+    parser.add_argument("--dir", default=FAKE_WAREHOUSE_DIR or "data/fake_warehouse")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    create_fake_warehouse(clients=args.clients, directory=args.dir).close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from services.metrics import FIGURE_CACHE_REQUESTS
+
+
+FIGURE_CACHE_MAX_ENTRIES = int(os.getenv("FIGURE_CACHE_MAX_ENTRIES", "256"))
+FIGURE_CACHE_TTL_S = float(os.getenv("FIGURE_CACHE_TTL_S", "900"))
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str | None:
+    digest = hashlib.sha1()
+    digest.update(repr(list(zip(df.columns, df.dtypes.astype(str)))).encode("utf-8"))
+    try:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    except TypeError:
+        return None
+    return digest.hexdigest()
+
+
+class FigureCache:
+    def __init__(self, max_entries: int = FIGURE_CACHE_MAX_ENTRIES, ttl: float = FIGURE_CACHE_TTL_S) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[go.Figure, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, str]) -> go.Figure | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            figure, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return figure
+
+    def put(self, key: tuple[str, str], figure: go.Figure) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (figure, time.time() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_figure_cache = FigureCache()
+
+
+def get_figure_cache() -> FigureCache:
+    return _figure_cache
+
+
+def cached_figure(chart: str, df: pd.DataFrame, build: Callable[[pd.DataFrame], go.Figure]) -> go.Figure:
+    fingerprint = frame_fingerprint(df)
+    if fingerprint is None:
+        FIGURE_CACHE_REQUESTS.inc(chart, "miss")
+        return build(df)
+
+    cache = get_figure_cache()
+    key = (chart, fingerprint)
+    figure = cache.get(key)
+    if figure is not None:
+        FIGURE_CACHE_REQUESTS.inc(chart, "hit")
+        return figure
+
+    FIGURE_CACHE_REQUESTS.inc(chart, "miss")
+    figure = build(df)
+    cache.put(key, figure)
+    return figure
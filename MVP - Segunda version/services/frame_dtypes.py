@@ -0,0 +1,76 @@
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_object_dtype
+
+from services.cache_budget import estimate_size
+
+
+DTYPE_OPTIMIZER_ENABLED = os.getenv("FRAME_DTYPE_OPTIMIZER", "true").lower() in {"1", "true", "yes"}
+DTYPE_MIN_ROWS = int(os.getenv("FRAME_DTYPE_MIN_ROWS", "500"))
+CATEGORY_MAX_RATIO = float(os.getenv("FRAME_CATEGORY_MAX_RATIO", "0.5"))
+ARROW_STRING_DTYPE = "string[pyarrow]"
+
+
+@dataclass(frozen=True)
+class DtypeOptimization:
+    frame: pd.DataFrame
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _is_string_column(series: pd.Series) -> bool:
+    values = series.dropna()
+    return not values.empty and values.map(type).eq(str).all()
+
+
+def _optimize_object(series: pd.Series) -> pd.Series:
+    if not _is_string_column(series):
+        return series
+    if series.nunique(dropna=True) <= len(series) * CATEGORY_MAX_RATIO:
+        return series.astype("category")
+    if series.notna().all():
+        return series.astype(ARROW_STRING_DTYPE)
+    return series
+
+
+def _optimize_numeric(series: pd.Series) -> pd.Series:
+    if series.dtype == np.int64:
+        downcast = pd.to_numeric(series, downcast="integer")
+        return downcast.astype(np.int32) if downcast.dtype.itemsize < 4 else downcast
+    if series.dtype == np.float64:
+        downcast = pd.to_numeric(series, downcast="float")
+        if downcast.dtype != np.float64 and not np.array_equal(
+            downcast.to_numpy(dtype=np.float64), series.to_numpy(), equal_nan=True
+        ):
+            return series
+        return downcast
+    return series
+
+
+def optimize_dtypes(df: pd.DataFrame, min_rows: int = DTYPE_MIN_ROWS) -> DtypeOptimization:
+    bytes_before = estimate_size(df)
+    if len(df) < min_rows or df.columns.duplicated().any():
+        return DtypeOptimization(df, bytes_before, bytes_before)
+
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if is_object_dtype(series.dtype):
+            columns[column] = _optimize_object(series)
+        else:
+            columns[column] = _optimize_numeric(series)
+
+    optimized = df.copy(deep=False)
+    for column, series in columns.items():
+        optimized[column] = series
+    bytes_after = estimate_size(optimized)
+    if bytes_after >= bytes_before:
+        return DtypeOptimization(df, bytes_before, bytes_before)
+    return DtypeOptimization(optimized, bytes_before, bytes_after)
@@ -0,0 +1,82 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import pandas as pd
+
+from services.metrics import observe_export
+
+
+EXPORT_CACHE_MAX_BYTES = int(os.getenv("EXPORT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+EXPORT_CACHE_TTL_S = float(os.getenv("EXPORT_CACHE_TTL_S", "300"))
+
+
+class EncodedExportCache:
+    def __init__(self, max_bytes: int = EXPORT_CACHE_MAX_BYTES, ttl: float = EXPORT_CACHE_TTL_S) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= len(entry[0])
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            data, expires_at = entry
+            if expires_at <= time.time():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (data, time.time() + self.ttl)
+            self._total_bytes += len(data)
+            while self._total_bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_export_cache = EncodedExportCache()
+
+
+def get_export_cache() -> EncodedExportCache:
+    return _export_cache
+
+
+@dataclass(frozen=True)
+class LazyCsvExport:
+    export_name: str
+    cache_key: str
+    build: Callable[[], pd.DataFrame]
+
+    def __call__(self) -> bytes:
+        cache = get_export_cache()
+        data = cache.get(self.cache_key)
+        if data is None:
+            data = self.build().to_csv(index=False).encode("utf-8")
+            cache.put(self.cache_key, data)
+        observe_export(self.export_name, len(data))
+        return data
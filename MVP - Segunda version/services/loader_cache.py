@@ -0,0 +1,93 @@
+import functools
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+import pandas as pd
+import streamlit as st
+
+from core.profiling import profile_span
+from services.cache_budget import estimate_size, get_cache_budget
+from services.frame_dtypes import DTYPE_OPTIMIZER_ENABLED, optimize_dtypes
+from services.metrics import observe_cache_lookup, observe_dtype_savings
+from services.query_log import loader_scope, record_cache_hit
+from services.shared_cache import build_cache_key, load_shared, store_shared
+
+
+LoaderResult = TypeVar("LoaderResult")
+
+_lookup_missed: ContextVar[list[bool] | None] = ContextVar("lookup_missed", default=None)
+
+
+def cached_loader(
+    *,
+    ttl: int,
+    show_spinner: bool | str = True,
+    shared: bool = True,
+    version: str = "1",
+    optimize: bool = DTYPE_OPTIMIZER_ENABLED,
+) -> Callable[[Callable[..., LoaderResult]], Callable[..., LoaderResult]]:
+    def decorator(func: Callable[..., LoaderResult]) -> Callable[..., LoaderResult]:
+        loader_name = func.__name__
+
+        def load(*args: Any, **kwargs: Any) -> LoaderResult:
+            result = func(*args, **kwargs)
+            if optimize and isinstance(result, pd.DataFrame):
+                optimization = optimize_dtypes(result)
+                observe_dtype_savings(loader_name, optimization.saved_bytes)
+                return optimization.frame
+            return result
+
+        @functools.wraps(func)
+        def compute(*args: Any, **kwargs: Any) -> LoaderResult:
+            lookup = _lookup_missed.get()
+            if lookup is not None:
+                lookup[0] = True
+            with loader_scope(loader_name):
+                if not shared:
+                    return load(*args, **kwargs)
+                key = build_cache_key(loader_name, version, args, kwargs)
+                result = load_shared(loader_name, key, version)
+                if result is None:
+                    result = load(*args, **kwargs)
+                    store_shared(loader_name, key, result, ttl, version)
+                return result
+
+        cached = st.cache_data(ttl=ttl, show_spinner=show_spinner)(compute)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> LoaderResult:
+            lookup = [False]
+            token = _lookup_missed.set(lookup)
+            try:
+                with profile_span(loader_name, "load"):
+                    result = cached(*args, **kwargs)
+            finally:
+                _lookup_missed.reset(token)
+            observe_cache_lookup(loader_name, hit=not lookup[0])
+            budget_key = build_cache_key(loader_name, version, args, kwargs)
+            if lookup[0]:
+                get_cache_budget().record(
+                    budget_key,
+                    loader_name,
+                    estimate_size(result),
+                    ttl,
+                    lambda: cached.clear(*args, **kwargs),
+                )
+            else:
+                record_cache_hit(loader_name)
+                get_cache_budget().touch(budget_key)
+            return result
+
+        def clear(*args: Any, **kwargs: Any) -> None:
+            cached.clear(*args, **kwargs)
+            if args or kwargs:
+                get_cache_budget().discard(build_cache_key(loader_name, version, args, kwargs))
+            else:
+                get_cache_budget().discard_loader(loader_name)
+
+        wrapper.clear = clear
+        wrapper.shared = shared
+        return wrapper
+
+    return decorator
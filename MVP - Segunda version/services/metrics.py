@@ -0,0 +1,397 @@
+import bisect
+import logging
+import os
+import threading
+from collections.abc import Callable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from streamlit.runtime import Runtime
+
+from services.query_log import QueryRecord, add_query_listener
+
+
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9100"))
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in {"1", "true", "yes"}
+METRIC_PREFIX = "cliente_integral"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+RENDER_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (10_000, 100_000, 1_000_000, 10_000_000, 50_000_000, 100_000_000, 500_000_000)
+
+LOGGER = logging.getLogger("cliente_integral.metrics")
+
+LabelValues = tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self.name = f"{METRIC_PREFIX}_{name}"
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _check_labels(self, label_values: Sequence[str]) -> LabelValues:
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"{self.name} espera las etiquetas {self.label_names}.")
+        return tuple(str(value) for value in label_values)
+
+    def _sample_lines(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+            *self._sample_lines(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        key = self._check_labels(label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        with self._lock:
+            return self._values.get(self._check_labels(label_values), 0.0)
+
+    def snapshot(self) -> dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def _sample_lines(self) -> list[str]:
+        items = sorted(self.snapshot().items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    metric_type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        collector: Callable[[], dict[LabelValues, float]] | None = None,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[LabelValues, float] = {}
+        self._collector = collector
+
+    def set(self, value: float, *label_values: str) -> None:
+        key = self._check_labels(label_values)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        key = self._check_labels(label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *label_values: str, amount: float = 1.0) -> None:
+        self.inc(*label_values, amount=-amount)
+
+    def value(self, *label_values: str) -> float:
+        with self._lock:
+            return self._values.get(self._check_labels(label_values), 0.0)
+
+    def _sample_lines(self) -> list[str]:
+        if self._collector is not None:
+            try:
+                collected = self._collector()
+            except Exception:
+                LOGGER.exception("No fue posible calcular la métrica %s", self.name)
+                collected = {}
+            with self._lock:
+                self._values = dict(collected)
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        key = self._check_labels(label_values)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, *label_values: str) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._check_labels(label_values), []))
+
+    def _sample_lines(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+
+        lines: list[str] = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                labels = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def _collect_active_sessions() -> dict[LabelValues, float]:
+    if not Runtime.exists():
+        return {(): 0.0}
+    try:
+        return {(): float(Runtime.instance()._session_mgr.num_active_sessions())}
+    except Exception:
+        return {}
+
+
+def _collect_cache_hit_ratio() -> dict[LabelValues, float]:
+    ratios: dict[LabelValues, float] = {}
+    values = LOADER_CACHE_REQUESTS.snapshot()
+    for loader in {loader for loader, _ in values}:
+        hits = values.get((loader, "hit"), 0.0)
+        total = hits + values.get((loader, "miss"), 0.0)
+        ratios[(loader,)] = hits / total if total else 0.0
+    return ratios
+
+
+QUERY_DURATION = Histogram(
+    "query_duration_seconds",
+    "Duración total de las consultas al warehouse por loader.",
+    ("loader",),
+)
+QUERY_ROWS = Counter("query_rows_total", "Filas devueltas por el warehouse por loader.", ("loader",))
+QUERY_ERRORS = Counter("query_errors_total", "Consultas fallidas por loader.", ("loader",))
+WAREHOUSE_RESULT_CACHE = Counter(
+    "warehouse_result_cache_total",
+    "Ejecuciones por estado estimado de la caché de resultados del warehouse (first_seen/probable_hit/repeat_miss).",
+    ("loader", "result"),
+)
+LOADER_CACHE_REQUESTS = Counter(
+    "loader_cache_requests_total",
+    "Solicitudes a loaders cacheados por resultado (hit/miss).",
+    ("loader", "result"),
+)
+LOADER_CACHE_BYTES = Gauge(
+    "loader_cache_bytes",
+    "Memoria estimada de los resultados cacheados en este pod por loader.",
+    ("loader",),
+)
+LOADER_CACHE_EVICTIONS = Counter(
+    "loader_cache_evictions_total",
+    "Entradas desalojadas de la caché en memoria por loader y motivo (budget/oversized).",
+    ("loader", "reason"),
+)
+LOADER_DTYPE_SAVED_BYTES = Counter(
+    "loader_dtype_saved_bytes_total",
+    "Bytes ahorrados al optimizar los tipos de columnas de los resultados por loader.",
+    ("loader",),
+)
+SHARED_CACHE_REQUESTS = Counter(
+    "shared_cache_requests_total",
+    "Operaciones sobre la caché compartida entre réplicas por resultado (hit/miss/store/error).",
+    ("loader", "result"),
+)
+LOADER_CACHE_HIT_RATIO = Gauge(
+    "loader_cache_hit_ratio",
+    "Proporción de solicitudes resueltas desde caché por loader.",
+    ("loader",),
+    collector=_collect_cache_hit_ratio,
+)
+WAREHOUSE_CONNECTIONS_IN_USE = Gauge(
+    "warehouse_connections_in_use",
+    "Conexiones al warehouse abiertas en este momento.",
+)
+WAREHOUSE_CONNECTIONS_OPENED = Counter(
+    "warehouse_connections_opened_total",
+    "Conexiones al warehouse abiertas desde el arranque.",
+)
+ACTIVE_SESSIONS = Gauge(
+    "active_sessions",
+    "Sesiones de Streamlit activas en este pod.",
+    collector=_collect_active_sessions,
+)
+PAGE_RENDER_DURATION = Histogram(
+    "page_render_duration_seconds",
+    "Duración del render de cada página por rerun.",
+    ("page",),
+    buckets=RENDER_BUCKETS,
+)
+SESSION_FRAME_BYTES = Gauge(
+    "session_frame_bytes",
+    "Bytes de resultados guardados en las sesiones de este pod por almacenamiento (memory/disk).",
+    ("storage",),
+)
+EXPORT_SIZE = Histogram(
+    "export_size_bytes",
+    "Tamaño de los archivos preparados para descarga.",
+    ("export",),
+    buckets=SIZE_BUCKETS,
+)
+
+CACHE_WARMUP_TASKS = Counter(
+    "cache_warmup_tasks_total",
+    "Tareas de precalentamiento de caché por resultado (ok/error).",
+    ("task", "result"),
+)
+CACHE_WARMUP_PROGRESS = Gauge(
+    "cache_warmup_progress_ratio",
+    "Proporción de tareas de precalentamiento terminadas en este pod.",
+)
+PREFETCH_TASKS = Counter(
+    "prefetch_tasks_total",
+    "Precargas en segundo plano por vista y resultado (ok/error/skipped).",
+    ("view", "result"),
+)
+FIGURE_CACHE_REQUESTS = Counter(
+    "figure_cache_requests_total",
+    "Consultas a la caché de figuras Plotly por gráfico y resultado (hit/miss).",
+    ("chart", "result"),
+)
+
+REGISTRY: tuple[_Metric, ...] = (
+    QUERY_DURATION,
+    QUERY_ROWS,
+    QUERY_ERRORS,
+    WAREHOUSE_RESULT_CACHE,
+    LOADER_CACHE_REQUESTS,
+    LOADER_CACHE_BYTES,
+    LOADER_CACHE_EVICTIONS,
+    LOADER_DTYPE_SAVED_BYTES,
+    SHARED_CACHE_REQUESTS,
+    LOADER_CACHE_HIT_RATIO,
+    WAREHOUSE_CONNECTIONS_IN_USE,
+    WAREHOUSE_CONNECTIONS_OPENED,
+    ACTIVE_SESSIONS,
+    PAGE_RENDER_DURATION,
+    SESSION_FRAME_BYTES,
+    EXPORT_SIZE,
+    CACHE_WARMUP_TASKS,
+    CACHE_WARMUP_PROGRESS,
+    PREFETCH_TASKS,
+    FIGURE_CACHE_REQUESTS,
+)
+
+
+def observe_query_record(record: QueryRecord) -> None:
+    if record.cache_hit:
+        return
+    if record.error:
+        QUERY_ERRORS.inc(record.loader)
+        return
+    QUERY_DURATION.observe(record.total_ms / 1000, record.loader)
+    QUERY_ROWS.inc(record.loader, amount=record.rows)
+    if record.result_cache:
+        WAREHOUSE_RESULT_CACHE.inc(record.loader, record.result_cache)
+
+
+def observe_cache_lookup(loader_name: str, hit: bool) -> None:
+    LOADER_CACHE_REQUESTS.inc(loader_name, "hit" if hit else "miss")
+
+
+def observe_dtype_savings(loader_name: str, saved_bytes: int) -> None:
+    LOADER_DTYPE_SAVED_BYTES.inc(loader_name, amount=max(saved_bytes, 0))
+
+
+def observe_shared_cache(loader_name: str, result: str) -> None:
+    SHARED_CACHE_REQUESTS.inc(loader_name, result)
+
+
+def observe_export(export_name: str, size_bytes: int) -> None:
+    EXPORT_SIZE.observe(size_bytes, export_name)
+
+
+def render_metrics() -> str:
+    return "\n".join(metric.render() for metric in REGISTRY) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+_server: ThreadingHTTPServer | None = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int = METRICS_PORT) -> ThreadingHTTPServer | None:
+    global _server
+    if not METRICS_ENABLED:
+        return None
+
+    with _server_lock:
+        if _server is not None:
+            return _server
+        try:
+            server = ThreadingHTTPServer(("0.0.0.0", port), _MetricsHandler)
+        except OSError:
+            LOGGER.warning("No fue posible exponer métricas en el puerto %s.", port)
+            return None
+        threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+        _server = server
+        return server
+
+
+add_query_listener(observe_query_record)
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+
+
+QUERY_LOG_BUFFER_SIZE = int(os.getenv("QUERY_LOG_BUFFER_SIZE", "500"))
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("QUERY_SLOW_THRESHOLD_MS", "3000"))
+UNKNOWN_LOADER = "desconocido"
+RESULT_CACHE_WINDOW_S = float(os.getenv("RESULT_CACHE_WINDOW_S", "86400"))
+RESULT_CACHE_HIT_MAX_MS = float(os.getenv("RESULT_CACHE_HIT_MAX_MS", "500"))
+RESULT_CACHE_TRACKED_STATEMENTS = int(os.getenv("RESULT_CACHE_TRACKED_STATEMENTS", "4096"))
+RESULT_CACHE_FIRST_SEEN = "first_seen"
+RESULT_CACHE_PROBABLE_HIT = "probable_hit"
+RESULT_CACHE_REPEAT_MISS = "repeat_miss"
+
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_PARAM_MARKER_PATTERN = re.compile(r"(?<!:):[A-Za-z_]\w*")
+_NUMBER_LITERAL_PATTERN = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_IN_LIST_PATTERN = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+_current_loader: ContextVar[str | None] = ContextVar("current_loader", default=None)
+_records: deque["QueryRecord"] = deque(maxlen=QUERY_LOG_BUFFER_SIZE)
+_records_lock = threading.Lock()
+_listeners: list[Callable[["QueryRecord"], None]] = []
+_statements: OrderedDict[str, float] = OrderedDict()
+_statements_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class QueryRecord:
+    fingerprint: str
+    loader: str
+    cache_hit: bool
+    connect_ms: float = 0.0
+    execute_ms: float = 0.0
+    fetch_ms: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    error: str | None = None
+    result_cache: str | None = None
+    sql: str | None = None
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def total_ms(self) -> float:
+        return self.connect_ms + self.execute_ms + self.fetch_ms
+
+    def to_payload(self) -> dict[str, object]:
+        payload = asdict(self)
+        payload["total_ms"] = round(self.total_ms, 2)
+        if payload["sql"] is None:
+            del payload["sql"]
+        return payload
+
+
+def _build_logger() -> logging.Logger:
+    logger = logging.getLogger("cliente_integral.queries")
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(os.getenv("QUERY_LOG_LEVEL", "INFO").upper())
+        logger.propagate = False
+    return logger
+
+
+LOGGER = _build_logger()
+
+
+def normalize_sql(query: str) -> str:
+    normalized = _STRING_LITERAL_PATTERN.sub("?", query)
+    normalized = _PARAM_MARKER_PATTERN.sub("?", normalized)
+    normalized = _NUMBER_LITERAL_PATTERN.sub("?", normalized)
+    normalized = _IN_LIST_PATTERN.sub("IN (?...)", normalized)
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+def fingerprint_sql(query: str) -> str:
+    return hashlib.sha1(normalize_sql(query).encode("utf-8")).hexdigest()[:16]
+
+
+def classify_result_cache(statement: str, execute_ms: float, now: float | None = None) -> str:
+    now = time.time() if now is None else now
+    with _statements_lock:
+        last_seen = _statements.pop(statement, None)
+        _statements[statement] = now
+        while len(_statements) > RESULT_CACHE_TRACKED_STATEMENTS:
+            _statements.popitem(last=False)
+
+    if last_seen is None or now - last_seen > RESULT_CACHE_WINDOW_S:
+        return RESULT_CACHE_FIRST_SEEN
+    if execute_ms <= RESULT_CACHE_HIT_MAX_MS:
+        return RESULT_CACHE_PROBABLE_HIT
+    return RESULT_CACHE_REPEAT_MISS
+
+
+@contextmanager
+def loader_scope(loader_name: str) -> Iterator[None]:
+    token = _current_loader.set(loader_name)
+    try:
+        yield
+    finally:
+        _current_loader.reset(token)
+
+
+def get_current_loader() -> str:
+    loader_name = _current_loader.get()
+    if loader_name:
+        return loader_name
+
+    frame = sys._getframe(1)
+    while frame is not None:
+        function_name = frame.f_code.co_name
+        if function_name.startswith("load_"):
+            return function_name
+        frame = frame.f_back
+    return UNKNOWN_LOADER
+
+
+def record_query(record: QueryRecord, query: str | None = None) -> QueryRecord:
+    is_slow = not record.cache_hit and record.total_ms >= SLOW_QUERY_THRESHOLD_MS
+    if is_slow and query is not None:
+        record = QueryRecord(**{**asdict(record), "sql": query})
+
+    with _records_lock:
+        _records.append(record)
+
+    for listener in list(_listeners):
+        try:
+            listener(record)
+        except Exception:
+            LOGGER.exception("Falló un listener del registro de consultas.")
+
+    payload = record.to_payload()
+    if is_slow:
+        LOGGER.warning(json.dumps({"event": "slow_query", **payload}, ensure_ascii=False))
+    elif record.cache_hit:
+        LOGGER.debug(json.dumps({"event": "query", **payload}, ensure_ascii=False))
+    else:
+        LOGGER.info(json.dumps({"event": "query", **payload}, ensure_ascii=False))
+    return record
+
+
+def add_query_listener(listener: Callable[[QueryRecord], None]) -> None:
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def record_cache_hit(loader_name: str) -> QueryRecord:
+    return record_query(QueryRecord(fingerprint="", loader=loader_name, cache_hit=True))
+
+
+def get_recent_queries(limit: int | None = None) -> list[QueryRecord]:
+    with _records_lock:
+        records = list(_records)
+    if limit is not None:
+        return records[-limit:]
+    return records
+
+
+def clear_query_log() -> None:
+    with _records_lock:
+        _records.clear()
+    with _statements_lock:
+        _statements.clear()
@@ -0,0 +1,306 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import socket
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Protocol
+from urllib.parse import unquote, urlparse
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from services.metrics import observe_shared_cache
+
+
+SHARED_CACHE_URL = os.getenv("SHARED_CACHE_URL", "")
+SHARED_CACHE_NAMESPACE = os.getenv("SHARED_CACHE_NAMESPACE", "cliente_integral")
+SHARED_CACHE_VERSION = os.getenv("SHARED_CACHE_VERSION", "1")
+SHARED_CACHE_TIMEOUT_S = float(os.getenv("SHARED_CACHE_TIMEOUT_S", "2"))
+
+ENTRY_MAGIC = b"CICACHE1"
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+
+def _build_logger() -> logging.Logger:
+    logger = logging.getLogger("cliente_integral.shared_cache")
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(os.getenv("SHARED_CACHE_LOG_LEVEL", "WARNING").upper())
+        logger.propagate = False
+    return logger
+
+
+LOGGER = _build_logger()
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl: int) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class MemoryCacheBackend:
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class FilesystemCacheBackend:
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.parquet"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            value = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if decode_header(value).get("expires_at", 0) <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        path = self._path(key)
+        temporary = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_bytes(value)
+        os.replace(temporary, path)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class RespError(RuntimeError):
+    pass
+
+
+class RedisCacheBackend:
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        timeout: float = SHARED_CACHE_TIMEOUT_S,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> tuple[socket.socket, io.BufferedReader]:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        reader = sock.makefile("rb")
+        self._local.connection = (sock, reader)
+        if self.password:
+            self._execute("AUTH", self.password)
+        if self.db:
+            self._execute("SELECT", str(self.db))
+        return self._local.connection
+
+    def _reset(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            connection[1].close()
+            connection[0].close()
+
+    def _execute(self, *parts: str | bytes) -> object:
+        sock, reader = self._connection()
+        encoded = [part.encode("utf-8") if isinstance(part, str) else part for part in parts]
+        payload = b"".join(
+            [f"*{len(encoded)}\r\n".encode("ascii")]
+            + [f"${len(part)}\r\n".encode("ascii") + part + b"\r\n" for part in encoded]
+        )
+        try:
+            sock.sendall(payload)
+            return _read_resp(reader)
+        except (OSError, EOFError):
+            self._reset()
+            raise
+
+    def get(self, key: str) -> bytes | None:
+        value = self._execute("GET", key)
+        return value if isinstance(value, bytes) else None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._execute("SET", key, value, "EX", str(max(int(ttl), 1)))
+
+    def delete(self, key: str) -> None:
+        self._execute("DEL", key)
+
+
+def _read_line(reader: io.BufferedReader) -> bytes:
+    line = reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise EOFError("Conexión cerrada por el servidor de caché.")
+    return line[:-2]
+
+
+def _read_resp(reader: io.BufferedReader) -> object:
+    line = _read_line(reader)
+    prefix, body = line[:1], line[1:]
+    if prefix == b"+":
+        return body.decode("utf-8")
+    if prefix == b"-":
+        raise RespError(body.decode("utf-8"))
+    if prefix == b":":
+        return int(body)
+    if prefix == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        value = reader.read(length + 2)
+        if len(value) != length + 2:
+            raise EOFError("Respuesta incompleta del servidor de caché.")
+        return value[:-2]
+    if prefix == b"*":
+        length = int(body)
+        if length < 0:
+            return None
+        return [_read_resp(reader) for _ in range(length)]
+    raise RespError(f"Respuesta RESP no reconocida: {line!r}")
+
+
+def encode_dataframe(df: pd.DataFrame, ttl: int, version: str) -> bytes:
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=True), buffer, compression="zstd")
+    header = json.dumps(
+        {"version": version, "created_at": time.time(), "expires_at": time.time() + ttl},
+    ).encode("utf-8")
+    return ENTRY_MAGIC + _HEADER_LENGTH.pack(len(header)) + header + buffer.getvalue()
+
+
+def decode_header(value: bytes) -> dict[str, object]:
+    if not value.startswith(ENTRY_MAGIC):
+        return {}
+    start = len(ENTRY_MAGIC) + _HEADER_LENGTH.size
+    (length,) = _HEADER_LENGTH.unpack(value[len(ENTRY_MAGIC) : start])
+    return json.loads(value[start : start + length])
+
+
+def decode_dataframe(value: bytes, version: str) -> pd.DataFrame | None:
+    header = decode_header(value)
+    if header.get("version") != version or header.get("expires_at", 0) <= time.time():
+        return None
+    offset = len(ENTRY_MAGIC) + _HEADER_LENGTH.size
+    (length,) = _HEADER_LENGTH.unpack(value[len(ENTRY_MAGIC) : offset])
+    return pq.read_table(pa.BufferReader(value[offset + length :])).to_pandas()
+
+
+def build_cache_key(loader_name: str, loader_version: str, args: tuple, kwargs: dict[str, object]) -> str:
+    arguments = repr((args, sorted(kwargs.items())))
+    digest = hashlib.sha1(arguments.encode("utf-8")).hexdigest()
+    return f"{SHARED_CACHE_NAMESPACE}:{SHARED_CACHE_VERSION}:{loader_name}:{loader_version}:{digest}"
+
+
+def create_backend(url: str) -> CacheBackend | None:
+    if not url:
+        return None
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return MemoryCacheBackend()
+    if parsed.scheme == "file":
+        return FilesystemCacheBackend(unquote(parsed.path))
+    if parsed.scheme == "redis":
+        return RedisCacheBackend(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6379,
+            db=int(parsed.path.lstrip("/") or 0),
+            password=unquote(parsed.password) if parsed.password else None,
+        )
+    raise ValueError(f"Backend de caché compartida no válido: {url}")
+
+
+_backend: CacheBackend | None = None
+_backend_url: str | None = None
+_backend_lock = threading.Lock()
+
+
+def get_shared_cache() -> CacheBackend | None:
+    global _backend, _backend_url
+    url = os.getenv("SHARED_CACHE_URL", SHARED_CACHE_URL)
+    with _backend_lock:
+        if _backend_url != url:
+            _backend = create_backend(url)
+            _backend_url = url
+        return _backend
+
+
+def set_shared_cache(backend: CacheBackend | None) -> None:
+    global _backend, _backend_url
+    with _backend_lock:
+        _backend = backend
+        _backend_url = os.getenv("SHARED_CACHE_URL", SHARED_CACHE_URL)
+
+
+def _log_error(event: str, loader_name: str, exc: Exception) -> None:
+    observe_shared_cache(loader_name, "error")
+    LOGGER.warning(
+        json.dumps({"event": event, "loader": loader_name, "error": type(exc).__name__}, ensure_ascii=False)
+    )
+
+
+def load_shared(loader_name: str, key: str, version: str) -> pd.DataFrame | None:
+    backend = get_shared_cache()
+    if backend is None:
+        return None
+    try:
+        value = backend.get(key)
+        df = decode_dataframe(value, version) if value is not None else None
+    except Exception as exc:
+        _log_error("shared_cache_get", loader_name, exc)
+        return None
+    observe_shared_cache(loader_name, "hit" if df is not None else "miss")
+    return df
+
+
+def store_shared(loader_name: str, key: str, df: pd.DataFrame, ttl: int, version: str) -> None:
+    backend = get_shared_cache()
+    if backend is None or not isinstance(df, pd.DataFrame):
+        return
+    try:
+        backend.set(key, encode_dataframe(df, ttl, version), ttl)
+    except Exception as exc:
+        _log_error("shared_cache_set", loader_name, exc)
+        return
+    observe_shared_cache(loader_name, "store")
@@ -0,0 +1,38 @@
+import unicodedata
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+def strip_accents(value: str) -> str:
+    return "".join(char for char in unicodedata.normalize("NFKD", value) if not unicodedata.combining(char))
+
+
+def _clean_unique(value: object) -> object:
+    return strip_accents(value) if isinstance(value, str) else value
+
+
+def strip_accents_series(series: pd.Series) -> pd.Series:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        cleaned = [_clean_unique(value) for value in series.cat.categories]
+        if len(set(cleaned)) == len(cleaned):
+            return series.cat.rename_categories(cleaned)
+        series = series.astype(object)
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    cleaned = np.empty(len(uniques), dtype=object)
+    cleaned[:] = [_clean_unique(value) for value in uniques]
+    values = np.where(codes >= 0, cleaned.take(np.maximum(codes, 0)), series.to_numpy(dtype=object))
+    dtype = series.dtype if isinstance(series.dtype, pd.StringDtype) else object
+    return pd.Series(values, index=series.index, name=series.name, dtype=dtype)
+
+
+def strip_accents_columns(df: pd.DataFrame, columns: Iterable[object]) -> pd.DataFrame:
+    columns = [column for column in columns if column in df.columns]
+    if not columns:
+        return df
+    df = df.copy(deep=False)
+    for column in columns:
+        df[column] = strip_accents_series(df[column])
+    return df
@@ -0,0 +1,45 @@
+import unittest
+
+from benchmarks.harness import RerunSample, ScenarioResult, compare_reports, percentile, summarize_samples
+
+
+def _report(p95_ms: float, queries: float) -> dict[str, object]:
+    return {
+        "scenarios": [
+            {
+                "name": "valoracion_filtros",
+                "summary": {"abrir": {"p95_ms": p95_ms, "queries_per_rerun": queries}},
+            }
+        ]
+    }
+
+
+class BenchmarkHarnessTestCase(unittest.TestCase):
+    def test_percentile_interpolates_between_samples(self) -> None:
+        self.assertEqual(percentile([], 0.5), 0.0)
+        self.assertEqual(percentile([10.0, 20.0, 30.0, 40.0], 0.5), 25.0)
+        self.assertAlmostEqual(percentile([10.0, 20.0, 30.0, 40.0], 0.95), 38.5)
+
+    def test_summary_groups_samples_by_step(self) -> None:
+        scenario = ScenarioResult(
+            name="buscador",
+            samples=[
+                RerunSample(step="cliente_0", iteration=0, latency_ms=80.0, queries=11, cache_hits=2),
+                RerunSample(step="cliente_0", iteration=1, latency_ms=40.0, queries=0, cache_hits=13),
+            ],
+        )
+        summary = scenario.summary()["cliente_0"]
+        self.assertEqual(summary["runs"], 2)
+        self.assertEqual(summary["p50_ms"], 60.0)
+        self.assertEqual(summary["queries_per_rerun"], 5.5)
+        self.assertEqual(summarize_samples([])["runs"], 0)
+
+    def test_compare_reports_flags_latency_and_query_regressions(self) -> None:
+        self.assertEqual(compare_reports(_report(110.0, 24), _report(100.0, 24)), [])
+        regressions = compare_reports(_report(150.0, 30), _report(100.0, 24))
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("valoracion_filtros/abrir", regressions[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
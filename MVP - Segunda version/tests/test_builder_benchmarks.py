@@ -0,0 +1,42 @@
+import unittest
+
+from benchmarks.builders import (
+    MAX_BUILD_MS,
+    BuilderMeasurement,
+    build_cases,
+    check_thresholds,
+    find_uncovered_builders,
+    run_builder_benchmarks,
+)
+
+
+class BuilderBenchmarksTestCase(unittest.TestCase):
+    def test_every_query_builder_has_a_case(self) -> None:
+        self.assertEqual(find_uncovered_builders(build_cases(barrios=10, contracts=10)), [])
+
+    def test_base_cases_stay_within_thresholds(self) -> None:
+        measurements = [item for item in run_builder_benchmarks(barrios=10, contracts=10, repeat=5) if item.variant == "base"]
+        self.assertEqual(check_thresholds(measurements, max_build_ms=MAX_BUILD_MS * 4), [])
+
+    def test_compact_location_filters_stay_within_thresholds(self) -> None:
+        measurements = [
+            item
+            for item in run_builder_benchmarks(barrios=2000, contracts=10, repeat=1)
+            if item.variant in ("base", "barrios_2000_compacto") and item.builder.startswith("dashboard_queries.")
+        ]
+        self.assertTrue(any(item.variant == "barrios_2000_compacto" for item in measurements))
+        self.assertEqual([item for item in check_thresholds(measurements) if "ms de construcción" not in item], [])
+
+    def test_thresholds_flag_size_and_growth(self) -> None:
+        violations = check_thresholds(
+            [
+                BuilderMeasurement("dashboard_queries.get_kpis_query", "base", 1500, 0.01, 2, 0),
+                BuilderMeasurement("dashboard_queries.get_kpis_query", "barrios_2000", 53000, 0.5, 2, 2016),
+            ]
+        )
+        self.assertEqual(len(violations), 2)
+        self.assertTrue(all("barrios_2000" in violation for violation in violations))
+
+
+if __name__ == "__main__":
+    unittest.main()
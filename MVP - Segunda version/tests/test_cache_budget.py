@@ -0,0 +1,108 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from services.cache_budget import CacheBudget, cgroup_memory_limit, estimate_size, get_cache_budget
+from services.loader_cache import cached_loader
+from services.metrics import LOADER_CACHE_EVICTIONS
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"Identificacion": [f"{index:010d}" for index in range(rows)], "Valor": range(rows)})
+
+
+class CacheBudgetTestCase(unittest.TestCase):
+    def test_estimate_size_counts_object_payloads(self) -> None:
+        df = _frame(1000)
+        self.assertEqual(estimate_size(df), int(df.memory_usage(deep=True).sum()))
+        self.assertGreater(estimate_size(df), 1000 * 50)
+        table = pa.Table.from_pandas(df)
+        self.assertEqual(estimate_size(table), table.nbytes)
+        self.assertGreater(estimate_size({"a": ["x" * 100]}), 100)
+
+    def test_cgroup_limit_parsing(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            v2 = Path(directory) / "memory.max"
+            v1 = Path(directory) / "memory.limit_in_bytes"
+            self.assertIsNone(cgroup_memory_limit((v2, v1)))
+            v1.write_text("536870912\n", encoding="utf-8")
+            self.assertEqual(cgroup_memory_limit((v2, v1)), 536870912)
+            v2.write_text("max\n", encoding="utf-8")
+            self.assertIsNone(cgroup_memory_limit((v2, v1)))
+            v2.write_text("9223372036854771712\n", encoding="utf-8")
+            self.assertIsNone(cgroup_memory_limit((v2, v1)))
+
+    def test_evicts_least_recently_used_within_budget(self) -> None:
+        evicted: list[str] = []
+        budget = CacheBudget(budget_bytes=250)
+        for key in ("a", "b"):
+            budget.record(key, "load_test", 100, 60, lambda key=key: evicted.append(key))
+        budget.touch("a")
+        budget.record("c", "load_test", 100, 60, lambda: evicted.append("c"))
+
+        self.assertEqual(evicted, ["b"])
+        self.assertEqual(budget.total_bytes, 200)
+        self.assertEqual(budget.loader_bytes("load_test"), 200)
+        self.assertNotIn("b", budget)
+
+    def test_rerecording_replaces_size_and_oversized_entries_are_dropped(self) -> None:
+        evicted: list[str] = []
+        budget = CacheBudget(budget_bytes=250)
+        budget.record("a", "load_test", 100, 60, lambda: evicted.append("a"))
+        budget.record("a", "load_test", 150, 60, lambda: evicted.append("a"))
+        self.assertEqual(budget.total_bytes, 150)
+        budget.record("grande", "load_test", 500, 60, lambda: evicted.append("grande"))
+        self.assertEqual(evicted, ["grande"])
+        self.assertNotIn("grande", budget)
+
+    def test_expired_entries_are_released_first(self) -> None:
+        evicted: list[str] = []
+        budget = CacheBudget(budget_bytes=1000)
+        budget.record("vencida", "load_test", 100, -1, lambda: evicted.append("vencida"))
+        budget.record("vigente", "load_test", 100, 60, lambda: evicted.append("vigente"))
+        self.assertEqual(evicted, ["vencida"])
+        self.assertEqual(budget.total_bytes, 100)
+
+
+class CachedLoaderBudgetTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.budget = get_cache_budget()
+        self.original_budget = self.budget.budget_bytes
+        self.budget.clear()
+
+    def tearDown(self) -> None:
+        self.budget.budget_bytes = self.original_budget
+        self.budget.clear()
+
+    def test_loader_results_are_evicted_from_streamlit_cache(self) -> None:
+        calls: list[int] = []
+
+        @cached_loader(ttl=60, show_spinner=False, shared=False, optimize=False)
+        def load_budget_example(rows: int) -> pd.DataFrame:
+            calls.append(rows)
+            return _frame(rows)
+
+        load_budget_example.clear()
+        self.budget.budget_bytes = estimate_size(_frame(1000)) + estimate_size(_frame(10)) + 1000
+
+        load_budget_example(1000)
+        load_budget_example(10)
+        load_budget_example(1000)
+        self.assertEqual(calls, [1000, 10])
+
+        load_budget_example(500)
+        self.assertLessEqual(self.budget.total_bytes, self.budget.budget_bytes)
+        self.assertGreaterEqual(LOADER_CACHE_EVICTIONS.value("load_budget_example", "budget"), 1)
+
+        load_budget_example(10)
+        self.assertEqual(calls, [1000, 10, 500, 10])
+
+        load_budget_example.clear()
+        self.assertEqual(self.budget.loader_bytes("load_budget_example"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,55 +13,61 @@ from repositories.client_search_queries import (
 
 class ClientSearchQueriesTestCase(unittest.TestCase):
     def test_tipo_identificacion_options_query_uses_contracts_table(self) -> None:
-        query = get_tipo_identificacion_options_query()
+        query = get_tipo_identificacion_options_query().sql
         self.assertIn("modelo_contratosresidencial", query)
         self.assertIn("SELECT DISTINCT TipoIdentificacion", query)
 
     def test_cliente_raw_query_deduplicates_person_records(self) -> None:
-        query = get_cliente_raw_query("CC", "123")
+        query, params = get_cliente_raw_query("CC", "123")
         self.assertIn("modelo_dimcliente", query)
         self.assertIn("QUALIFY ROW_NUMBER()", query)
-        self.assertIn("TipoIdentificacion = 'CC'", query)
-        self.assertIn("Identificacion = '123'", query)
+        self.assertIn("TipoIdentificacion = :tipo_identificacion", query)
+        self.assertIn("Identificacion = :identificacion", query)
+        self.assertEqual(params, {"tipo_identificacion": "CC", "identificacion": "123"})
 
     def test_cliente_contratos_raw_query_filters_person(self) -> None:
-        query = get_cliente_contratos_raw_query("CC", "123", "Residencial")
+        query, params = get_cliente_contratos_raw_query("CC", "123", "Residencial")
         self.assertIn("modelo_contratosresidencial", query)
-        self.assertIn("TipoIdentificacion = 'CC'", query)
-        self.assertIn("Identificacion = '123'", query)
+        self.assertIn("TipoIdentificacion = :tipo_identificacion", query)
+        self.assertIn("Identificacion = :identificacion", query)
+        self.assertEqual(params, {"tipo_identificacion": "CC", "identificacion": "123"})
 
     def test_cliente_contratos_summary_query_uses_summary_table(self) -> None:
-        query = get_cliente_contratos_summary_query("CC", "123", "Residencial")
+        query, params = get_cliente_contratos_summary_query("CC", "123", "Residencial")
         self.assertIn("modelo_contratosresidencial", query)
         self.assertIn("ContratosActivos", query)
-        self.assertIn("TipoIdentificacion = 'CC'", query)
-        self.assertIn("Identificacion = '123'", query)
+        self.assertIn("TipoIdentificacion = :tipo_identificacion", query)
+        self.assertIn("Identificacion = :identificacion", query)
+        self.assertEqual(params, {"tipo_identificacion": "CC", "identificacion": "123"})
 
     def test_cliente_contratos_queries_use_commercial_table_for_comercial(self) -> None:
-        raw_query = get_cliente_contratos_raw_query("CC", "123", "Comercial")
-        summary_query = get_cliente_contratos_summary_query("CC", "123", "Comercial")
+        raw_query = get_cliente_contratos_raw_query("CC", "123", "Comercial").sql
+        summary_query = get_cliente_contratos_summary_query("CC", "123", "Comercial").sql
         self.assertIn("modelo_contratoscomercial", raw_query)
         self.assertIn("modelo_contratoscomercial", summary_query)
 
     def test_contratos_detalle_query_filters_by_category_and_contracts(self) -> None:
-        query = get_contratos_detalle_query(["1001", "1002"], "Comercial")
+        query, params = get_contratos_detalle_query(["1001", "1002"], "Comercial")
         self.assertIn("dwhbiefg.comun.dimcontrato", query)
         self.assertIn("LEFT JOIN analiticaefg.clienteintegral.modelo_dimubicacion", query)
         self.assertIn("c.Valido = 1", query)
         self.assertIn("c.Categoria = 2", query)
-        self.assertIn("c.Contrato IN ('1001', '1002')", query)
+        self.assertIn("c.Contrato IN (:contrato_0, :contrato_1)", query)
+        self.assertEqual(params, {"contrato_0": "1001", "contrato_1": "1002"})
 
     def test_cliente_dimensiones_query_uses_dimension_table_by_universe(self) -> None:
-        query = get_cliente_dimensiones_query("CC", "123", "Residencial")
+        query, params = get_cliente_dimensiones_query("CC", "123", "Residencial")
         self.assertIn("dimensiones_residencial", query)
-        self.assertIn("TipoIdentificacion = 'CC'", query)
-        self.assertIn("Identificacion = '123'", query)
+        self.assertIn("TipoIdentificacion = :tipo_identificacion", query)
+        self.assertIn("Identificacion = :identificacion", query)
+        self.assertEqual(params, {"tipo_identificacion": "CC", "identificacion": "123"})
 
     def test_cliente_detalle_servicio_query_targets_service_table(self) -> None:
-        query = get_cliente_detalle_servicio_query("CC", "123", "Comercial", "brilla", "indicadores")
+        query, params = get_cliente_detalle_servicio_query("CC", "123", "Comercial", "brilla", "indicadores")
         self.assertIn("brilla_comercial_consolidado_indicadores", query)
-        self.assertIn("TipoIdentificacion = 'CC'", query)
-        self.assertIn("Identificacion = '123'", query)
+        self.assertIn("TipoIdentificacion = :tipo_identificacion", query)
+        self.assertIn("Identificacion = :identificacion", query)
+        self.assertEqual(params, {"tipo_identificacion": "CC", "identificacion": "123"})
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 ﻿import unittest
 
 from repositories.dashboard_queries import (
+    KeyedSelection,
     build_filters_where,
     build_in_clause,
+    build_key_predicate,
     build_limit_clause,
+    compact_filter_values,
+    compress_key_ranges,
     get_clientes_mayor_aporte_query,
     get_clasificacion_integral_query,
     get_combinaciones_servicios_query,
@@ -27,22 +31,75 @@ class DashboardQueriesTestCase(unittest.TestCase):
             ["MERCADO RELEVANTE -ASE CALDAS", "OTRO"],
         )
 
-    def test_build_in_clause_escapes_single_quotes(self) -> None:
-        clause = build_in_clause("departamento", ["O'Higgins"])
-        self.assertIn("O''Higgins", clause)
-        self.assertIn("departamento IN", clause)
+    def test_build_in_clause_passes_values_as_parameters(self) -> None:
+        clause, params = build_in_clause("departamento", ["O'Higgins", "Caldas"])
+        self.assertEqual(clause.strip(), "AND departamento IN (:departamento_0, :departamento_1)")
+        self.assertEqual(params, {"departamento_0": "Caldas", "departamento_1": "O'Higgins"})
+
+    def test_build_in_clause_orders_and_deduplicates_values(self) -> None:
+        self.assertEqual(
+            build_in_clause("barrio", ["Cuba", "Centro", "Cuba"]),
+            build_in_clause("barrio", ["Centro", "Cuba"]),
+        )
 
     def test_build_filters_where_includes_all_selected_filters(self) -> None:
-        where_clause = build_filters_where(
+        where_clause, params = build_filters_where(
             departamentos=["Antioquia"],
             localidades=["Medellin"],
             barrios=["Centro"],
             mercados=["CALDAS"],
         )
-        self.assertIn("departamento IN ('Antioquia')", where_clause)
-        self.assertIn("localidad IN ('Medellin')", where_clause)
-        self.assertIn("barrio IN ('Centro')", where_clause)
-        self.assertIn("MercadoRelevante IN ('MERCADO RELEVANTE -ASE CALDAS')", where_clause)
+        self.assertIn("departamento IN (:departamento_0)", where_clause)
+        self.assertIn("localidad IN (:localidad_0)", where_clause)
+        self.assertIn("barrio IN (:barrio_0)", where_clause)
+        self.assertIn("MercadoRelevante IN (:mercadorelevante_0)", where_clause)
+        self.assertEqual(
+            params,
+            {
+                "departamento_0": "Antioquia",
+                "localidad_0": "Medellin",
+                "barrio_0": "Centro",
+                "mercadorelevante_0": "MERCADO RELEVANTE -ASE CALDAS",
+            },
+        )
+
+    def test_filter_queries_share_sql_text_across_values(self) -> None:
+        caldas = get_kpis_query("Residencial", barrios=["Centro"], mercados=["CALDAS"])
+        quindio = get_kpis_query("Residencial", barrios=["Cuba"], mercados=["QUINDIO"])
+        self.assertEqual(caldas.sql, quindio.sql)
+        self.assertNotEqual(caldas.params, quindio.params)
+
+    def test_compress_key_ranges_merges_consecutive_keys(self) -> None:
+        self.assertEqual(compress_key_ranges([7, 3, 1, 2, 3, 9, 8]), [(1, 3), (7, 9)])
+
+    def test_build_key_predicate_uses_ranges_and_singles(self) -> None:
+        self.assertEqual(
+            build_key_predicate("IdBarrio", [1, 2, 3, 4, 10, 12, 13]),
+            "IdBarrio BETWEEN 1 AND 4 OR IdBarrio IN (10, 12, 13)",
+        )
+        self.assertEqual(build_key_predicate("IdBarrio", []), "1=0")
+
+    def test_build_in_clause_uses_semi_join_for_keyed_selection(self) -> None:
+        clause = build_in_clause("barrio", KeyedSelection(values=("Centro", "Cuba"), keys=(5, 6, 7))).sql
+        self.assertIn("barrio IN (SELECT barrio FROM analiticaefg.clienteintegral.modelo_dimubicacion", clause)
+        self.assertIn("IdBarrio BETWEEN 5 AND 7", clause)
+        self.assertNotIn("'Centro'", clause)
+
+        with self.assertRaises(ValueError):
+            build_in_clause("mercado", KeyedSelection(values=("CALDAS",), keys=(1,)))
+
+    def test_compact_filter_values_only_compacts_above_threshold(self) -> None:
+        lookup = {f"Barrio {index}": (index,) for index in range(10)}
+        values = list(lookup)
+
+        self.assertEqual(compact_filter_values("barrio", values, lookup, threshold=20), values)
+        self.assertEqual(compact_filter_values("barrio", values + ["Otro"], lookup, threshold=5), values + ["Otro"])
+        self.assertEqual(compact_filter_values("barrio", values, None, threshold=5), values)
+
+        compacted = compact_filter_values("barrio", values, lookup, threshold=5)
+        self.assertIsInstance(compacted, KeyedSelection)
+        self.assertEqual(compacted.keys, tuple(range(10)))
+        self.assertIn("IdBarrio BETWEEN 0 AND 9", build_filters_where(barrios=compacted).sql)
 
     def test_build_limit_clause_validates_positive_limit(self) -> None:
         self.assertEqual(build_limit_clause(100).strip(), "LIMIT 100")
@@ -57,7 +114,7 @@ class DashboardQueriesTestCase(unittest.TestCase):
         self.assertIn("dimensiones_comercial", get_dimension_table("Comercial"))
 
     def test_get_kpis_query_uses_expected_table(self) -> None:
-        query = get_kpis_query("Comercial")
+        query = get_kpis_query("Comercial").sql
         self.assertIn("modelo_datosclientecomercial", query)
         self.assertIn("dimensiones_comercial", query)
         self.assertIn("COALESCE(dim.efisoluciones, 0)", query)
@@ -66,12 +123,12 @@ class DashboardQueriesTestCase(unittest.TestCase):
         self.assertIn("NumeroServicios >= 3", query)
 
     def test_clasificacion_query_contains_single_dimension_cte(self) -> None:
-        query = get_clasificacion_integral_query("Residencial")
+        query = get_clasificacion_integral_query("Residencial").sql
         self.assertEqual(query.count("WITH base_filtrada"), 1)
         self.assertEqual(query.count("clasif AS"), 1)
 
     def test_consolidado_general_query_can_limit_preview_rows(self) -> None:
-        query = get_consolidado_general_query("Residencial", limit=100)
+        query = get_consolidado_general_query("Residencial", limit=100).sql
         self.assertIn("LIMIT 100", query)
 
     def test_detalle_servicio_query_can_limit_preview_rows(self) -> None:
@@ -80,7 +137,7 @@ class DashboardQueriesTestCase(unittest.TestCase):
             categoria="Residencial",
             tipo_detalle="dimensiones",
             limit=100,
-        )
+        ).sql
         self.assertIn("LIMIT 100", query)
 
     def test_detalle_servicio_query_supports_new_service_tables(self) -> None:
@@ -88,18 +145,18 @@ class DashboardQueriesTestCase(unittest.TestCase):
             servicio="seguros",
             categoria="Residencial",
             tipo_detalle="variables",
-        )
+        ).sql
         self.assertIn("seguros_residencial_consolidado_variables", residencial_query)
 
         comercial_query = get_detalle_servicio_query(
             servicio="brilla",
             categoria="Comercial",
             tipo_detalle="indicadores",
-        )
+        ).sql
         self.assertIn("brilla_comercial_consolidado_indicadores", comercial_query)
 
     def test_numero_servicios_query_uses_residential_dimensions_table(self) -> None:
-        query = get_numero_servicios_query("Residencial")
+        query = get_numero_servicios_query("Residencial").sql
         self.assertIn("dimensiones_residencial", query)
         self.assertIn("COALESCE(dim.consumo, 0)", query)
         self.assertIn("COALESCE(dim.rtr, 0)", query)
@@ -109,23 +166,23 @@ class DashboardQueriesTestCase(unittest.TestCase):
         self.assertIn("HAVING NumeroServicios BETWEEN 1 AND 5", query)
 
     def test_numero_servicios_query_uses_commercial_dimensions_table(self) -> None:
-        query = get_numero_servicios_query("Comercial")
+        query = get_numero_servicios_query("Comercial").sql
         self.assertIn("dimensiones_comercial", query)
         self.assertIn("COALESCE(dim.efisoluciones, 0)", query)
         self.assertIn("COALESCE(dim.brilla, 0)", query)
         self.assertIn("HAVING NumeroServicios BETWEEN 1 AND 4", query)
 
     def test_penetracion_query_uses_dimension_services_by_category(self) -> None:
-        residencial_query = get_penetracion_servicios_query("Residencial")
+        residencial_query = get_penetracion_servicios_query("Residencial").sql
         self.assertIn("SUM(Brilla)", residencial_query)
         self.assertIn("SUM(seguros)", residencial_query)
 
-        comercial_query = get_penetracion_servicios_query("Comercial")
+        comercial_query = get_penetracion_servicios_query("Comercial").sql
         self.assertIn("SUM(efisoluciones)", comercial_query)
         self.assertIn("SUM(brilla)", comercial_query)
 
     def test_combinaciones_query_uses_dimension_table_and_labels(self) -> None:
-        query = get_combinaciones_servicios_query("Residencial")
+        query = get_combinaciones_servicios_query("Residencial").sql
         self.assertIn("dimensiones_residencial", query)
         self.assertIn("CONCAT_WS(' + '", query)
         self.assertIn("'Consumo'", query)
@@ -133,7 +190,7 @@ class DashboardQueriesTestCase(unittest.TestCase):
         self.assertIn("LIMIT 5", query)
 
     def test_aporte_query_uses_variable_tables_and_services(self) -> None:
-        query = get_clientes_mayor_aporte_query("Comercial")
+        query = get_clientes_mayor_aporte_query("Comercial").sql
         self.assertIn("consumo_comercial_consolidado_variables", query)
         self.assertIn("rtr_comercial_consolidado_variables", query)
         self.assertIn("efisoluciones_comercial_consolidado_variables", query)
@@ -143,13 +200,13 @@ class DashboardQueriesTestCase(unittest.TestCase):
         self.assertIn("LIMIT 5", query)
 
     def test_service_classification_query_uses_brilla_dimension_table(self) -> None:
-        query = get_service_classification_query("Residencial", "brilla")
+        query = get_service_classification_query("Residencial", "brilla").sql
         self.assertIn("brilla_residencial_consolidado_dimensiones", query)
         self.assertIn("ClasificacionRFM", query)
         self.assertIn("modelo_datosclienteresidencial", query)
 
     def test_service_classification_profile_query_averages_dimension_columns(self) -> None:
-        query = get_service_classification_profile_query("Comercial", "brilla")
+        query = get_service_classification_profile_query("Comercial", "brilla").sql
         self.assertIn("AVG(COALESCE(det.Economica, 0))", query)
         self.assertIn("AVG(COALESCE(det.Cumplimiento, 0))", query)
         self.assertIn("AVG(COALESCE(det.Relacional, 0))", query)
@@ -0,0 +1,61 @@
+import unittest
+
+from features.valoracion_integral.detail_prefetch import (
+    DetailTransitions,
+    default_next_selection,
+    predict_next_selection,
+)
+from features.valoracion_integral.models import DetailSelection
+
+SERVICIOS = ("consumo", "rtr", "brilla")
+TIPOS = ("dimensiones", "indicadores", "variables")
+
+
+class DetailPrefetchTestCase(unittest.TestCase):
+    def test_default_walks_tipos_then_next_service(self) -> None:
+        self.assertEqual(
+            default_next_selection(DetailSelection("consumo", "dimensiones"), SERVICIOS, TIPOS),
+            DetailSelection("consumo", "indicadores"),
+        )
+        self.assertEqual(
+            default_next_selection(DetailSelection("brilla", "variables"), SERVICIOS, TIPOS),
+            DetailSelection("consumo", "dimensiones"),
+        )
+
+    def test_prediction_follows_most_common_transition(self) -> None:
+        transitions = DetailTransitions()
+        start = DetailSelection("consumo", "dimensiones")
+        transitions.record(start, DetailSelection("brilla", "dimensiones"))
+        transitions.record(start, DetailSelection("brilla", "dimensiones"))
+        transitions.record(start, DetailSelection("rtr", "variables"))
+        transitions.record(start, start)
+        transitions.record(None, start)
+
+        self.assertEqual(
+            predict_next_selection(start, SERVICIOS, TIPOS, transitions),
+            DetailSelection("brilla", "dimensiones"),
+        )
+
+    def test_prediction_ignores_combinations_outside_current_category(self) -> None:
+        transitions = DetailTransitions()
+        start = DetailSelection("consumo", "dimensiones")
+        transitions.record(start, DetailSelection("seguros", "dimensiones"))
+        self.assertEqual(
+            predict_next_selection(start, SERVICIOS, TIPOS, transitions),
+            DetailSelection("consumo", "indicadores"),
+        )
+
+    def test_tracked_sources_are_bounded(self) -> None:
+        transitions = DetailTransitions(max_sources=2)
+        for servicio in SERVICIOS:
+            transitions.record(DetailSelection(servicio, "dimensiones"), DetailSelection(servicio, "variables"))
+        self.assertIsNone(
+            transitions.most_likely(
+                DetailSelection("consumo", "dimensiones"),
+                [DetailSelection("consumo", "variables")],
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+import streamlit as st
+
+HAS_DUCKDB = importlib.util.find_spec("duckdb") is not None
+
+if HAS_DUCKDB:
+    from features.buscador_clientes.data import load_customer_contracts, load_customer_contracts_summary, search_customer
+    from features.buscador_clientes.models import CustomerSearchRequest
+    from features.decisiones_estrategicas.data import (
+        load_consolidar_result,
+        load_fidelizar_result,
+        load_potenciar_result,
+        load_recuperar_result,
+    )
+    from features.decisiones_estrategicas.models import (
+        ConsolidarRequest,
+        FidelizarRequest,
+        PotenciarRequest,
+        RecuperarRequest,
+    )
+    from features.valoracion_integral import data as valoracion_data
+    from features.valoracion_integral.models import DashboardFilters
+    from repositories.dashboard_queries import compact_filter_values, get_kpis_query
+    from services.databricks_conn import run_query
+    from services.fake_warehouse import create_fake_warehouse, reset_fake_warehouse, translate_sql
+    from services.query_log import RESULT_CACHE_FIRST_SEEN, clear_query_log, get_recent_queries
+
+
+@unittest.skipUnless(HAS_DUCKDB, "duckdb no está instalado")
+class FakeWarehouseTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.env = mock.patch.dict(os.environ, {"WAREHOUSE_BACKEND": "fake"})
+        cls.env.start()
+        cls.connection = create_fake_warehouse(clients=3000, directory="")
+        reset_fake_warehouse(cls.connection)
+        st.cache_data.clear()
+        cls.cliente = cls.connection.execute(
+            """
+            SELECT c.TipoIdentificacion, c.Identificacion
+            FROM analiticaefg.clienteintegral.dimensiones_residencial c
+            WHERE c.rtr = 1 AND c.Brilla = 1
+            ORDER BY c.Identificacion
+            LIMIT 1
+            """
+        ).fetchone()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        reset_fake_warehouse()
+        st.cache_data.clear()
+        cls.env.stop()
+
+    def test_translate_sql_only_rewrites_identifier_quotes(self) -> None:
+        self.assertEqual(
+            translate_sql("SELECT v.`edad_cliente` AS `rtr_edad` FROM t WHERE x = 'a`b'"),
+            "SELECT v.\"edad_cliente\" AS \"rtr_edad\" FROM t WHERE x = 'a`b'",
+        )
+
+    def test_translate_sql_rewrites_named_parameters_outside_literals(self) -> None:
+        self.assertEqual(
+            translate_sql("SELECT x::INT FROM t WHERE a = :tipo AND b = ':literal'"),
+            "SELECT x::INT FROM t WHERE a = $tipo AND b = ':literal'",
+        )
+
+    def test_valoracion_loaders_run_for_both_categories(self) -> None:
+        for categoria in ("Residencial", "Comercial"):
+            with self.subTest(categoria=categoria):
+                filters = DashboardFilters(categoria=categoria, mercados=("RISARALDA",))
+                df_kpis = valoracion_data.load_kpis(filters)
+                self.assertGreater(df_kpis.loc[0, "TotalClientes"], 0)
+                self.assertFalse(valoracion_data.load_penetracion_servicios(filters).empty)
+                self.assertFalse(valoracion_data.load_numero_servicios(filters).empty)
+                self.assertFalse(valoracion_data.load_combinaciones_servicios(filters).empty)
+                self.assertFalse(valoracion_data.load_clientes_mayor_aporte(filters).empty)
+                self.assertFalse(valoracion_data.load_clasificacion_integral_temporal(filters).empty)
+                self.assertFalse(valoracion_data.load_service_classification(filters, "brilla").empty)
+                self.assertIn(len(valoracion_data.load_consolidado_general(filters)), range(1, 101))
+                self.assertFalse(
+                    valoracion_data.load_detalle_servicio(filters, servicio="rtr", tipo_detalle="variables").empty
+                )
+
+    def test_keyed_location_filters_match_plain_in_lists(self) -> None:
+        barrios = sorted(valoracion_data.load_filter_options()["barrio"].dropna().unique())[:300]
+        key_lookup = valoracion_data.load_ubicacion_keys()["barrio"]
+        compacted = compact_filter_values("barrio", barrios, key_lookup)
+        self.assertNotIsInstance(compacted, list)
+
+        plain = run_query(get_kpis_query("Residencial", barrios=barrios))
+        keyed = run_query(get_kpis_query("Residencial", barrios=compacted))
+        self.assertEqual(plain.to_dict("records"), keyed.to_dict("records"))
+
+        filters = DashboardFilters(categoria="Residencial", barrios=tuple(barrios))
+        self.assertEqual(
+            valoracion_data.load_kpis(filters).to_dict("records"),
+            plain.to_dict("records"),
+        )
+
+    def test_repeated_statements_are_classified_for_result_cache(self) -> None:
+        clear_query_log()
+        run_query(get_kpis_query("Residencial", barrios=["B", "A"]))
+        run_query(get_kpis_query("Residencial", barrios=["A", "B", "A"]))
+        first, second = get_recent_queries()[-2:]
+        self.assertEqual(first.result_cache, RESULT_CACHE_FIRST_SEEN)
+        self.assertNotEqual(second.result_cache, RESULT_CACHE_FIRST_SEEN)
+
+    def test_filter_options_match_market_mapping(self) -> None:
+        df_options = valoracion_data.load_filter_options()
+        self.assertEqual(set(df_options["departamento"]), {"CALDAS", "QUINDIO", "RISARALDA", "VALLE DEL CAUCA"})
+        self.assertTrue(df_options["mercado"].str.startswith("MERCADO RELEVANTE").all())
+
+    def test_customer_search_returns_profile_contracts_and_details(self) -> None:
+        tipo, identificacion = self.cliente
+        request = CustomerSearchRequest(tipo_identificacion=tipo, identificacion=identificacion, universo="Residencial")
+
+        result = search_customer(request)
+        self.assertIsNotNone(result.profile)
+        self.assertIn("RTR", result.servicios_activos)
+        self.assertFalse(result.contratos.empty)
+        self.assertIn("Barrio", result.contratos.columns)
+        self.assertFalse(result.detalle_servicios["RTR"]["variables"].empty)
+        self.assertEqual(len(load_customer_contracts(request)), load_customer_contracts_summary(request)[0])
+
+    def test_strategy_loaders_include_variable_columns(self) -> None:
+        df_consolidar = load_consolidar_result(
+            ConsolidarRequest(categoria="Residencial", servicios=("Consumo", "RTR"), top_n=50)
+        )
+        self.assertEqual(len(df_consolidar), 50)
+        self.assertIn("rtr_fechas_proximas_rtr", df_consolidar.columns)
+        self.assertIsInstance(df_consolidar.loc[0, "rtr_fechas_proximas_rtr"], str)
+
+        self.assertEqual(
+            len(load_recuperar_result(RecuperarRequest(categoria="Comercial", servicio="Brilla", top_n=20))),
+            20,
+        )
+        self.assertIn(
+            "consumo_ganancia_total",
+            load_fidelizar_result(
+                FidelizarRequest(
+                    categoria="Residencial",
+                    servicio_ancla="Consumo",
+                    servicio_objetivo="Seguros",
+                    top_n=10,
+                )
+            ).columns,
+        )
+        self.assertFalse(
+            load_potenciar_result(
+                PotenciarRequest(categoria="Comercial", servicios=("Efisoluciones",), top_n=10)
+            ).empty
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
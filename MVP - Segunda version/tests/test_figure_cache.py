@@ -0,0 +1,57 @@
+import unittest
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from services.figure_cache import FigureCache, cached_figure, frame_fingerprint, get_figure_cache
+from services.metrics import FIGURE_CACHE_REQUESTS
+
+
+def _servicios() -> pd.DataFrame:
+    return pd.DataFrame({"servicio": ["Gas", "Brilla", "Seguros"], "clientes": [120, 45, None]})
+
+
+class FigureCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        get_figure_cache().clear()
+
+    def test_fingerprint_tracks_values_and_dtypes(self) -> None:
+        df = _servicios()
+        self.assertEqual(frame_fingerprint(df), frame_fingerprint(_servicios()))
+
+        changed = _servicios()
+        changed.loc[0, "clientes"] = 121
+        self.assertNotEqual(frame_fingerprint(df), frame_fingerprint(changed))
+        self.assertNotEqual(frame_fingerprint(df), frame_fingerprint(df.astype({"servicio": "category"})))
+
+    def test_unchanged_result_reuses_figure(self) -> None:
+        builds: list[int] = []
+
+        def build(df: pd.DataFrame) -> go.Figure:
+            builds.append(len(df))
+            return go.Figure(go.Bar(x=df["clientes"], y=df["servicio"], orientation="h"))
+
+        hits_before = FIGURE_CACHE_REQUESTS.value("test_chart", "hit")
+        first = cached_figure("test_chart", _servicios(), build)
+        second = cached_figure("test_chart", _servicios(), build)
+        self.assertIs(first, second)
+        self.assertEqual(builds, [3])
+        self.assertEqual(FIGURE_CACHE_REQUESTS.value("test_chart", "hit"), hits_before + 1)
+
+        cached_figure("test_chart_otro", _servicios(), build)
+        self.assertEqual(builds, [3, 3])
+
+    def test_cache_is_bounded_and_expires(self) -> None:
+        cache = FigureCache(max_entries=2, ttl=60)
+        for index in range(3):
+            cache.put(("chart", str(index)), go.Figure())
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(("chart", "0")))
+
+        expired = FigureCache(max_entries=2, ttl=0)
+        expired.put(("chart", "a"), go.Figure())
+        self.assertIsNone(expired.get(("chart", "a")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from services.frame_dtypes import optimize_dtypes
+from services.loader_cache import cached_loader
+from services.metrics import LOADER_DTYPE_SAVED_BYTES
+
+
+def _result_frame(rows: int = 2000) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "TipoIdentificacion": ["Cédula de ciudadanía", "NIT"] * (rows // 2),
+            "Identificacion": [f"{index:010d}" for index in range(rows)],
+            "departamento": ["RISARALDA", "CALDAS", "QUINDIO", None] * (rows // 4),
+            "Contratos": [index % 7 for index in range(rows)],
+            "Score": [index / 4 for index in range(rows)],
+            "AporteTotal": [1_234_567_890.123 + index for index in range(rows)],
+            "Porcentaje": [round(index * 0.1, 1) for index in range(rows)],
+            "Mixta": [1, "a"] * (rows // 2),
+        }
+    )
+
+
+class FrameDtypesTestCase(unittest.TestCase):
+    def test_optimizes_strings_and_numbers(self) -> None:
+        df = _result_frame()
+        optimization = optimize_dtypes(df)
+        optimized = optimization.frame
+
+        self.assertIsInstance(optimized["TipoIdentificacion"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(optimized["departamento"].dtype, pd.CategoricalDtype)
+        self.assertEqual(optimized["Identificacion"].dtype, pd.StringDtype("pyarrow"))
+        self.assertEqual(optimized["Contratos"].dtype, np.int32)
+        self.assertEqual(optimized["Score"].dtype, np.float32)
+        self.assertEqual(optimized["AporteTotal"].dtype, np.float64)
+        self.assertEqual(optimized["Porcentaje"].dtype, np.float64)
+        self.assertEqual(optimized["Mixta"].dtype, object)
+        self.assertGreater(optimization.saved_bytes, 0)
+        self.assertEqual(df["Contratos"].dtype, np.int64)
+
+    def test_values_are_preserved(self) -> None:
+        df = _result_frame()
+        optimized = optimize_dtypes(df).frame
+        for column in df.columns:
+            self.assertEqual(
+                optimized[column].astype(object).where(optimized[column].notna(), None).tolist(),
+                df[column].astype(object).where(df[column].notna(), None).tolist(),
+                column,
+            )
+
+    def test_small_frames_are_left_alone(self) -> None:
+        df = _result_frame(8)
+        optimization = optimize_dtypes(df)
+        self.assertIs(optimization.frame, df)
+        self.assertEqual(optimization.saved_bytes, 0)
+
+    def test_cached_loader_reports_savings(self) -> None:
+        @cached_loader(ttl=60, show_spinner=False, shared=False)
+        def load_dtypes_example() -> pd.DataFrame:
+            return _result_frame()
+
+        load_dtypes_example.clear()
+        result = load_dtypes_example()
+        self.assertIsInstance(result["TipoIdentificacion"].dtype, pd.CategoricalDtype)
+        self.assertGreater(LOADER_DTYPE_SAVED_BYTES.value("load_dtypes_example"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from features.decisiones_estrategicas.models import ConsolidarRequest
+from features.decisiones_estrategicas.sections import _build_csv_export
+from services.lazy_export import EncodedExportCache, LazyCsvExport, get_export_cache
+from services.metrics import EXPORT_SIZE
+
+
+def _consolidado_download_app() -> None:
+    import pandas as pd
+    import streamlit as st
+
+    from features.valoracion_integral.sections import _render_lazy_download_button
+
+    queries = st.session_state.setdefault("queries", [])
+
+    def query_loader() -> pd.DataFrame:
+        queries.append(1)
+        return pd.DataFrame({"Identificacion": ["1", "2"]})
+
+    _render_lazy_download_button(
+        button_label="Preparar descarga",
+        download_label="Descargar",
+        cache_key="test_consolidado_full",
+        file_name="consolidado.csv",
+        query_loader=query_loader,
+        formatter=lambda df: df,
+    )
+
+
+class LazyExportTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        get_export_cache().clear()
+
+    def test_encodes_only_when_called_and_reuses_bytes(self) -> None:
+        calls: list[int] = []
+
+        def build() -> pd.DataFrame:
+            calls.append(1)
+            return pd.DataFrame({"Identificacion": ["1", "2"], "Score": [0.5, 0.75]})
+
+        export = LazyCsvExport("test_export", "test_export:a", build)
+        self.assertEqual(calls, [])
+        first = export()
+        second = export()
+
+        self.assertEqual(first, b"Identificacion,Score\n1,0.5\n2,0.75\n")
+        self.assertIs(first, second)
+        self.assertEqual(calls, [1])
+
+    def test_cache_respects_byte_budget_and_ttl(self) -> None:
+        cache = EncodedExportCache(max_bytes=10, ttl=60)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.get("a")
+        cache.put("c", b"123")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"12345")
+        self.assertEqual(cache.total_bytes, 8)
+        cache.put("grande", b"x" * 11)
+        self.assertIsNone(cache.get("grande"))
+
+        expired = EncodedExportCache(max_bytes=10, ttl=-1)
+        expired.put("a", b"1")
+        self.assertIsNone(expired.get("a"))
+        self.assertEqual(expired.total_bytes, 0)
+
+    def test_strategy_exports_are_keyed_on_the_request(self) -> None:
+        df = pd.DataFrame({"TipoIdentificacion": ["Cédula"], "Identificacion": ["1"]})
+        residencial = _build_csv_export("decisiones_consolidar", ConsolidarRequest(categoria="Residencial"), df)
+        comercial = _build_csv_export("decisiones_consolidar", ConsolidarRequest(categoria="Comercial"), df)
+        self.assertNotEqual(residencial.cache_key, comercial.cache_key)
+
+        before = EXPORT_SIZE.count("decisiones_consolidar")
+        self.assertEqual(residencial(), "TipoIdentificacion,Identificacion\nCedula,1\n".encode("utf-8"))
+        self.assertEqual(EXPORT_SIZE.count("decisiones_consolidar"), before + 1)
+
+    def test_prepared_download_is_not_encoded_on_reruns(self) -> None:
+        before = EXPORT_SIZE.count("consolidado")
+        app = AppTest.from_function(_consolidado_download_app).run()
+        self.assertEqual(app.session_state["queries"], [])
+
+        app.button(key="test_consolidado_full_prepare").click().run()
+        app.run()
+        self.assertEqual(len(app.exception), 0)
+        self.assertEqual(app.session_state["queries"], [1])
+        self.assertIsNone(get_export_cache().get("test_consolidado_full"))
+        self.assertEqual(EXPORT_SIZE.count("consolidado"), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
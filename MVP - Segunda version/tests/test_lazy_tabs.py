@@ -0,0 +1,73 @@
+import threading
+import unittest
+from unittest import mock
+
+from streamlit.testing.v1 import AppTest
+
+from core.lazy_tabs import LazyTab, prefetch_tabs, resolve_tab
+from core.prefetch import prefetch
+from services.metrics import PREFETCH_TASKS
+
+
+def _lazy_tabs_app() -> None:
+    import streamlit as st
+
+    from core.lazy_tabs import LazyTab, render_lazy_tabs_fragment
+
+    rendered = st.session_state.setdefault("rendered", [])
+    render_lazy_tabs_fragment(
+        [
+            LazyTab(
+                tab_id,
+                tab_id.title(),
+                lambda tab_id=tab_id: rendered.append(tab_id),
+                lambda: None,
+            )
+            for tab_id in ("consumo", "rtr", "brilla")
+        ],
+        key="dashboard_test_tabs",
+        prefetch_ids=("brilla",),
+    )
+
+
+class LazyTabsTestCase(unittest.TestCase):
+    def test_resolve_tab_falls_back_to_default_and_first(self) -> None:
+        tabs = [LazyTab("a", "A", lambda: None), LazyTab("b", "B", lambda: None)]
+        self.assertEqual(resolve_tab(tabs, "b").tab_id, "b")
+        self.assertEqual(resolve_tab(tabs, None, "b").tab_id, "b")
+        self.assertEqual(resolve_tab(tabs, "x").tab_id, "a")
+
+    def test_only_selected_tab_renders(self) -> None:
+        app = AppTest.from_function(_lazy_tabs_app).run()
+        self.assertEqual(app.session_state["rendered"], ["consumo"])
+
+        app.radio(key="dashboard_test_tabs").set_value("rtr").run()
+        self.assertEqual(app.session_state["rendered"], ["consumo", "rtr"])
+        self.assertEqual(len(app.exception), 0)
+
+    def test_prefetch_runs_in_background_and_deduplicates(self) -> None:
+        release = threading.Event()
+        calls: list[str] = []
+
+        def slow_loader() -> None:
+            release.wait(5)
+            calls.append("ok")
+
+        future = prefetch("test_view", "test_view:a", slow_loader)
+        self.assertIsNone(prefetch("test_view", "test_view:a", slow_loader))
+        release.set()
+        future.result(5)
+        self.assertEqual(calls, ["ok"])
+        self.assertGreaterEqual(PREFETCH_TASKS.value("test_view", "skipped"), 1)
+        self.assertGreaterEqual(PREFETCH_TASKS.value("test_view", "ok"), 1)
+
+    def test_prefetch_key_changes_with_token(self) -> None:
+        tabs = [LazyTab("a", "A", lambda: None, lambda: None)]
+        with mock.patch("core.lazy_tabs.prefetch") as submit:
+            prefetch_tabs(tabs, ["a"], "test_tabs_view", "filtros-1")
+            prefetch_tabs(tabs, ["a"], "test_tabs_view", "filtros-2")
+        keys = [call.args[1] for call in submit.call_args_list]
+        self.assertEqual(keys, ["test_tabs_view:a:filtros-1", "test_tabs_view:a:filtros-2"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from features.buscador_clientes.sections_clean import _metric_grid_html
+
+
+def _service_details_app() -> None:
+    import pandas as pd
+    import streamlit as st
+
+    from features.buscador_clientes.sections_clean import render_service_details_dashboard
+
+    columns = st.session_state.get("detail_columns", 8)
+    row = {"TipoIdentificacion": "CC", "Identificacion": "1"}
+    row.update({f"Variable{index}": index / columns for index in range(columns)})
+    render_service_details_dashboard(
+        {
+            "Consumo": {"variables": pd.DataFrame([row]), "indicadores": pd.DataFrame()},
+            "Brilla": {"dimensiones": pd.DataFrame([row])},
+        }
+    )
+
+
+class MetricGridTestCase(unittest.TestCase):
+    def test_values_are_formatted_in_one_block(self) -> None:
+        row = pd.DataFrame(
+            {
+                "Score": [0.25],
+                "Aporte": [1234.5],
+                "Segmento": ["Alto & estable"],
+                "Mora": [None],
+                "Contratos": [np.int64(3)],
+                "Ratio": ["0.5"],
+            }
+        ).iloc[0]
+        html_block = _metric_grid_html(row)
+
+        self.assertTrue(html_block.startswith('<div class="metric-grid">'))
+        self.assertEqual(html_block.count('class="metric-card"'), 6)
+        self.assertIn('<div class="metric-value">0.25</div>', html_block)
+        self.assertIn('<div class="metric-value">1234.50</div>', html_block)
+        self.assertIn("Alto &amp; estable", html_block)
+        self.assertIn('<div class="metric-value">No disponible</div>', html_block)
+        self.assertIn('<div class="metric-value">3</div>', html_block)
+        self.assertIn('style="width:25.0%"', html_block)
+        self.assertIn('style="width:50.0%"', html_block)
+        self.assertEqual(html_block.count('class="metric-track"'), 2)
+
+    def test_element_count_does_not_grow_with_columns(self) -> None:
+        counts = []
+        for columns in (8, 400):
+            app = AppTest.from_function(_service_details_app)
+            app.session_state["detail_columns"] = columns
+            app.run()
+            self.assertEqual(len(app.exception), 0)
+            counts.append(len(app.markdown) + len(app.columns))
+        self.assertEqual(counts[0], counts[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import urllib.request
+from unittest import mock
+
+from services.metrics import (
+    ACTIVE_SESSIONS,
+    Counter,
+    Gauge,
+    Histogram,
+    observe_query_record,
+    render_metrics,
+    start_metrics_server,
+)
+from services.query_log import QueryRecord
+
+
+class MetricsTestCase(unittest.TestCase):
+    def test_histogram_renders_cumulative_buckets(self) -> None:
+        histogram = Histogram("test_latency_seconds", "Latencia de prueba.", ("loader",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "load_kpis")
+        histogram.observe(0.5, "load_kpis")
+        histogram.observe(5.0, "load_kpis")
+
+        rendered = histogram.render()
+        self.assertIn("# TYPE cliente_integral_test_latency_seconds histogram", rendered)
+        self.assertIn('cliente_integral_test_latency_seconds_bucket{loader="load_kpis",le="0.1"} 1', rendered)
+        self.assertIn('cliente_integral_test_latency_seconds_bucket{loader="load_kpis",le="1.0"} 2', rendered)
+        self.assertIn('cliente_integral_test_latency_seconds_bucket{loader="load_kpis",le="+Inf"} 3', rendered)
+        self.assertIn('cliente_integral_test_latency_seconds_count{loader="load_kpis"} 3', rendered)
+
+    def test_counter_and_gauge_validate_labels(self) -> None:
+        counter = Counter("test_total", "Contador de prueba.", ("resultado",))
+        counter.inc("hit")
+        counter.inc("hit", amount=2)
+        self.assertEqual(counter.value("hit"), 3)
+        with self.assertRaises(ValueError):
+            counter.inc()
+
+        gauge = Gauge("test_gauge", "Gauge de prueba.", collector=lambda: {(): 7.0})
+        self.assertIn("cliente_integral_test_gauge 7.0", gauge.render())
+
+    def test_query_records_feed_latency_histogram(self) -> None:
+        observe_query_record(
+            QueryRecord(fingerprint="abc", loader="load_metrics_test", cache_hit=False, execute_ms=250.0, rows=4)
+        )
+        rendered = render_metrics()
+        self.assertIn('cliente_integral_query_duration_seconds_count{loader="load_metrics_test"} 1', rendered)
+        self.assertIn('cliente_integral_query_rows_total{loader="load_metrics_test"} 4.0', rendered)
+
+    def test_metrics_server_exposes_registry(self) -> None:
+        server = start_metrics_server(port=0)
+        self.assertIsNotNone(server)
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+        self.assertIn("cliente_integral_active_sessions", body)
+
+    def test_active_sessions_survive_runtime_internals_changing(self) -> None:
+        with mock.patch("services.metrics.Runtime") as runtime:
+            runtime.exists.return_value = True
+            del runtime.instance.return_value._session_mgr
+            rendered = ACTIVE_SESSIONS.render()
+
+        self.assertIn("# TYPE cliente_integral_active_sessions gauge", rendered)
+        self.assertEqual([line for line in rendered.splitlines() if not line.startswith("#")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
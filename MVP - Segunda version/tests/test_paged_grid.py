@@ -0,0 +1,174 @@
+import unittest
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from core.paged_grid import ArrowGridSource, GridQuery, get_grid_source
+from core.session_storage import FRAME_STORE_KEY, SessionFrameStore, clear_session_frames, get_frame_store
+from core.table_config import with_score_level
+
+
+def _resultado(rows: int = 250) -> pd.DataFrame:
+    return with_score_level(
+        pd.DataFrame(
+            {
+                "Identificacion": [f"{index:08d}" for index in range(rows)],
+                "Departamento": ["CALDAS", "RISARALDA", None, "QUINDÍO", "ANTIOQUIA"] * (rows // 5),
+                "Score_CON": [(index % 100) / 100 for index in range(rows)],
+            }
+        ),
+        "Score_CON",
+    )
+
+
+def _paged_grid_app() -> None:
+    import pandas as pd
+    import streamlit as st
+
+    from core.paged_grid import ArrowGridSource, render_paged_grid
+
+    builds = st.session_state.setdefault("builds", [])
+
+    def build() -> ArrowGridSource:
+        builds.append(1)
+        return ArrowGridSource(pd.DataFrame({"Identificacion": [str(index) for index in range(45)], "Score": range(45)}))
+
+    render_paged_grid("decisiones_test_grid", "request-1", build, default_sort="Score", page_size=20)
+
+
+def _contracts_app() -> None:
+    import pandas as pd
+    import streamlit as st
+
+    from features.buscador_clientes.sections_clean import render_contracts_details
+
+    rows = st.session_state.get("contract_rows", 10)
+    render_contracts_details(
+        pd.DataFrame(
+            {
+                "Contrato": [str(20000000 + index) for index in range(rows)],
+                "Estado": ["Activo", "Retirado"] * (rows // 2),
+                "Localidad": ["PEREIRA"] * rows,
+                "Mercado": [None] * rows,
+            }
+        ),
+        f"request-{rows}",
+    )
+
+
+def _numeric_contracts_app() -> None:
+    import pandas as pd
+
+    from features.buscador_clientes.sections_clean import render_contracts_details
+
+    render_contracts_details(
+        pd.DataFrame({"Contrato": [100, 9, 10], "Estado": ["Activo", None, 3], "Localidad": ["PEREIRA"] * 3}),
+        "request-numeric",
+    )
+
+
+def _element_count(app: AppTest) -> int:
+    return len(app.markdown) + len(app.dataframe) + len(app.expander) + len(app.caption)
+
+
+class PagedGridTestCase(unittest.TestCase):
+    def test_query_returns_only_the_requested_window(self) -> None:
+        source = ArrowGridSource(_resultado())
+        page = source.query(GridQuery(sort_by="Score_CON", page=2, page_size=40))
+        self.assertEqual(len(page.frame), 40)
+        self.assertEqual((page.total_rows, page.pages, page.start), (250, 7, 40))
+        self.assertEqual(page.frame["Score_CON"].iloc[0], 0.79)
+        self.assertIsInstance(page.frame["Nivel"].dtype, pd.CategoricalDtype)
+
+        last = source.query(GridQuery(sort_by="Score_CON", page=99, page_size=40))
+        self.assertEqual((last.page, len(last.frame)), (7, 10))
+
+    def test_search_and_sort_run_on_the_server(self) -> None:
+        source = ArrowGridSource(_resultado())
+        page = source.query(GridQuery(search="quindío", sort_by="Identificacion", descending=False, page_size=500))
+        self.assertEqual(page.total_rows, 50)
+        self.assertEqual(page.frame["Identificacion"].iloc[0], "00000003")
+        self.assertTrue((page.frame["Departamento"] == "QUINDÍO").all())
+
+        by_level = source.query(GridQuery(sort_by="Nivel", page_size=500)).frame
+        self.assertEqual(by_level["Nivel"].iloc[0], "🔴 Muy alto")
+        self.assertEqual(source.query(GridQuery(search="zzz")).total_rows, 0)
+
+    def test_source_is_rebuilt_only_when_token_changes(self) -> None:
+        session: dict[str, object] = {}
+        builds: list[int] = []
+
+        def build() -> ArrowGridSource:
+            builds.append(1)
+            return ArrowGridSource(_resultado(10))
+
+        first = get_grid_source("decisiones_con_grid", "a", build, session)
+        first.query(GridQuery(sort_by="Score_CON"))
+        again = get_grid_source("decisiones_con_grid", "a", build, session)
+        self.assertIs(again.table, first.table)
+        self.assertEqual(again.view_cache["key"], ("", "Score_CON", True))
+        get_grid_source("decisiones_con_grid", "b", build, session)
+        self.assertEqual(len(builds), 2)
+
+    def test_source_table_is_held_by_the_session_frame_store(self) -> None:
+        session: dict[str, object] = {}
+        session[FRAME_STORE_KEY] = SessionFrameStore(spill_threshold_bytes=0)
+        source = get_grid_source("decisiones_con_grid", "a", lambda: ArrowGridSource(_resultado()), session)
+        store = get_frame_store(session)
+
+        self.assertTrue(store.is_spilled("decisiones_con_grid_source"))
+        self.assertEqual(store.memory_bytes, 0)
+        self.assertNotIn(source, session.values())
+        again = get_grid_source("decisiones_con_grid", "a", lambda: self.fail("no debe reconstruirse"), session)
+        self.assertTrue(again.table.equals(source.table))
+
+        clear_session_frames(session)
+        builds: list[int] = []
+        get_grid_source("decisiones_con_grid", "a", lambda: builds.append(1) or ArrowGridSource(_resultado(10)), session)
+        self.assertEqual(builds, [1])
+
+    def test_paging_reruns_do_not_rebuild_source(self) -> None:
+        app = AppTest.from_function(_paged_grid_app).run()
+        self.assertEqual(len(app.dataframe[0].value), 20)
+        self.assertEqual(app.dataframe[0].value["Score"].iloc[0], 44)
+
+        app.number_input(key="decisiones_test_grid_page").set_value(3).run()
+        self.assertEqual(len(app.dataframe[0].value), 5)
+        self.assertEqual(len(app.session_state["builds"]), 1)
+        self.assertEqual(len(app.exception), 0)
+
+    def test_changing_search_or_sort_returns_to_first_page(self) -> None:
+        app = AppTest.from_function(_paged_grid_app).run()
+        app.number_input(key="decisiones_test_grid_page").set_value(2).run()
+        self.assertEqual(app.dataframe[0].value["Score"].iloc[0], 24)
+
+        app.selectbox(key="decisiones_test_grid_order").set_value("ascending").run()
+        self.assertEqual(app.number_input(key="decisiones_test_grid_page").value, 1)
+        self.assertEqual(app.dataframe[0].value["Score"].iloc[0], 0)
+
+        app.number_input(key="decisiones_test_grid_page").set_value(3).run()
+        app.text_input(key="decisiones_test_grid_search").input("1").run()
+        self.assertEqual(app.number_input(key="decisiones_test_grid_page").value, 1)
+        self.assertEqual(len(app.exception), 0)
+
+    def test_contracts_table_element_count_does_not_grow_with_contracts(self) -> None:
+        counts = []
+        for rows in (10, 600):
+            app = AppTest.from_function(_contracts_app)
+            app.session_state["contract_rows"] = rows
+            app.run()
+            self.assertEqual(len(app.exception), 0)
+            self.assertLessEqual(len(app.dataframe[0].value), 25)
+            self.assertEqual(list(app.dataframe[0].value.columns)[:2], ["Contrato", "Estado"])
+            counts.append(_element_count(app))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_numeric_contracts_sort_numerically(self) -> None:
+        app = AppTest.from_function(_numeric_contracts_app).run()
+        self.assertEqual(len(app.exception), 0)
+        self.assertEqual(app.dataframe[0].value["Contrato"].tolist()[:3], [9, 10, 100])
+        self.assertTrue(pd.api.types.is_integer_dtype(app.dataframe[0].value["Contrato"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core import profiling
+from core.profiling import ProfilingRun, _resolve_mode, profile_span, profiled, profiling_run
+from services.query_log import QueryRecord, record_query
+
+
+class ProfilingTestCase(unittest.TestCase):
+    def test_query_param_only_applies_when_env_enables_profiling(self) -> None:
+        self.assertIsNone(_resolve_mode(None, None))
+        self.assertIsNone(_resolve_mode("false", ""))
+        self.assertEqual(_resolve_mode("1", None), "timers")
+        self.assertEqual(_resolve_mode("true", "cProfile"), "cprofile")
+        self.assertEqual(_resolve_mode("pyinstrument", "basura"), "pyinstrument")
+        self.assertIsNone(_resolve_mode(None, "pyinstrument"))
+        self.assertIsNone(_resolve_mode("false", "cprofile"))
+
+    def test_profiled_is_transparent_without_active_run(self) -> None:
+        @profiled("format")
+        def render_value(value: int) -> int:
+            return value + 1
+
+        self.assertEqual(render_value(1), 2)
+
+    def test_spans_are_nested_and_include_queries(self) -> None:
+        @profiled("format")
+        def _format_table() -> str:
+            return "ok"
+
+        with profiling_run("timers") as run:
+            with profile_span("valoracion_integral", "page"):
+                with profile_span("load_kpis", "load"):
+                    with self.assertLogs("cliente_integral.queries", level="INFO"):
+                        record_query(
+                            QueryRecord(fingerprint="abc", loader="load_kpis", cache_hit=False, execute_ms=12.0)
+                        )
+                _format_table()
+
+        self.assertIsInstance(run, ProfilingRun)
+        spans = {span.name: span for span in run.spans}
+        self.assertEqual(spans["valoracion_integral"].depth, 0)
+        self.assertEqual(spans["load_kpis"].depth, 1)
+        self.assertEqual(spans["_format_table"].kind, "format")
+        self.assertEqual(spans["load_kpis · SQL abc"].kind, "query")
+        self.assertEqual(spans["load_kpis · SQL abc"].depth, 2)
+        self.assertLess(spans["valoracion_integral"].start_ms, spans["_format_table"].start_ms)
+        self.assertEqual(len(run.to_dataframe()), 4)
+
+    def test_cprofile_mode_writes_dump(self) -> None:
+        with tempfile.TemporaryDirectory() as dump_dir:
+            with mock.patch.object(profiling, "PROFILING_DUMP_DIR", Path(dump_dir)):
+                with profiling_run("cprofile") as run:
+                    sum(range(100))
+
+            self.assertIsNotNone(run.dump_path)
+            self.assertTrue(run.dump_path.exists())
+            self.assertEqual(run.dump_path.suffix, ".prof")
+
+    def test_dumps_get_unique_names_and_are_capped(self) -> None:
+        with tempfile.TemporaryDirectory() as dump_dir:
+            with mock.patch.object(profiling, "PROFILING_DUMP_DIR", Path(dump_dir)), mock.patch.object(
+                profiling, "PROFILING_MAX_DUMPS", 2
+            ):
+                paths = []
+                for _ in range(3):
+                    with profiling_run("cprofile") as run:
+                        sum(range(10))
+                    paths.append(run.dump_path)
+
+            self.assertEqual(len(set(paths)), 3)
+            self.assertFalse(paths[0].exists())
+
+    def test_busy_cprofile_falls_back_to_timers(self) -> None:
+        with tempfile.TemporaryDirectory() as dump_dir:
+            with mock.patch.object(profiling, "PROFILING_DUMP_DIR", Path(dump_dir)):
+                with profiling_run("cprofile") as outer:
+                    with self.assertLogs("cliente_integral.profiling", level="WARNING"):
+                        with profiling_run("cprofile") as inner:
+                            sum(range(10))
+                    self.assertEqual(inner.mode, "timers")
+                    self.assertIsNone(inner.dump_path)
+
+                with profiling_run("cprofile") as again:
+                    sum(range(10))
+
+            self.assertEqual(outer.mode, "cprofile")
+            self.assertEqual(again.mode, "cprofile")
+
+
+if __name__ == "__main__":
+    unittest.main()
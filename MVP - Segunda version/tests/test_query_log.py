@@ -0,0 +1,106 @@
+import unittest
+
+from services.loader_cache import cached_loader
+from services.query_log import (
+    RESULT_CACHE_FIRST_SEEN,
+    RESULT_CACHE_PROBABLE_HIT,
+    RESULT_CACHE_REPEAT_MISS,
+    QueryRecord,
+    classify_result_cache,
+    clear_query_log,
+    fingerprint_sql,
+    get_current_loader,
+    get_recent_queries,
+    loader_scope,
+    normalize_sql,
+    record_query,
+)
+
+
+class QueryLogTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_query_log()
+
+    def test_normalize_sql_replaces_literals_and_whitespace(self) -> None:
+        normalized = normalize_sql(
+            """
+            SELECT d0.Economica
+            FROM tabla d0
+            WHERE barrio IN ('Centro', 'O''Higgins')
+              AND score > 0.55
+            LIMIT 100
+            """
+        )
+        self.assertEqual(
+            normalized,
+            "SELECT d0.Economica FROM tabla d0 WHERE barrio IN (?...) AND score > ? LIMIT ?",
+        )
+
+    def test_fingerprint_ignores_literal_values(self) -> None:
+        self.assertEqual(
+            fingerprint_sql("SELECT * FROM t WHERE Identificacion = '123' LIMIT 10"),
+            fingerprint_sql("SELECT *  FROM t\nWHERE Identificacion = '999' LIMIT 500"),
+        )
+        self.assertNotEqual(
+            fingerprint_sql("SELECT * FROM t WHERE Identificacion = '123'"),
+            fingerprint_sql("SELECT * FROM otra WHERE Identificacion = '123'"),
+        )
+
+    def test_fingerprint_groups_parameter_lists_by_shape(self) -> None:
+        self.assertEqual(
+            fingerprint_sql("SELECT * FROM t WHERE barrio IN (:barrio_0) AND x::INT = :x"),
+            fingerprint_sql("SELECT * FROM t WHERE barrio IN (:barrio_0, :barrio_1) AND x::INT = :x"),
+        )
+
+    def test_classify_result_cache_uses_repeats_and_latency(self) -> None:
+        self.assertEqual(classify_result_cache("abc", 2000.0, now=100.0), RESULT_CACHE_FIRST_SEEN)
+        self.assertEqual(classify_result_cache("abc", 40.0, now=160.0), RESULT_CACHE_PROBABLE_HIT)
+        self.assertEqual(classify_result_cache("abc", 2000.0, now=220.0), RESULT_CACHE_REPEAT_MISS)
+        self.assertEqual(classify_result_cache("abc", 40.0, now=220.0 + 90000), RESULT_CACHE_FIRST_SEEN)
+
+    def test_current_loader_uses_scope_then_calling_frames(self) -> None:
+        def load_example() -> str:
+            return get_current_loader()
+
+        self.assertEqual(load_example(), "load_example")
+        with loader_scope("load_kpis"):
+            self.assertEqual(load_example(), "load_kpis")
+
+    def test_slow_queries_keep_full_sql_in_ring_buffer(self) -> None:
+        with self.assertLogs("cliente_integral.queries", level="INFO") as logs:
+            record_query(
+                QueryRecord(fingerprint="rapida", loader="load_kpis", cache_hit=False, execute_ms=5.0),
+                "SELECT 1",
+            )
+            record_query(
+                QueryRecord(fingerprint="lenta", loader="load_kpis", cache_hit=False, execute_ms=600000.0),
+                "SELECT 2",
+            )
+
+        fast_record, slow_record = get_recent_queries()
+        self.assertIsNone(fast_record.sql)
+        self.assertEqual(slow_record.sql, "SELECT 2")
+        self.assertIn('"event": "slow_query"', logs.output[-1])
+        self.assertIn("WARNING", logs.output[-1])
+
+    def test_cached_loader_records_cache_hits(self) -> None:
+        calls: list[int] = []
+
+        @cached_loader(ttl=60, show_spinner=False)
+        def load_numbers(value: int) -> int:
+            calls.append(value)
+            return value * 2
+
+        load_numbers.clear()
+        with self.assertLogs("cliente_integral.queries", level="DEBUG") as logs:
+            self.assertEqual(load_numbers(21), 42)
+            self.assertEqual(load_numbers(21), 42)
+
+        self.assertEqual(calls, [21])
+        self.assertTrue(all(line.startswith("DEBUG:") for line in logs.output))
+        hits = [record for record in get_recent_queries() if record.cache_hit]
+        self.assertEqual([record.loader for record in hits], ["load_numbers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
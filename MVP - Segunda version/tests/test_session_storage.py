@@ -0,0 +1,115 @@
+import gc
+import tempfile
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from core.session_storage import FRAME_STORE_KEY, SessionFrameStore, clear_session_frames, get_frame_store
+from services.cache_budget import estimate_size
+from services.metrics import SESSION_FRAME_BYTES
+
+
+def _frame(rows: int, prefix: str = "cliente") -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Identificacion": [f"{prefix}_{index:08d}" for index in range(rows)],
+            "Servicio": ["Brilla", "Gas"] * (rows // 2),
+            "Valor": [float(index) for index in range(rows)],
+        }
+    )
+
+
+class SessionFrameStoreTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.spill_dir.cleanup)
+
+    def _store(self, **kwargs) -> SessionFrameStore:
+        return SessionFrameStore(spill_dir=self.spill_dir.name, **kwargs)
+
+    def test_small_frames_stay_in_memory(self) -> None:
+        store = self._store(spill_threshold_bytes=10**9, memory_cap_bytes=10**9)
+        df = _frame(100)
+        store.put("consolidado", df)
+        self.assertIs(store.get("consolidado"), df)
+        self.assertFalse(store.is_spilled("consolidado"))
+        self.assertEqual(store.memory_bytes, estimate_size(df))
+        self.assertIsNone(store.get("otra"))
+
+    def test_large_frames_are_spilled_and_read_back(self) -> None:
+        store = self._store(spill_threshold_bytes=1000, memory_cap_bytes=10**9)
+        df = _frame(1000)
+        store.put("detalle", df)
+
+        self.assertTrue(store.is_spilled("detalle"))
+        self.assertEqual(store.memory_bytes, 0)
+        self.assertGreater(store.disk_bytes, 0)
+        pd.testing.assert_frame_equal(store.get("detalle"), df)
+
+    def test_arrow_tables_are_counted_and_spilled_as_tables(self) -> None:
+        table = pa.Table.from_pandas(_frame(1000), preserve_index=False)
+        store = self._store(spill_threshold_bytes=10**9, memory_cap_bytes=10**9)
+        store.put("grid", table)
+        self.assertIs(store.get("grid"), table)
+        self.assertEqual(store.memory_bytes, table.nbytes)
+
+        store = self._store(spill_threshold_bytes=1000, memory_cap_bytes=10**9)
+        store.put("grid", table)
+        self.assertTrue(store.is_spilled("grid"))
+        self.assertTrue(store.get("grid").equals(table))
+
+    def test_memory_cap_spills_least_recently_used(self) -> None:
+        size = estimate_size(_frame(200))
+        store = self._store(spill_threshold_bytes=10**9, memory_cap_bytes=size * 2 + 100)
+        store.put("a", _frame(200, "a"))
+        store.put("b", _frame(200, "b"))
+        store.get("a")
+        store.put("c", _frame(200, "c"))
+
+        self.assertTrue(store.is_spilled("b"))
+        self.assertFalse(store.is_spilled("a"))
+        self.assertLessEqual(store.memory_bytes, store.memory_cap_bytes)
+        pd.testing.assert_frame_equal(store.get("b"), _frame(200, "b"))
+
+    def test_disk_cap_drops_oldest_entries(self) -> None:
+        store = self._store(spill_threshold_bytes=0, memory_cap_bytes=0, disk_cap_bytes=1)
+        store.put("a", _frame(200))
+        self.assertNotIn("a", store)
+        self.assertEqual(store.disk_bytes, 0)
+        self.assertEqual(list(store.directory.iterdir()), [])
+
+    def test_replace_and_clear_release_bytes(self) -> None:
+        store = self._store(spill_threshold_bytes=estimate_size(_frame(100)))
+        store.put("detalle", _frame(1000))
+        store.put("detalle", _frame(10))
+        self.assertEqual(store.disk_bytes, 0)
+        self.assertEqual(list(store.directory.iterdir()), [])
+        store.clear()
+        self.assertEqual((store.memory_bytes, store.disk_bytes), (0, 0))
+
+    def test_collected_store_releases_spill_dir_and_gauge(self) -> None:
+        before = SESSION_FRAME_BYTES.value("disk")
+        store = self._store(spill_threshold_bytes=0)
+        store.put("detalle", _frame(100))
+        directory = store.directory
+        self.assertGreater(SESSION_FRAME_BYTES.value("disk"), before)
+
+        del store
+        gc.collect()
+        self.assertFalse(directory.exists())
+        self.assertEqual(SESSION_FRAME_BYTES.value("disk"), before)
+
+    def test_session_mapping_helpers(self) -> None:
+        session: dict[str, object] = {}
+        store = get_frame_store(session)
+        self.assertIs(session[FRAME_STORE_KEY], store)
+        self.assertIs(get_frame_store(session), store)
+        store.put("consolidado", _frame(10))
+        clear_session_frames(session)
+        self.assertNotIn("consolidado", store)
+        clear_session_frames({})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+
+import pandas as pd
+
+from services.loader_cache import cached_loader
+from services.metrics import SHARED_CACHE_REQUESTS
+from services.shared_cache import (
+    FilesystemCacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    build_cache_key,
+    create_backend,
+    decode_dataframe,
+    encode_dataframe,
+    set_shared_cache,
+)
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def _read_command(self) -> list[bytes] | None:
+        header = self.rfile.readline()
+        if not header:
+            return None
+        parts = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            parts.append(self.rfile.read(length + 2)[:-2])
+        return parts
+
+    def handle(self) -> None:
+        store = self.server.store
+        while (command := self._read_command()) is not None:
+            name = command[0].upper()
+            if name == b"GET":
+                value = store.get(command[1])
+                if value is None or value[1] <= time.time():
+                    self.wfile.write(b"$-1\r\n")
+                else:
+                    self.wfile.write(b"$%d\r\n%s\r\n" % (len(value[0]), value[0]))
+            elif name == b"SET":
+                store[command[1]] = (command[2], time.time() + int(command[4]))
+                self.wfile.write(b"+OK\r\n")
+            elif name == b"DEL":
+                self.wfile.write(b":%d\r\n" % int(store.pop(command[1], None) is not None))
+            else:
+                self.wfile.write(b"-ERR unknown command\r\n")
+
+
+class _RespServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.store: dict[bytes, tuple[bytes, float]] = {}
+
+
+def _sample_frame() -> pd.DataFrame:
+    return pd.DataFrame({"Servicio": ["Brilla", "Gas"], "Clientes": [10, 20], "Valor": [1.5, None]})
+
+
+class SharedCacheEncodingTestCase(unittest.TestCase):
+    def test_roundtrip_keeps_frame(self) -> None:
+        df = _sample_frame()
+        pd.testing.assert_frame_equal(decode_dataframe(encode_dataframe(df, 60, "1"), "1"), df)
+
+    def test_version_mismatch_and_expired_entries_are_ignored(self) -> None:
+        df = _sample_frame()
+        self.assertIsNone(decode_dataframe(encode_dataframe(df, 60, "1"), "2"))
+        self.assertIsNone(decode_dataframe(encode_dataframe(df, -1, "1"), "1"))
+
+    def test_cache_key_depends_on_arguments_and_version(self) -> None:
+        key = build_cache_key("load_kpis", "1", ("a",), {"b": 1, "c": 2})
+        self.assertEqual(key, build_cache_key("load_kpis", "1", ("a",), {"c": 2, "b": 1}))
+        self.assertNotEqual(key, build_cache_key("load_kpis", "2", ("a",), {"b": 1, "c": 2}))
+        self.assertNotEqual(key, build_cache_key("load_kpis", "1", ("b",), {"b": 1, "c": 2}))
+
+    def test_create_backend_from_url(self) -> None:
+        self.assertIsNone(create_backend(""))
+        self.assertIsInstance(create_backend("memory://"), MemoryCacheBackend)
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsInstance(create_backend(f"file://{directory}"), FilesystemCacheBackend)
+        backend = create_backend("redis://:secreto@cache:6380/2")
+        self.assertEqual((backend.host, backend.port, backend.db, backend.password), ("cache", 6380, 2, "secreto"))
+        with self.assertRaises(ValueError):
+            create_backend("s3://bucket")
+
+
+class SharedCacheBackendTestCase(unittest.TestCase):
+    def _assert_backend_roundtrip(self, backend) -> None:
+        payload = encode_dataframe(_sample_frame(), 60, "1")
+        self.assertIsNone(backend.get("clave"))
+        backend.set("clave", payload, 60)
+        self.assertEqual(backend.get("clave"), payload)
+        backend.delete("clave")
+        self.assertIsNone(backend.get("clave"))
+
+    def test_memory_backend(self) -> None:
+        self._assert_backend_roundtrip(MemoryCacheBackend())
+
+    def test_filesystem_backend_drops_expired_files(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            backend = FilesystemCacheBackend(directory)
+            self._assert_backend_roundtrip(backend)
+            backend.set("vencida", encode_dataframe(_sample_frame(), -1, "1"), 1)
+            self.assertIsNone(backend.get("vencida"))
+            self.assertEqual(list(backend.directory.iterdir()), [])
+
+    def test_redis_backend_speaks_resp(self) -> None:
+        server = _RespServer()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            self._assert_backend_roundtrip(RedisCacheBackend("127.0.0.1", server.server_address[1]))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class SharedCacheLoaderTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.backend = MemoryCacheBackend()
+        set_shared_cache(self.backend)
+
+    def tearDown(self) -> None:
+        set_shared_cache(None)
+
+    def test_loader_reads_from_shared_cache_after_local_clear(self) -> None:
+        calls: list[str] = []
+
+        @cached_loader(ttl=60, show_spinner=False)
+        def load_shared_example(categoria: str) -> pd.DataFrame:
+            calls.append(categoria)
+            return _sample_frame()
+
+        load_shared_example.clear()
+        first = load_shared_example("Residencial")
+        load_shared_example.clear()
+        second = load_shared_example("Residencial")
+
+        self.assertEqual(calls, ["Residencial"])
+        pd.testing.assert_frame_equal(first, second)
+        self.assertGreaterEqual(SHARED_CACHE_REQUESTS.value("load_shared_example", "hit"), 1)
+
+    def test_backend_errors_fall_back_to_loader(self) -> None:
+        class BrokenBackend:
+            def get(self, key: str) -> bytes | None:
+                raise ConnectionError("sin conexión")
+
+            def set(self, key: str, value: bytes, ttl: int) -> None:
+                raise ConnectionError("sin conexión")
+
+            def delete(self, key: str) -> None:
+                raise ConnectionError("sin conexión")
+
+        set_shared_cache(BrokenBackend())
+
+        @cached_loader(ttl=60, show_spinner=False)
+        def load_broken_example() -> pd.DataFrame:
+            return _sample_frame()
+
+        load_broken_example.clear()
+        pd.testing.assert_frame_equal(load_broken_example(), _sample_frame())
+        self.assertGreaterEqual(SHARED_CACHE_REQUESTS.value("load_broken_example", "error"), 2)
+
+    def test_non_shared_loader_skips_backend(self) -> None:
+        @cached_loader(ttl=60, show_spinner=False, shared=False)
+        def load_private_example() -> pd.DataFrame:
+            return _sample_frame()
+
+        load_private_example.clear()
+        load_private_example()
+        self.assertEqual(self.backend._entries, {})
+
+    def test_customer_level_loaders_stay_out_of_shared_cache(self) -> None:
+        from features.buscador_clientes import data as buscador_data
+        from features.decisiones_estrategicas import data as decisiones_data
+        from features.valoracion_integral import data as valoracion_data
+
+        loaders = [
+            decisiones_data.load_consolidar_result,
+            decisiones_data.load_recuperar_result,
+            decisiones_data.load_fidelizar_result,
+            decisiones_data.load_potenciar_result,
+            valoracion_data.load_clientes_mayor_aporte,
+            valoracion_data.load_consolidado_general,
+            valoracion_data.load_detalle_servicio,
+            buscador_data.load_cliente_raw,
+        ]
+        self.assertEqual([loader.__name__ for loader in loaders if loader.shared], [])
+        self.assertTrue(valoracion_data.load_kpis.shared)
+
+    def test_non_dataframe_loaders_skip_the_shared_backend(self) -> None:
+        from features.buscador_clientes import data as buscador_data
+        from features.decisiones_estrategicas import data as decisiones_data
+        from features.valoracion_integral import data as valoracion_data
+
+        loaders = [
+            buscador_data.load_tipo_identificacion_options,
+            decisiones_data.load_service_options,
+            decisiones_data.load_table_columns,
+            valoracion_data.load_ubicacion_keys,
+        ]
+        self.assertEqual([loader.__name__ for loader in loaders if loader.shared], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from repositories.sql_query import (
+    SqlQuery,
+    build_param_list,
+    canonicalize_sql,
+    merge_params,
+    normalize_query,
+    param_name,
+    statement_key,
+)
+
+
+class SqlQueryTestCase(unittest.TestCase):
+    def test_param_name_normalizes_column_names(self) -> None:
+        self.assertEqual(param_name("MercadoRelevante", 2), "mercadorelevante_2")
+        self.assertEqual(param_name("c.Contrato"), "c_contrato")
+
+    def test_build_param_list_numbers_placeholders(self) -> None:
+        placeholders = build_param_list("barrio", ["Centro", "Cuba"])
+        self.assertEqual(placeholders.sql, ":barrio_0, :barrio_1")
+        self.assertEqual(placeholders.params, {"barrio_0": "Centro", "barrio_1": "Cuba"})
+
+    def test_merge_params_rejects_conflicting_values(self) -> None:
+        first = SqlQuery("", {"barrio_0": "Centro"})
+        self.assertEqual(merge_params(first, SqlQuery("", {"barrio_0": "Centro"})), {"barrio_0": "Centro"})
+        with self.assertRaises(ValueError):
+            merge_params(first, SqlQuery("", {"barrio_0": "Cuba"}))
+
+    def test_canonicalize_sql_collapses_whitespace_outside_literals(self) -> None:
+        self.assertEqual(
+            canonicalize_sql("\n  SELECT  `a  b`,\n\tx\n FROM t WHERE y = '  dos  '\n"),
+            "SELECT `a  b`, x FROM t WHERE y = '  dos  '",
+        )
+
+    def test_canonicalize_sql_drops_comments_before_joining_lines(self) -> None:
+        self.assertEqual(
+            canonicalize_sql("SELECT a -- columna principal\nFROM t /* tabla\n de prueba */ WHERE b = 1"),
+            "SELECT a FROM t WHERE b = 1",
+        )
+        self.assertEqual(
+            canonicalize_sql("SELECT '-- no es comentario', '/* tampoco */'\nFROM t"),
+            "SELECT '-- no es comentario', '/* tampoco */' FROM t",
+        )
+
+    def test_canonicalize_sql_keeps_double_quoted_identifiers(self) -> None:
+        self.assertEqual(
+            canonicalize_sql('SELECT  "Tipo  Identificacion", "a -- b"\n FROM "t ""x"""'),
+            'SELECT "Tipo  Identificacion", "a -- b" FROM "t ""x"""',
+        )
+
+    def test_normalized_queries_share_statement_key(self) -> None:
+        first = normalize_query(SqlQuery("SELECT *\n  FROM t WHERE a = :a AND b = :b", {"b": 2, "a": 1}))
+        second = normalize_query(SqlQuery("SELECT * FROM t   WHERE a = :a AND b = :b", {"a": 1, "b": 2}))
+        self.assertEqual(first, second)
+        self.assertEqual(statement_key(first), statement_key(second))
+        self.assertNotEqual(statement_key(first), statement_key(SqlQuery(first.sql, {"a": 1, "b": 3})))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,13 +16,21 @@ class StrategicDecisionsQueriesTestCase(unittest.TestCase):
         self.assertIn("modelo_contratoscomercial", get_contract_table("Comercial"))
 
     def test_get_table_columns_query_uses_information_schema(self) -> None:
-        query = get_table_columns_query(
+        query, params = get_table_columns_query(
             "analiticaefg.clienteintegral.consumo_residencial_consolidado_variables"
         )
         self.assertIn("system.information_schema.columns", query)
-        self.assertIn("table_catalog = 'analiticaefg'", query)
-        self.assertIn("table_schema = 'clienteintegral'", query)
-        self.assertIn("table_name = 'consumo_residencial_consolidado_variables'", query)
+        self.assertIn("table_catalog = :table_catalog", query)
+        self.assertIn("table_schema = :table_schema", query)
+        self.assertIn("table_name = :table_name", query)
+        self.assertEqual(
+            params,
+            {
+                "table_catalog": "analiticaefg",
+                "table_schema": "clienteintegral",
+                "table_name": "consumo_residencial_consolidado_variables",
+            },
+        )
 
     def test_get_consolidar_query_uses_composite_keys_instead_of_idcliente(self) -> None:
         query = get_consolidar_query(
@@ -33,7 +41,7 @@ class StrategicDecisionsQueriesTestCase(unittest.TestCase):
                 "Consumo": ["ganancia_total"],
                 "Brilla": ["edad_cliente"],
             },
-        )
+        ).sql
         self.assertNotIn("IdCliente", query)
         self.assertIn("d0.TipoIdentificacion = d1.TipoIdentificacion", query)
         self.assertIn("d0.Identificacion = d1.Identificacion", query)
@@ -48,13 +56,21 @@ class StrategicDecisionsQueriesTestCase(unittest.TestCase):
         self.assertIn("least(score_consumo, score_brilla)", query)
         self.assertIn("LIMIT 50", query)
 
+    def test_multi_service_queries_ignore_selection_order(self) -> None:
+        for builder in (get_consolidar_query, get_potenciar_query):
+            with self.subTest(builder=builder.__name__):
+                self.assertEqual(
+                    builder(categoria="Residencial", servicios=["Brilla", "Consumo"], top_n=10),
+                    builder(categoria="Residencial", servicios=["Consumo", "Brilla", "Consumo"], top_n=10),
+                )
+
     def test_get_recuperar_query_uses_composite_keys_and_service_tables(self) -> None:
         query = get_recuperar_query(
             categoria="Comercial",
             servicio="Brilla",
             top_n=25,
             variable_columns=["ganancia_total", "antiguedad"],
-        )
+        ).sql
         self.assertNotIn("IdCliente", query)
         self.assertIn("brilla_comercial_consolidado_dimensiones", query)
         self.assertIn("brilla_comercial_consolidado_variables", query)
@@ -73,7 +89,7 @@ class StrategicDecisionsQueriesTestCase(unittest.TestCase):
             top_n=40,
             variable_columns_ancla=["ganancia_total"],
             variable_columns_objetivo=["edad_cliente"],
-        )
+        ).sql
         self.assertNotIn("IdCliente", query)
         self.assertIn("consumo_residencial_consolidado_dimensiones", query)
         self.assertIn("brilla_residencial_consolidado_dimensiones", query)
@@ -95,7 +111,7 @@ class StrategicDecisionsQueriesTestCase(unittest.TestCase):
                 "Consumo": ["ganancia_total"],
                 "Brilla": ["edad_cliente"],
             },
-        )
+        ).sql
         self.assertNotIn("IdCliente", query)
         self.assertIn("consumo_comercial_consolidado_dimensiones", query)
         self.assertIn("brilla_comercial_consolidado_dimensiones", query)
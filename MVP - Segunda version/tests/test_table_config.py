@@ -0,0 +1,60 @@
+import unittest
+
+import pandas as pd
+
+from core.table_config import SCORE_LEVEL_LABELS, build_column_config, is_zero_to_one, score_levels, with_score_level
+from features.decisiones_estrategicas.sections import _build_result_grid
+
+
+class TableConfigTestCase(unittest.TestCase):
+    def test_score_levels_bin_between_min_and_max(self) -> None:
+        levels = score_levels(pd.Series([0.1, 0.5, 0.9, None, "0.3"]))
+        self.assertEqual(levels[0], SCORE_LEVEL_LABELS[0])
+        self.assertEqual(levels[2], SCORE_LEVEL_LABELS[-1])
+        self.assertTrue(pd.isna(levels[3]))
+        self.assertEqual(levels[4], SCORE_LEVEL_LABELS[1])
+        self.assertEqual(list(score_levels(pd.Series([0.4, 0.4]))), [SCORE_LEVEL_LABELS[0]] * 2)
+
+    def test_with_score_level_keeps_source_untouched(self) -> None:
+        df = pd.DataFrame({"Identificacion": ["1", "2"], "Score_CON": [0.2, 0.8], "Contratos": [1, 3]})
+        display = with_score_level(df, "Score_CON")
+        self.assertEqual(list(display.columns), ["Identificacion", "Score_CON", "Nivel", "Contratos"])
+        self.assertEqual(list(df.columns), ["Identificacion", "Score_CON", "Contratos"])
+
+    def test_column_config_by_column_kind(self) -> None:
+        df = pd.DataFrame(
+            {
+                "Identificacion": [10, 20],
+                "Consumo": [True, False],
+                "Score": [0.25, 0.75],
+                "Aporte": [1500.0, 20.5],
+                "Departamento": ["CALDAS", "RISARALDA"],
+            }
+        )
+        config = build_column_config(
+            df,
+            checkbox_columns=["Consumo"],
+            progress_columns=["Score"],
+            text_columns=["Identificacion"],
+        )
+        self.assertEqual(config["Identificacion"]["type_config"]["type"], "text")
+        self.assertEqual(config["Consumo"]["type_config"]["type"], "checkbox")
+        self.assertEqual(config["Score"]["type_config"]["type"], "progress")
+        self.assertEqual(config["Aporte"]["type_config"]["type"], "number")
+        self.assertNotIn("Departamento", config)
+        self.assertTrue(is_zero_to_one(df["Score"]))
+        self.assertFalse(is_zero_to_one(df["Aporte"]))
+
+    def test_result_grid_tolerates_missing_score_column(self) -> None:
+        df = pd.DataFrame({"Identificacion": ["1", "2"], "Departamento": ["CALDAS", None]})
+        source = _build_result_grid(df, "Score_CON")
+        self.assertEqual(source.columns, ["Identificacion", "Departamento"])
+        self.assertEqual(list(df.columns), ["Identificacion", "Departamento"])
+
+        scored = _build_result_grid(pd.DataFrame({"Identificacion": ["1"], "Score_CON": ["0.4"]}), "Score_CON")
+        self.assertEqual(scored.columns, ["Identificacion", "Score_CON", "Nivel"])
+        self.assertIn("Score_CON", scored.column_config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import pandas as pd
+
+from benchmarks.exports import ExportMeasurement, check_thresholds, run_export_benchmarks
+from services.text_cleanup import strip_accents, strip_accents_columns, strip_accents_series
+
+
+class TextCleanupTestCase(unittest.TestCase):
+    def test_strip_accents_series_keeps_non_text_values(self) -> None:
+        series = pd.Series(["Cédula de ciudadanía", None, "NIT", 12, "Cédula de ciudadanía"], name="TipoIdentificacion")
+        cleaned = strip_accents_series(series)
+        self.assertEqual(cleaned.tolist()[:3], ["Cedula de ciudadania", None, "NIT"])
+        self.assertEqual(cleaned.tolist()[3:], [12, "Cedula de ciudadania"])
+        self.assertEqual(cleaned.name, "TipoIdentificacion")
+        self.assertEqual(strip_accents("QUINDÍO"), "QUINDIO")
+
+    def test_categorical_and_arrow_strings_keep_their_dtype(self) -> None:
+        categorical = strip_accents_series(pd.Series(["Cédula", "NIT", "Cédula"], dtype="category"))
+        self.assertIsInstance(categorical.dtype, pd.CategoricalDtype)
+        self.assertEqual(categorical.tolist(), ["Cedula", "NIT", "Cedula"])
+
+        colliding = strip_accents_series(pd.Series(["Cédula", "Cedula"], dtype="category"))
+        self.assertEqual(colliding.tolist(), ["Cedula", "Cedula"])
+
+        arrow = strip_accents_series(pd.Series(["Pasaporte", "Cédula", None], dtype=pd.StringDtype("pyarrow")))
+        self.assertEqual(arrow.dtype, pd.StringDtype("pyarrow"))
+        self.assertEqual(arrow.tolist()[:2], ["Pasaporte", "Cedula"])
+
+    def test_strip_accents_columns_does_not_touch_the_source(self) -> None:
+        df = pd.DataFrame({"TipoIdentificacion": ["Cédula"], "Departamento": ["QUINDÍO"]})
+        cleaned = strip_accents_columns(df, ["TipoIdentificacion", "NoExiste"])
+        self.assertEqual(cleaned.iloc[0].tolist(), ["Cedula", "QUINDÍO"])
+        self.assertEqual(df.iloc[0, 0], "Cédula")
+
+    def test_export_benchmark_matches_row_by_row_cleanup(self) -> None:
+        measurements = run_export_benchmarks(rows=2000, repeat=1)
+        self.assertEqual(len(measurements), 6)
+        self.assertEqual(check_thresholds(measurements), [])
+
+    def test_thresholds_flag_mismatches_and_slow_paths(self) -> None:
+        violations = check_thresholds(
+            [
+                ExportMeasurement("decisiones", "object", 1_000_000, 2000.0, 900.0, True),
+                ExportMeasurement("detalle", "optimizado", 1_000_000, 4.0, 2.0, False),
+            ]
+        )
+        self.assertEqual(len(violations), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+import streamlit as st
+
+from core.warmup import WarmupStatus, WarmupTask, build_warmup_tasks, run_warmup
+from services.metrics import CACHE_WARMUP_PROGRESS, CACHE_WARMUP_TASKS
+
+HAS_DUCKDB = importlib.util.find_spec("duckdb") is not None
+
+
+def _fail() -> None:
+    raise RuntimeError("warehouse no disponible")
+
+
+class WarmupTestCase(unittest.TestCase):
+    def test_run_warmup_reports_progress_and_failures(self) -> None:
+        calls: list[str] = []
+        status = run_warmup(
+            [
+                WarmupTask("tarea_ok", lambda: calls.append("ok")),
+                WarmupTask("tarea_error", _fail),
+            ],
+            workers=2,
+        )
+        self.assertEqual(calls, ["ok"])
+        self.assertEqual((status.total, status.done, status.failed), (2, 1, 1))
+        self.assertTrue(status.finished)
+        self.assertEqual(status.progress, 1.0)
+        self.assertEqual(CACHE_WARMUP_PROGRESS.value(), 1.0)
+        self.assertGreaterEqual(CACHE_WARMUP_TASKS.value("tarea_error", "error"), 1)
+
+    def test_empty_status_has_no_progress(self) -> None:
+        self.assertEqual(WarmupStatus().progress, 0.0)
+
+    def test_tasks_cover_startup_loaders(self) -> None:
+        names = {task.name for task in build_warmup_tasks()}
+        self.assertTrue(
+            {
+                "load_filter_options",
+                "load_tipo_identificacion_options",
+                "load_kpis",
+                "load_consolidado_general",
+                "load_service_options[Residencial]",
+                "load_table_columns[analiticaefg.clienteintegral.brilla_comercial_consolidado_variables]",
+            }
+            <= names
+        )
+
+    @unittest.skipUnless(HAS_DUCKDB, "duckdb no está instalado")
+    def test_warmup_fills_loader_caches(self) -> None:
+        from features.valoracion_integral.data import load_kpis
+        from features.valoracion_integral.models import DashboardFilters
+        from services.fake_warehouse import create_fake_warehouse, reset_fake_warehouse
+        from services.query_log import clear_query_log, get_recent_queries
+
+        with mock.patch.dict(os.environ, {"WAREHOUSE_BACKEND": "fake"}):
+            reset_fake_warehouse(create_fake_warehouse(clients=2000, directory=""))
+            st.cache_data.clear()
+            try:
+                status = run_warmup(workers=4)
+                self.assertEqual(status.failed, 0)
+
+                clear_query_log()
+                load_kpis(DashboardFilters())
+                self.assertTrue(all(record.cache_hit for record in get_recent_queries()))
+            finally:
+                reset_fake_warehouse()
+                st.cache_data.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()